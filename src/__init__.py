@@ -8,20 +8,38 @@ Root of the project.
 •	USE_ENV:bool: Переменная, которая определяет, откуда читать секреты: API-ключи и т.д. 
 •	Если USE_ENV равно True, модуль gs будет импортирован из gs.py, а секреты будут читаться из файлов .env.
 •	Если USE_ENV равно False, модуль gs будет импортирован из credentials.py. и секреты будут читаться из объекта gs. (например, `token = gs.path.telegram.kazarinov_bot`)
+•	`gs` и подпакеты загружаются при первом обращении (`from src import gs`, `src.utils`), а не при `import src`.
+	Время импорта проверяется скриптом `toolbox/import_time.py`.
 
 ```rst
 .. module:: src
 ```
 """
 
-from .check_release import check_latest_release
+import importlib
+from typing import Any
 
 USE_ENV:bool = False
 
-if USE_ENV:
-	from .gs import gs
-else:
-	from .credentials import gs
+# Подпакеты, которые загружаются при первом обращении `src.<name>`
+_SUBMODULES: tuple = ('endpoints', 'fast_api', 'goog', 'gui', 'llm', 'logger', 'suppliers', 'utils', 'webdriver')
 
-if check_latest_release(gs.git, gs.git_user):
-            ...  # Логика что делать когда есть новая версия hypo69 на github 
\ No newline at end of file
+
+def __getattr__(name: str) -> Any:
+	"""Загружает `gs` и подпакеты при первом обращении."""
+	if name == 'gs':
+		if USE_ENV:
+			from .gs import gs as settings
+		else:
+			from .credentials import gs as settings
+		globals()['gs'] = settings
+
+		from .check_release import check_latest_release
+		if check_latest_release(settings.git, settings.git_user):
+			...  # Логика что делать когда есть новая версия hypo69 на github
+		return settings
+
+	if name in _SUBMODULES:
+		return importlib.import_module(f'{__name__}.{name}')
+
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -8,6 +8,10 @@
 Модуль credentials предназначен для хранения глобальных настроек проекта, таких как пути, пароли, логины и параметры API. 
 Он использует паттерн Singleton для обеспечения единственного экземпляра настроек в течение всего времени работы приложения.
 
+Учетные данные загружаются лениво (`LazyCredentials`): база KeePass открывается при первом обращении
+к группе (`gs.credentials.aliexpress`, ...), и разбираются только группы, к которым обращались.
+Прежнее поведение (загрузка всех групп при старте) включается в `config.json`: `"lazy_credentials": false`.
+
 
 Документация: 
  - kepass: `https://github.com/hypo69/hypotez/blob/master/src/keepass.md`
@@ -16,6 +20,7 @@
 .. module:: src.header 
 ```
 """
+from __future__ import annotations
 
 import datetime
 from datetime import datetime
@@ -25,12 +30,14 @@ import sys
 import json
 import warnings
 import socket
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Callable, TYPE_CHECKING
 
-from pykeepass import PyKeePass
+if TYPE_CHECKING:
+    from pykeepass import PyKeePass  # <- импортируется в `_open_kp`, только когда нужны учетные данные
 
 import header
 from header import __root__
@@ -61,6 +68,51 @@ def singleton(cls):
 
     return get_instance
 
+class LazyCredentials:
+    """
+    Учетные данные, которые загружаются из KeePass при первом обращении к группе.
+
+    Группа (`aliexpress`, `openai`, ...) получает значения по умолчанию и заполняется своим загрузчиком
+    при первом чтении атрибута. База открывается один раз - при загрузке первой группы.
+    Загруженные группы хранятся как обычные атрибуты, повторные обращения не проходят через `__getattr__`.
+    """
+
+    __slots__ = ('_defaults', '_loaders', '_open_kp', '_kp', '_lock', '__dict__')
+
+    def __init__(self, defaults: SimpleNamespace, loaders: Dict[str, Callable[[PyKeePass], bool]], open_kp: Callable[[], PyKeePass]):
+        self._defaults: dict = dict(vars(defaults))
+        self._loaders = loaders
+        self._open_kp = open_kp
+        self._kp: Optional[PyKeePass] = None
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name: str):
+        if name.startswith('_') or name not in self._defaults:
+            raise AttributeError(name)
+        with self._lock:
+            if name in self.__dict__:
+                return self.__dict__[name]
+            setattr(self, name, self._defaults[name])  # <- загрузчик заполняет эту группу
+            loader: Optional[Callable] = self._loaders.get(name)
+            if loader:
+                if self._kp is None:
+                    self._kp = self._open_kp()
+                try:
+                    if not loader(self._kp):
+                        print(f'Failed to load {name} credentials')
+                except Exception as ex:
+                    print(f'Failed to load {name} credentials: {ex}')
+            return self.__dict__[name]
+
+    def __repr__(self) -> str:
+        return f'LazyCredentials(loaded={list(self.__dict__)})'
+
+    def load(self, *names: str) -> None:
+        """Загружает указанные группы (по умолчанию - все группы с загрузчиком)."""
+        for name in names or self._loaders:
+            getattr(self, name)
+
+
 @singleton
 @dataclass
 class ProgramSettings:
@@ -160,7 +212,7 @@ class ProgramSettings:
 
     def __post_init__(self):
         """Выполняет инициализацию после создания экземпляра класса."""
-        self.config = j_loads_ns(__root__ / 'src' / 'config.json')
+        self.config = j_loads_ns(__root__ / 'src' / 'config.json', use_cache=True) # <- частная копия: настройки дополняются ниже
         if not self.config:
             logger.error('Ошибка при загрузке настроек')
             ...
@@ -224,46 +276,35 @@ class ProgramSettings:
             return False
 
     def _load_credentials(self) -> None:
-        """ Загружает учетные данные из настроек."""
-
-        kp = self._open_kp(3)
-        if not kp:
-            print("Error :( ")
-            ...
-            sys.exit(1)
-
-        if not self._load_aliexpress_credentials(kp):
-            print('Failed to load Aliexpress credentials')
-
-        if not self._load_openai_credentials(kp):
-            print('Failed to load OpenAI credentials')
-
-        if not self._load_gemini_credentials(kp):
-            print('Failed to load GoogleAI credentials')
-
-        if not self._load_google_custom_search_credentials(kp):
-            print('Failed to load GoogleAI credentials')
-
-        if not self._load_discord_credentials(kp):
-            print('Failed to load Discord credentials')
-
-        if not self._load_telegram_credentials(kp):
-            print('Failed to load Telegram credentials')
-
-        if not self._load_prestashop_credentials(kp):
-            print('Failed to load prestashop credentials')
-
-        if not self._load_smtp_credentials(kp):
-            print('Failed to load SMTP credentials')
-
-        # if not self._load_facebook_credentials(kp):
-        #     print('Failed to load Facebook credentials')
-
-        if not self._load_gapi_credentials(kp):
-            print('Failed to load GAPI credentials')
-
-        if not self._load_serpapi_credentials(kp):
-            print('Failed to load https://serpapi.com credentials')
+        """ Подключает учетные данные из KeePass: лениво (`LazyCredentials`) или, если `lazy_credentials` выключен в `config.json`, сразу все группы."""
+
+        def _open_kp() -> PyKeePass:
+            kp = self._open_kp(3)
+            if not kp:
+                print("Error :( ")
+                ...
+                sys.exit(1)
+            return kp
+
+        self.credentials = LazyCredentials(
+            self.credentials,
+            loaders = {
+                'aliexpress': self._load_aliexpress_credentials,
+                'openai': self._load_openai_credentials,
+                'gemini': self._load_gemini_credentials,
+                'google_custom_search': self._load_google_custom_search_credentials,
+                'discord': self._load_discord_credentials,
+                'telegram': self._load_telegram_credentials,
+                'prestashop': self._load_prestashop_credentials,
+                'smtp': self._load_smtp_credentials,
+                # 'facebook': self._load_facebook_credentials,
+                'gapi': self._load_gapi_credentials,
+                'serpapi': self._load_serpapi_credentials,
+            },
+            open_kp = _open_kp,
+        )
+        if not getattr(self.config, 'lazy_credentials', True):
+            self.credentials.load()
 
     def _load_discord_credentials(self, kp: PyKeePass) -> bool:
         """ Load Discord credentials from KeePass
@@ -501,6 +542,8 @@ class ProgramSettings:
         Args:
             retry (int): Number of retries
         """
+        from pykeepass import PyKeePass
+
         password:str = ''
         password_file = Path( self.path.secrets / 'password.txt')
         try:
@@ -8,10 +8,24 @@
     :platform: Windows, Unix
     :synopsis: module handles the promotion of messages and events in Facebook groups.
 It processes campaigns and events, posting them to Facebook groups while avoiding duplicate promotions.
+
+Groups are scheduled by `process_groups_async`: every group waits in a min-heap keyed by the time
+it becomes eligible again (`last_promo_sended + group_cooldown`), and every browser session (account)
+takes the next eligible group as soon as its own pause after the previous post (`post_delay`) is over.
+Several accounts therefore post in parallel, and a run is bounded by per-group cooldowns
+instead of the sum of all pauses. Group files are written in batches (`save_every`).
+
+Per-group cooldowns are opt-in: by default `group_cooldown` is zero, so every group is eligible
+at once (as before) and the heap only orders groups by their last promotion, oldest first.
 """
 
 
+import asyncio
+import heapq
+import itertools
 import random
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from urllib.parse import urlencode
@@ -64,29 +78,54 @@ class FacebookPromoter:
     
     This class automates the posting of promotions to Facebook groups using a WebDriver instance,
     ensuring that categories and events are promoted while avoiding duplicates.
+
+    Attributes:
+        group_cooldown (timedelta): Minimal interval between two promotions in one group. Zero (default) - no cooldown.
+        max_wait (timedelta): How long a run waits for groups that are still in cooldown. Groups eligible later are skipped.
+            Used only with a non-zero `group_cooldown`.
+        post_delay (tuple[int, int]): Random pause (seconds) of one session (account) after its post.
+        save_every (int): Group files are written after this many posts (and at the end of the run).
     """
     d: Driver = None
+    drivers: list[Driver] = None
     group_file_paths: str | Path = None
     no_video: bool = False
     promoter: str
+    group_cooldown: timedelta = timedelta(0)  # <- например, `timedelta(hours=6)`: группа пропускается, пока не истечет интервал
+    max_wait: timedelta = timedelta(hours=1)
+    post_delay: tuple[int, int] = (30, 420)
+    save_every: int = 10
+    last_promo_format: str = "%d/%m/%y %H:%M"
 
-    def __init__(self, d: Driver, promoter: str, group_file_paths: Optional[list[str | Path] | str | Path] = None, no_video: bool = False):
+    def __init__(self, d: Driver, promoter: str, group_file_paths: Optional[list[str | Path] | str | Path] = None, no_video: bool = False, drivers: Optional[list[Driver]] = None):
         """ Initializes the promoter for Facebook groups.
 
         Args:
             d (Driver): WebDriver instance for browser automation.
             group_file_paths (list[str | Path] | str | Path): List of file paths containing group data.
             no_video (bool, optional): Flag to disable videos in posts. Defaults to False.
+            drivers (Optional[list[Driver]]): Additional WebDriver instances, one per account, posting in parallel with `d`.
         """
         self.promoter = promoter
         self.d = d
-        self.group_file_paths = group_file_paths if group_file_paths else get_filenames(gs.path.google_drive / 'facebook' / 'groups')
+        self.drivers = [d, *(drivers or [])]
+        self.group_file_paths = group_file_paths if group_file_paths else get_filenames_from_directory(gs.path.google_drive / 'facebook' / 'groups')
         self.no_video = no_video
         self.spinner = spinning_cursor()
+        self._campaigns: dict[tuple, SimpleNamespace] = {}  # <- (campaign, language, currency) -> campaign editor / adv
+        self._campaigns_lock = threading.Lock()
+        self._groups_files: dict[Path, SimpleNamespace] = {}
+        self._dirty_files: set[Path] = set()
+        self._posts_since_save: int = 0
+
+    def promote(self, group: SimpleNamespace, item: SimpleNamespace, is_event: bool = False, language: str = None, currency: str = None, d: Optional[Driver] = None) -> bool:
+        """Promotes a category or event in a Facebook group.
 
-    def promote(self, group: SimpleNamespace, item: SimpleNamespace, is_event: bool = False, language: str = None, currency: str = None) -> bool:
-        """Promotes a category or event in a Facebook group.""" 
+        Args:
+            d (Optional[Driver]): Browser session to post from. Defaults to `self.d`.
+        """ 
         ...
+        d = d or self.d
         if language:
            if group.language.upper() != language.upper():
                 return
@@ -103,20 +142,20 @@ class FacebookPromoter:
             ev_or_msg.end = item.end
             ev_or_msg.promotional_link = item.promotional_link
 
-            if not post_event(d=self.d, event=ev_or_msg):
+            if not post_event(d=d, event=ev_or_msg):
                 self.log_promotion_error(is_event, item_name)
                 return
         else:
             if 'kazarinov' in self.promoter or 'emil' in self.promoter:
-                if not post_ad(self.d, ev_or_msg):
+                if not post_ad(d, ev_or_msg):
                     return
 
 
-            elif not post_message(d=self.d, message=ev_or_msg, no_video=self.no_video, without_captions=False):
+            elif not post_message(d=d, message=ev_or_msg, no_video=self.no_video, without_captions=False):
                 return
 
         # Обновление данных группы после публикации
-        self.update_group_promotion_data(group, ev_or_msg.name)
+        self.update_group_promotion_data(group, item.name, is_event)
         return True
 
     def log_promotion_error(self, is_event: bool, item_name: str):
@@ -125,8 +164,7 @@ class FacebookPromoter:
 
     def update_group_promotion_data(self, group: SimpleNamespace, item_name: str, is_event: bool = False):
         """Updates group promotion data with the new promotion.""" 
-        timestamp = datetime.now().strftime("%d/%m/%y %H:%M")
-        group.last_promo_sended = gs.now
+        timestamp = datetime.now().strftime(self.last_promo_format)
         if is_event:
             group.promoted_events = group.promoted_events if isinstance(group.promoted_events, list) else [group.promoted_events]
             group.promoted_events.append(item_name)
@@ -135,88 +173,180 @@ class FacebookPromoter:
             group.promoted_categories.append(item_name)
         group.last_promo_sended = timestamp
 
-    def process_groups(self, campaign_name: str = None, events: list[SimpleNamespace] = None, is_event: bool = False, group_file_paths: list[str] = None, group_categories_to_adv: list[str] = ['sales'], language: str = None, currency: str = None):
-        """Processes all groups for the current campaign or event promotion."""    
+    def process_groups(self, campaign_name: str = None, events: list[SimpleNamespace] = None, is_event: bool = False, group_file_paths: list[str] = None, group_categories_to_adv: list[str] = ['sales'], language: str = None, currency: str = None, max_wait: Optional[timedelta] = None) -> int:
+        """Processes all groups for the current campaign or event promotion.
+
+        Synchronous wrapper around `process_groups_async`.
+        """    
+        return asyncio.run(self.process_groups_async(campaign_name, events, is_event, group_file_paths, group_categories_to_adv, language, currency, max_wait))
+
+    async def process_groups_async(self, campaign_name: str = None, events: list[SimpleNamespace] = None, is_event: bool = False, group_file_paths: list[str] = None, group_categories_to_adv: list[str] = ['sales'], language: str = None, currency: str = None, max_wait: Optional[timedelta] = None) -> int:
+        """Processes all groups for the current campaign or event promotion from all browser sessions in parallel.
+
+        Args:
+            campaign_name (str): Campaign to promote.
+            events (list[SimpleNamespace]): Events to promote (with `is_event=True`).
+            is_event (bool): Promote events instead of campaign categories.
+            group_file_paths (list[str]): Group files in `gs.path.google_drive / 'facebook' / 'groups'`. Defaults to `self.group_file_paths`.
+            group_categories_to_adv (list[str]): Only groups of these categories are promoted.
+            language (str): Only groups in this language.
+            currency (str): Only groups with this currency.
+            max_wait (Optional[timedelta]): How long to wait for groups in cooldown. Defaults to `self.max_wait`.
+
+        Returns:
+            int: Number of successful posts.
+        """    
         if not campaign_name and not events:
             logger.debug("Nothing to promote!")
-            return
+            return 0
 
+        group_file_paths = group_file_paths or self.group_file_paths
+        group_file_paths = [group_file_paths] if isinstance(group_file_paths, (str, Path)) else group_file_paths
+        deadline: float = time.time() + (max_wait if max_wait is not None else self.max_wait).total_seconds()
+
+        # Очередь групп: min-heap по времени, когда группа снова доступна для публикации
+        queue: list = []
+        seq = itertools.count()
         for group_file in group_file_paths:
             path_to_group_file: Path = gs.path.google_drive / 'facebook' / 'groups' / group_file 
-            groups_ns: dict = j_loads_ns(path_to_group_file)
+            groups_ns: SimpleNamespace = await asyncio.to_thread(j_loads_ns, path_to_group_file)
 
             if not groups_ns:
                 logger.error(f"Проблема в файле групп {group_file=}")
-                return
+                continue
+            self._groups_files[path_to_group_file] = groups_ns
 
             for group_url, group in vars(groups_ns).items():
                 group.group_url = group_url
 
-                if not is_event and not self.check_interval(group):
-                    logger.debug(f"{campaign_name=}\n Interval in group: {group.group_url}", None, False)
-                    continue
-
                 if not set(group_categories_to_adv).intersection(group.group_categories if isinstance(group.group_categories, list) else [group.group_categories]) or not 'active' in group.status:
                     continue
 
-                if not is_event:
-                    item = self.get_category_item(campaign_name, group, language, currency)
-                else:
-                    random.shuffle(events)
-                    item = events.pop()
-                    
-
-                if item.name in (group.promoted_events if is_event else group.promoted_categories):
-                    logger.debug(f"Item already promoted")
+                if (language and group.language.upper() != language.upper()) or (currency and group.currency.upper() != currency.upper()):
                     continue
 
-                if not group.language.upper() == language.upper() and group.currency.upper() == currency.upper():
-                   continue
-
-                self.driver.get_url(get_event_url(group.group_url) if is_event else group.group_url)
-
-                if not self.promote(group = group, item = item, is_event = is_event, language = language, currency = currency):
+                eligible_at: float = time.time() if is_event else self.next_promotion_time(group).timestamp()
+                if eligible_at > deadline:
+                    logger.debug(f"{campaign_name=}\n Interval in group: {group.group_url}", None, False)
+                    continue
+                heapq.heappush(queue, (eligible_at, next(seq), path_to_group_file, group))
+
+        if not queue:
+            logger.debug(f"Нет групп для публикации {campaign_name=}")
+            return 0
+
+        logger.info(f"Групп в очереди: {len(queue)}, сессий: {len(self.drivers)}")
+        posted: list = []
+
+        async def session(d: Driver) -> None:
+            while queue:
+                eligible_at, _, path_to_group_file, group = heapq.heappop(queue)
+                wait: float = eligible_at - time.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                try:
+                    item: Optional[SimpleNamespace] = random.choice(events) if is_event else await self.get_category_item_async(campaign_name, group, language, currency)
+                    if not item:
+                        continue
+
+                    if item.name in (group.promoted_events if is_event else group.promoted_categories):
+                        logger.debug(f"Item already promoted")
+                        continue
+
+                    promoted: bool = await asyncio.to_thread(self._post_to_group, d, group, item, is_event, language, currency)
+                except Exception as ex:
+                    logger.error(f"Ошибка публикации в группе {group.group_url}", ex, False)
+                    continue
+                if not promoted:
                     continue
 
-                j_dumps(groups_ns, path_to_group_file)
-                t = random.randint(30, 420)
-                print(f"sleeping {t} sec")
-                time.sleep(t)
+                posted.append(group.group_url)
+                self._dirty_files.add(path_to_group_file)
+                self._posts_since_save += 1
+                if self._posts_since_save >= self.save_every:
+                    await self.save_groups_async()
+
+                t = random.randint(*self.post_delay)
+                logger.debug(f"Session {id(d)} sleeping {t} sec", None, False)
+                await asyncio.sleep(t)  # <- пауза только этой сессии, остальные продолжают публиковать
+
+        try:
+            await asyncio.gather(*(session(d) for d in self.drivers))
+        finally:
+            await self.save_groups_async()
+        return len(posted)
+
+    def _post_to_group(self, d: Driver, group: SimpleNamespace, item: SimpleNamespace, is_event: bool, language: str, currency: str) -> bool:
+        """Opens the group in session `d` and posts the item. Runs in a worker thread."""
+        d.get_url(get_event_url(group.group_url) if is_event else group.group_url)
+        return bool(self.promote(group = group, item = item, is_event = is_event, language = language, currency = currency, d = d))
+
+    async def save_groups_async(self) -> None:
+        """Writes the changed group files."""
+        dirty_files, self._dirty_files = self._dirty_files, set()
+        self._posts_since_save = 0
+        for path_to_group_file in dirty_files:
+            if not await asyncio.to_thread(j_dumps, self._groups_files[path_to_group_file], path_to_group_file):
+                logger.error(f"Не удалось сохранить файл групп {path_to_group_file}")
+
+    def get_campaign(self, campaign_name: str, language: str, currency: str) -> Optional[SimpleNamespace | object]:
+        """Returns the campaign (`AliCampaignEditor` for `aliexpress`, adv namespace for others), cached per (campaign, language, currency)."""
+        key: tuple = (campaign_name, language, currency)
+        with self._campaigns_lock:
+            campaign = self._campaigns.get(key)
+            if campaign is None:
+                if self.promoter == 'aliexpress':
+                    from src.suppliers.suppliers_list.aliexpress.campaign import AliCampaignEditor
+                    campaign = AliCampaignEditor(campaign_name=campaign_name, language=language, currency=currency)
+                else:
+                    campaign = j_loads_ns(gs.path.google_drive / self.promoter / 'campaigns' / campaign_name / f"{language}_{currency}.json")
+                self._campaigns[key] = campaign
+            return campaign
 
-    def get_category_item(self, campaign_name: str, group: SimpleNamespace, language: str, currency: str) -> SimpleNamespace:
+    async def get_category_item_async(self, campaign_name: str, group: SimpleNamespace, language: str, currency: str) -> Optional[SimpleNamespace]:
         """Fetches the category item for promotion based on the campaign and promoter."""    
         if self.promoter == 'aliexpress':
-            from src.suppliers.suppliers_list.aliexpress.campaign import AliCampaignEditor
-            ce = AliCampaignEditor(campaign_name=campaign_name, language=group.language, currency=group.currency)
-            list_categories = ce.list_categories
-            random.shuffle(list_categories)
-            category_name = list_categories.pop()
+            ce = await asyncio.to_thread(self.get_campaign, campaign_name, group.language, group.currency)
+            list_categories = list(ce.list_categories or [])
+            if not list_categories:
+                return
+            category_name = random.choice(list_categories)
             item = ce.get_category(category_name)
+            if not item:
+                return
             item.name = category_name
-            item.products = ce.get_category_products(item.category_name)
+            item.products = await ce.get_category_products(item.category_name)
         else:
             base_path = gs.path.google_drive / self.promoter / 'campaigns' / campaign_name
-            adv: SimpleNamespace = j_loads_ns(base_path / f"{language}_{currency}.json")
+            adv: SimpleNamespace = await asyncio.to_thread(self.get_campaign, campaign_name, language, currency)
             adv_categories = list(vars(adv.category).items())  # Преобразуем в список для перемешивания
             random.shuffle(adv_categories)  # Перемешиваем категории
 
+            item = None
             for ad_name, ad in adv_categories:
-                ad.description = read_text_file(base_path / 'category' / ad_name / 'description.txt')
+                ad.description = ad.description if getattr(ad, 'description', None) else read_text_file(base_path / 'category' / ad_name / 'description.txt')
                 if not ad.description:
                     logger.error(f"ошибка чтения файла", None, False)
                     continue
                 item = ad
                 item.name = ad_name
-                _img = get_filenames(base_path / 'category' / ad_name / 'images')
+                _img = get_filenames_from_directory(base_path / 'category' / ad_name / 'images')
                 if _img:
                     _img = _img if isinstance(_img, str) else _img[0]  # Беру только первое изображение
                     item.img_path = Path(gs.path.local) / _img
         return item
 
+    def next_promotion_time(self, group: SimpleNamespace) -> datetime:
+        """Time when the group may be promoted again (`last_promo_sended + group_cooldown`)."""
+        try:
+            return datetime.strptime(group.last_promo_sended, self.last_promo_format) + self.group_cooldown
+        except (AttributeError, TypeError, ValueError):
+            return datetime.now()
+
     def check_interval(self, group: SimpleNamespace) -> bool:
         """Checks if enough time has passed for promoting this group."""   
-        ...
-        return True
+        return self.next_promotion_time(group) <= datetime.now()
 
     def validate_group(self, group: SimpleNamespace) -> bool:
         """Validates that the group data is correct."""   
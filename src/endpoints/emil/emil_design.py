@@ -20,7 +20,6 @@
 import importlib
 import os
 import asyncio
-import time
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Optional, List, Any
@@ -45,7 +44,7 @@ from src.endpoints.prestashop.product_fields import ProductFields
 from src.endpoints.advertisement.facebook.scenarios.post_message import (
     post_message,
 )
-from src.utils.file import read_text_file, save_text_file, get_filenames_from_directory
+from src.utils.file import read_text_file, get_filenames_from_directory
 
 from src.utils.jjson import j_loads, j_loads_ns, j_dumps
 from src.utils.image import get_image_bytes, get_raw_image_data
@@ -75,6 +74,9 @@ class EmilDesign:
     openai: Optional[OpenAIModel] = None
     product: PrestaProduct = None
     driver: Driver = None
+    base_path: Path = Config.ENDPOINT
+    data_path: Optional[Path] = None  # <- `gs.path.google_drive / 'emil'`, задается в `__init__`
+    describe_concurrency: int = 4  # <- Одновременно описываемых изображений. Скорость ограничивает планировщик модели
 
     def __init__(self,
             presta_api_key:Optional[str] = '',
@@ -101,6 +103,7 @@ class EmilDesign:
                 openai: Optional[OpenAIModel] = None,
         """
         ...
+        self.data_path = self.data_path or gs.path.google_drive / 'emil'
         self.driver = Driver(Firefox,window_mode=webdriver_window_mode if webdriver_window_mode else Config.webdriver_window_mode)
 
         if gemini:
@@ -191,15 +194,50 @@ class EmilDesign:
             'gemini': {'model_name': 'gemini-1.5-flash'},
             'openai': {'model_name': 'gpt-4o-mini', 'assistant_id': 'asst_uDr5aVY3qRByRwt5qFiMDk43'},
         },
-    ) -> None:
+        concurrency: Optional[int] = None,
+    ) -> Optional[SimpleNamespace]:
         """Describe images based on the provided instruction and examples.
 
+        Synchronous wrapper around `describe_images_async`.
+
         Args:
             lang (str): Language for the description.
             models (dict, optional): Models configuration. Defaults to Gemini and OpenAI models.
+            concurrency (Optional[int]): Number of images described at the same time. Defaults to `describe_concurrency`.
 
         Returns:
-            None
+            Optional[SimpleNamespace]: `described`, `failed`, `skipped` counters or `None` on error.
+
+        Example:
+            >>> emil = EmilDesign()
+            >>> emil.describe_images('he')
+        """
+        return asyncio.run(self.describe_images_async(lang, models, concurrency))
+
+    async def describe_images_async(
+        self,
+        lang: str,
+        models: dict = {
+            'gemini': {'model_name': 'gemini-1.5-flash'},
+            'openai': {'model_name': 'gpt-4o-mini', 'assistant_id': 'asst_uDr5aVY3qRByRwt5qFiMDk43'},
+        },
+        concurrency: Optional[int] = None,
+    ) -> Optional[SimpleNamespace]:
+        """Describe images concurrently. The run can be interrupted and restarted at any moment.
+
+        Images are described by a pool of `concurrency` workers. The request rate is limited by the
+        model scheduler (`rate_limits` in `gemini.json`), so there is no fixed delay between requests.
+        Every described image is saved to `<data_path>/<img>.json` and then appended as one line to
+        `described_images.txt`. On restart, images listed there or already having their `.json` are skipped,
+        so a crash costs at most the images that were in flight.
+
+        Args:
+            lang (str): Language for the description.
+            models (dict, optional): Models configuration. Defaults to Gemini and OpenAI models.
+            concurrency (Optional[int]): Number of images described at the same time. Defaults to `describe_concurrency`.
+
+        Returns:
+            Optional[SimpleNamespace]: `described`, `failed`, `skipped` counters or `None` on error.
 
         Raises:
             FileNotFoundError: If instruction files are not found.
@@ -207,7 +245,7 @@ class EmilDesign:
 
         Example:
             >>> emil = EmilDesign()
-            >>> emil.describe_images('he')
+            >>> asyncio.run(emil.describe_images_async('he', concurrency=8))
         """
         try:
             system_instruction = Path(self.base_path / 'instructions' / f'system_instruction.{lang}.md').read_text(
@@ -224,13 +262,15 @@ class EmilDesign:
             )
             system_instruction += furniture_categories + prompt
 
-            output_json = self.data_path / f'out_{gs.now}_{lang}.json'
             described_images_path = self.data_path / 'described_images.txt'
-            described_images: list = read_text_file(described_images_path, as_list=True) or []
             images_dir = self.data_path / 'images' / 'furniture_images'
-            images_files_list: list = get_filenames_from_directory(images_dir)
-            images_to_process = [
-                img for img in images_files_list if str(images_dir / img) not in described_images
+            images_files_list: list = get_filenames_from_directory(images_dir) or []
+            # Множество вместо списка: проверка `in` за O(1)
+            described_images: set = set(read_text_file(described_images_path, as_list=True) or [])
+            images_to_process: list = [
+                img
+                for img in images_files_list
+                if str(images_dir / img) not in described_images and not (self.data_path / f'{img}.json').exists()
             ]
 
             use_openai: bool = False
@@ -244,36 +284,80 @@ class EmilDesign:
             use_gemini: bool = True
             if use_gemini:
                 self.gemini = GoogleGenerativeAi(
-                    api_key=self.gemini_api,
+                    api_key=Config.GEMINI_API_KEY,
                     model_name=models['gemini']['model_name'],
                     system_instruction=system_instruction,
                     generation_config={'response_mime_type': 'application/json'},
                 )
-
-            for img in images_to_process:
-                logger.info(f'Starting process file {img}\n')
-
-                raw_img_data = get_raw_image_data(images_dir / img)
-                response = self.gemini.describe_image(image=raw_img_data, mime_type='image/jpeg', prompt=prompt)
-                ...
-                if not response:
-                    logger.debug(f'Failed to get description for {img}')
-                    ...
-                else:
-                    response_dict: dict = (
-                        j_loads(response)[0] if isinstance(j_loads(response), list) else j_loads(response)
-                    )
-                    response_dict['local_image_path'] = str(images_dir / img)
-                    j_dumps(response_dict, self.data_path / f'{img}.json')
-                    # Список уже обработанных изображений
-                    described_images.append(str(images_dir / img))
-                    save_text_file(described_images_path, described_images)
-
-                time.sleep(15)  # Задержка между запросами
         except FileNotFoundError as e:
             logger.error(f'Instruction file not found: {e}', exc_info=True)
+            return None
         except Exception as e:
-            logger.error(f'Error while processing image: {e}', exc_info=True)
+            logger.error(f'Error while preparing images description: {e}', exc_info=True)
+            return None
+
+        result = SimpleNamespace(described=0, failed=0, skipped=len(images_files_list) - len(images_to_process))
+        if not images_to_process:
+            logger.info(f'Нет новых изображений. Пропущено: {result.skipped}')
+            return result
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for img in images_to_process:
+            queue.put_nowait(img)
+
+        async def describe(img: str) -> bool:
+            image_path: Path = images_dir / img
+            raw_img_data: Optional[bytes] = await asyncio.to_thread(get_raw_image_data, image_path)
+            if not raw_img_data:
+                logger.debug(f'Failed to read image {img}')
+                return False
+            response = await self.gemini.describe_image_async(image=raw_img_data, mime_type='image/jpeg', prompt=prompt)
+            if not response:
+                logger.debug(f'Failed to get description for {img}')
+                return False
+            response_data = j_loads(response)
+            response_dict: dict = response_data[0] if isinstance(response_data, list) and response_data else response_data
+            if not isinstance(response_dict, dict) or not response_dict:
+                logger.debug(f'Model returned invalid JSON for {img}')
+                return False
+            response_dict['local_image_path'] = str(image_path)
+            if not await asyncio.to_thread(j_dumps, response_dict, self.data_path / f'{img}.json'):
+                return False
+            # Запись в журнал - только после сохранения `.json`
+            index_file.write(f'{image_path}\n')
+            index_file.flush()
+            return True
+
+        async def worker() -> None:
+            while True:
+                img: str = await queue.get()
+                try:
+                    logger.info(f'Starting process file {img}\n')
+                    if await describe(img):
+                        result.described += 1
+                    else:
+                        result.failed += 1
+                except Exception as ex:
+                    result.failed += 1
+                    logger.error(f'Error while processing image {img}', ex, False)
+                finally:
+                    queue.task_done()
+
+        concurrency = max(1, concurrency or self.describe_concurrency)
+        described_images_path.parent.mkdir(parents=True, exist_ok=True)
+        with described_images_path.open('a', encoding='utf-8') as index_file:
+            workers: list = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(images_to_process)))]
+            try:
+                await queue.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+        logger.info(
+            f'Описано изображений: {result.described}, ошибок: {result.failed}, пропущено: {result.skipped}'
+        )
+        return result
 
     async def promote_to_facebook(self) -> None:
         """Promote images and their descriptions to Facebook.
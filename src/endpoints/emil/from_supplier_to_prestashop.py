@@ -159,16 +159,20 @@ class SupplierToPrestashopPipeline:
         # 1. Сбор товаров
         for url in urls:
 
-            graber = get_graber_by_supplier_url(url) 
+            graber = get_graber_by_supplier_url(self.driver, url, 2)
             
             if not graber:
                 logger.debug(f"Нет грабера для: {url}", None, False)
                 ...
                 continue
 
+            if not await graber.open_page(url):
+                logger.error(f"Не удалось открыть страницу: {url}", None, False)
+                continue
+
             try:
                 #scenarios_files_list:list =  recursively_get_file_path(__root__ / 'src' / 'suppliers' / 'suppliers_list' / graber.supplier_prefix / 'scenarios', '.json')
-                f = await graber.grab_page(*required_fields)
+                f = await graber.grab_page_async(*required_fields)
                 #graber.process_graber('hb')
                 ...
 
@@ -16,6 +16,11 @@
 - Метод `generate_pdf`: Преобразует HTML в PDF.
 - Метод `create_report`: Запускает полный цикл генерации отчёта.
 
+Шаблоны компилируются один раз и хранятся в кэше `Environment` (`auto_reload` - перекомпиляция
+только при изменении файла шаблона). PDF и DOCX создаются в пуле процессов (`render_workers`),
+поэтому event loop бота не блокируется, пока рендерятся несколько мехиронов.
+`create_multilang_reports_async` создает отчеты на нескольких языках параллельно.
+
 """
 
 
@@ -25,6 +30,8 @@
 
 from argparse import OPTIONAL
 import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
 import telebot
 from itertools import filterfalse
@@ -49,6 +56,37 @@ from src.logger.logger import logger
 @dataclass
 class Config:
     ENDPOINT = 'kazarinov'
+    TEMPLATES_PATH = __root__ / 'src' / 'endpoints' / ENDPOINT / 'report_generator' / 'templates' # <- без `gs`: модуль импортируется до загрузки настроек
+
+
+_render_pool: Optional[Executor] = None
+_render_pool_lock = threading.Lock()
+
+
+def get_render_pool(max_workers: int) -> Executor:
+    """Общий для процесса пул рендеринга. Создается при первом обращении.
+
+    Пул общий для всех `ReportGenerator` и всех event loop (бот запускает `asyncio.run` на каждое сообщение),
+    поэтому `max_workers` ограничивает количество одновременно рендерящихся документов во всем процессе.
+    """
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(max_workers=max_workers)
+        return _render_pool
+
+
+def _render_pdf(html_content: str, pdf_path: str) -> bool:
+    """HTML -> PDF. Выполняется в процессе пула рендеринга."""
+    from src.utils.pdf import PDFUtils
+    Path(pdf_path).parent.mkdir(parents=True, exist_ok=True)
+    return PDFUtils.save_pdf_pdfkit(html_content, pdf_path)
+
+
+def _render_docx(html_path: str, docx_path: str) -> bool:
+    """HTML-файл -> DOCX. Выполняется в процессе пула рендеринга."""
+    from src.utils.convertors.html import html_to_docx
+    return html_to_docx(html_path, docx_path)
 
 
 class ReportGenerator:
@@ -66,7 +104,17 @@ class ReportGenerator:
     data:dict
     lang:str
     mexiron_name:str
-    env: Environment = Environment(loader=FileSystemLoader('.'))
+    _env: Optional[Environment] = None # <- общий для всех экземпляров, создается при первом обращении к `env`
+    render_workers: int = 2 # <- процессов рендеринга PDF/DOCX на весь процесс бота
+    bot: Optional[telebot.TeleBot] = None
+    chat_id: Optional[int] = None
+
+    @property
+    def env(self) -> Environment:
+        """Окружение jinja2 с кэшем шаблонов. Шаблон перекомпилируется только при изменении файла (mtime)."""
+        if ReportGenerator._env is None:
+            ReportGenerator._env = Environment(loader=FileSystemLoader(str(Config.TEMPLATES_PATH)), auto_reload=True)
+        return ReportGenerator._env
 
     def __init__(self, 
                  if_need_pdf:Optional[bool] = True, 
@@ -83,37 +131,69 @@ class ReportGenerator:
                              data:dict,
                              lang:str,
                              mexiron_name:str,
-                             ) -> tuple:
-        """Create ALL types: HTML, PDF, DOCX"""
+                             ) -> bool:
+        """Create ALL types: HTML, PDF, DOCX
+
+        Пути хранятся в локальных переменных, поэтому один экземпляр может одновременно
+        создавать отчеты на нескольких языках (см. `create_multilang_reports_async`).
+        """
         ...
         self.mexiron_name = mexiron_name 
         export_path = self.storage_path / 'mexironim' / self.mexiron_name
 
-        self.html_path = export_path / f"{self.mexiron_name}_{lang}.html"
-        self.pdf_path = export_path / f"{self.mexiron_name}_{lang}.pdf"
-        self.docx_path = export_path / f"{self.mexiron_name}_{lang}.docx"
+        html_path = export_path / f"{self.mexiron_name}_{lang}.html"
+        pdf_path = export_path / f"{self.mexiron_name}_{lang}.pdf"
+        docx_path = export_path / f"{self.mexiron_name}_{lang}.docx"
+        self.html_path, self.pdf_path, self.docx_path = html_path, pdf_path, docx_path
         self.bot = bot
         self.chat_id = chat_id
 
-        self.html_content = await self.create_html_report_async(data, lang, self.html_path)
+        html_content: str = await self.create_html_report_async(data, lang, html_path)
 
-        if not self.html_content:
+        if not html_content:
             return False
 
-
+        tasks: list = []
         if self.if_need_pdf:
-            await self.create_pdf_report_async(self.html_content, lang, self.pdf_path)
+            tasks.append(self.create_pdf_report_async(html_content, lang, pdf_path))
 
         if self.if_need_docx:
-            await self.create_pdf_report_async(self.html_content, lang, self.pdf_path)
+            tasks.append(self.create_docx_report_async(html_path, docx_path, html_content))
+
+        return all(await asyncio.gather(*tasks))
 
-      
+    async def create_multilang_reports_async(self,
+                             bot: telebot.TeleBot,
+                             chat_id: int,
+                             data: dict,
+                             mexiron_name: str,
+                             langs: Optional[list] = None,
+                             ) -> bool:
+        """Создает отчеты на нескольких языках параллельно.
+
+        Args:
+            data (dict): Данные по языкам, например `{'he': {...}, 'ru': {...}}`.
+            langs (Optional[list]): Языки. По умолчанию - все ключи `data`.
+
+        Returns:
+            bool: `True`, если созданы отчеты на всех языках.
+        """
+        langs = [lang for lang in (langs or list(data.keys())) if data.get(lang)]
+        results: list = await asyncio.gather(
+            *(self.create_reports_async(bot, chat_id, data[lang], lang, mexiron_name) for lang in langs),
+            return_exceptions=True,
+        )
+        for lang, result in zip(langs, results):
+            if isinstance(result, Exception):
+                logger.error(f"Не удалось создать отчет {mexiron_name} для {lang=}", result, False)
+        return bool(results) and all(result is True for result in results)
          
     def service_apendix(self, lang:str) -> dict:
+        specification: str = self.env.get_template(f'service_as_product_{lang}.html').render() # <- тот же кэш шаблонов
         return  {
                 "product_id":"00000",
                 "product_name":"Сервис" if lang == 'ru' else "שירות",
-                "specification":Path(__root__ / 'src' / 'endpoints' / Config.ENDPOINT / 'report_generator' / 'templates' / f'service_as_product_{lang}.html').read_text(encoding='UTF-8').replace('/n','<br>'),
+                "specification":specification.replace('/n','<br>'),
                 "image_local_saved_path":random_image(self.storage_path / 'converted_images' )
                 }
 
@@ -129,17 +209,15 @@ class ReportGenerator:
         Returns:
             str: HTML-контент.
         """
-        self.html_path = html_path if html_path and isinstance(html_path, str)  else Path(html_path) or self.html_path
+        html_path = Path(html_path) if html_path else self.html_path
 
         try:
             service_apendix = self.service_apendix(lang)
-            data['products'].append(service_apendix)
-            template:str = 'template_table_he.html' if lang == 'he' else  'template_table_ru.html'
-            template_path: str  =  str(gs.path.endpoints / Config.ENDPOINT / 'report_generator' / 'templates' / template)
-            #template = self.env.get_template(self.template_path)
-            template_string = Path(template_path).read_text(encoding = 'UTF-8')
-            template = self.env.from_string(template_string)
-            self.html_content:str = template.render(**data)
+            data = {**data, 'products': [*data.get('products', []), service_apendix]} # <- исходный словарь не изменяется
+            template_name:str = 'template_table_he.html' if lang == 'he' else  'template_table_ru.html'
+            template = self.env.get_template(template_name) # <- из кэша, пока файл не изменился
+            html_content:str = template.render(**data)
+            self.html_content = html_content
 
             # try:
             #     Path(self.html_path).write_text(data = self.html_content, encoding='UTF-8')
@@ -149,54 +227,76 @@ class ReportGenerator:
                 
 
             # logger.info(f"Файл HTML удачно сохранен в {html_path}")
-            return self.html_content
+            return html_content
 
         except Exception as ex:
             logger.error(f"Не удалось сгенерирпвать HTML {html_path}", ex)
             return ''
 
+    async def _render(self, func, *args) -> bool:
+        """Выполняет `func(*args)` в пуле процессов рендеринга, не блокируя event loop."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(get_render_pool(self.render_workers), func, *args)
+        except Exception as ex:
+            logger.error(f"Ошибка в процессе рендеринга {func.__name__}", ex, False)
+            return False
+
+    async def _send_document(self, path: Path) -> bool:
+        """Отправляет файл в чат. Запрос к Telegram выполняется в отдельном потоке."""
+        def send() -> None:
+            with open(path, 'rb') as f:
+                self.bot.send_document(self.chat_id, f)
+        try:
+            await asyncio.to_thread(send)
+            return True
+        except Exception as ex:
+            logger.error(f"Не удалось отправить файл {path}", ex, False)
+            await asyncio.to_thread(self.bot.send_message, self.chat_id, f"Не удалось отправить файл {path} по причине:\n{ex}")
+            return False
+
     async def create_pdf_report_async(self, 
-                                data: dict, 
+                                data: str, 
                                 lang:str, 
                                 pdf_path:str |Path) -> bool:
         """
         Полный цикл генерации отчёта.
 
         Args:
+            data (str): HTML-контент. По умолчанию - последний сгенерированный `html_content`.
             lang (str): Язык отчёта.
+            pdf_path (str | Path): Путь к PDF-файлу.
         """
         pdf_path = pdf_path if pdf_path and isinstance(pdf_path, (str,Path)) else self.pdf_path
 
-        self.html_content = data if data else self.html_content
-
-        from src.utils.pdf import PDFUtils
-        pdf = PDFUtils()
+        html_content: str = data if data else self.html_content
 
-        if not pdf.save_pdf_pdfkit(self.html_content, pdf_path):
+        if not await self._render(_render_pdf, html_content, str(pdf_path)):
             logger.error(f"Не удалось сохранить PDF файл {pdf_path}")
-            if self.bot: self.bot.send_message(self.chat_id, f"Не удалось сохранить файл {pdf_path}")
+            if self.bot: await asyncio.to_thread(self.bot.send_message, self.chat_id, f"Не удалось сохранить файл {pdf_path}")
             ...
             return False
         
 
         if self.bot:
-            try:
-                with open(pdf_path, 'rb') as f:
-                    self.bot.send_document(self.chat_id, f)
-                    return True
-            except Exception as ex:
-                self.bot.send_message(self.chat_id, f"Не удалось отправить файл {pdf_path} по причине:\n",ex,False)
-                return False
+            return await self._send_document(Path(pdf_path))
 
         return True
 
 
-    async def create_docx_report_async(self, html_path:str|Path, docx_path:str|Path) -> bool :
-        """Создаю docx файл """
+    async def create_docx_report_async(self, html_path:str|Path, docx_path:str|Path, html_content: Optional[str] = None) -> bool :
+        """Создаю docx файл. Если передан `html_content`, он предварительно сохраняется в `html_path`."""
+        html_path = Path(html_path) if html_path else Path(self.html_path)
+        if html_content:
+            html_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(html_path.write_text, html_content, encoding='UTF-8')
 
-        if not html_to_docx(self.html_path, docx_path):
+        if not await self._render(_render_docx, str(html_path), str(docx_path)):
             logger.error(f"Не скопмилировался DOCX.")
             return False
+
+        if self.bot:
+            return await self._send_document(Path(docx_path))
         return True
 
 
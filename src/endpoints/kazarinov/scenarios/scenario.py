@@ -85,6 +85,11 @@ class Scenario(QuotationBuilder):
                 ...
                 continue
 
+            if not await graber.open_page(url):
+                logger.error(f"Не удалось открыть страницу: {url}")
+                if bot: bot.send_message(chat_id, f"Не удалось открыть страницу: {url}")
+                continue
+
             f: ProductFields = None
             if bot: bot.send_message(chat_id, f"Process: {url}")  
             try:
@@ -120,6 +125,7 @@ class Scenario(QuotationBuilder):
         Внимание! модель может ошибаться"""
 
         langs_list: list = ["he", "ru"]
+        reports_data: dict = {}
 
         for lang in langs_list:
             if bot: bot.send_message( 
@@ -147,14 +153,15 @@ class Scenario(QuotationBuilder):
             data["currency"] = getattr(self.translations.currency, lang, "ש''ח")
 
             j_dumps(data, self.export_path / f'{self.mexiron_name}_{lang}.json')
-
-            reporter = ReportGenerator(if_need_docx=False)
-            await reporter.create_reports_async(bot = bot, 
-                                chat_id = chat_id,
-                                data = data,
-                                lang = lang,
-                                mexiron_name = self.mexiron_name
-                                    )
+            reports_data[lang] = data
+
+        # Отчеты на всех языках создаются параллельно, PDF рендерится вне event loop
+        reporter = ReportGenerator(if_need_docx=False)
+        await reporter.create_multilang_reports_async(bot = bot, 
+                            chat_id = chat_id,
+                            data = reports_data,
+                            mexiron_name = self.mexiron_name
+                                )
 
         return True # Возвращаем True в конце
 
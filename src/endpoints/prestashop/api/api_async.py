@@ -1,9 +1,11 @@
+import mimetypes
 import os
 import sys
 from enum import Enum
 from http.client import HTTPConnection
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from types import SimpleNamespace
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, Tuple, Union
 from xml.etree import ElementTree
 from xml.parsers.expat import ExpatError
 
@@ -16,6 +18,7 @@ from src.logger.exceptions import PrestaShopAuthenticationError, PrestaShopExcep
 from src.logger.logger import logger
 from src.utils.convertors.base64 import base64_to_tmpfile
 from src.utils.convertors.dict import dict2xml
+from src.endpoints.prestashop.utils.dict2xml import dict2xml as presta_dict2xml
 from src.utils.convertors.xml2dict import xml2dict
 from src.utils.file import save_text_file
 from src.utils.image import save_image_from_url_async
@@ -107,6 +110,10 @@ class PrestaShopAsync:
             # Create binary (product image)
             await api.create_binary('images/products/22', 'img.jpeg', 'image')
 
+            # Bulk upload of products (`ProductFields`) with bounded concurrency
+            results = await api.add_products_bulk(products, concurrency=8, image_concurrency=4)
+            await api.close()
+
         if __name__ == "__main__":
             asyncio.run(main())
 
@@ -118,18 +125,25 @@ class PrestaShopAsync:
     ps_version = ''
     API_DOMAIN:str = None
     API_KEY:str = None
+    max_connections: int = 16  # <- Размер пула соединений `ClientSession`
+    max_in_flight: int = 8  # <- Максимум одновременных запросов к API
+    retries: int = 3  # <- Повторы при сетевой ошибке или ответе 5xx/429 (для POST - см. `_request`)
+    idempotent_methods: tuple = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')  # <- Повторяются при любой сетевой ошибке и 5xx
+    backoff: float = 1.0  # <- Базовая задержка экспоненциального отката, сек.
 
     def __init__(self,
                 api_domain:str,
                 api_key:str,
                 data_format: str = 'JSON',
-                debug: bool = True) -> None:
+                debug: bool = True,
+                max_in_flight: Optional[int] = None) -> None:
         """! Initialize the PrestaShopAsync class.
 
         Args:
             data_format (str, optional): Default data format ('JSON' or 'XML'). Defaults to 'JSON'.
             default_lang (int, optional): Default language ID. Defaults to 1.
             debug (bool, optional): Activate debug mode. Defaults to True.
+            max_in_flight (int, optional): Maximum number of concurrent API requests. Defaults to `PrestaShopAsync.max_in_flight`.
 
         Raises:
             PrestaShopAuthenticationError: When the API key is wrong or does not exist.
@@ -139,11 +153,84 @@ class PrestaShopAsync:
         self.API_KEY = api_key
         self.debug = debug
         self.data_format = data_format
+        self.max_in_flight = max_in_flight or self.max_in_flight
+        self._limiter: Optional[asyncio.Semaphore] = None
+        self.client = None  # <- Создается лениво в работающем event loop, см. `session`
+
+    @property
+    def session(self) -> ClientSession:
+        """! Pooled `ClientSession` shared by all requests. Created on first use."""
+        if self.client is None or self.client.closed:
+            self.client = ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300),
+                auth=aiohttp.BasicAuth(self.API_KEY, ''),
+                timeout=ClientTimeout(total=60)
+            )
+        return self.client
+
+    @property
+    def limiter(self) -> asyncio.Semaphore:
+        """! Semaphore limiting the number of in-flight API requests."""
+        if self._limiter is None:
+            self._limiter = asyncio.Semaphore(self.max_in_flight)
+        return self._limiter
+
+    async def close(self) -> None:
+        """! Close the session and its connection pool."""
+        if self.client and not self.client.closed:
+            await self.client.close()
+        self.client = None
 
-        self.client = ClientSession(
-            auth=aiohttp.BasicAuth(self.API_KEY, ''),
-            timeout=ClientTimeout(total=60)
-        )
+    async def __aenter__(self) -> 'PrestaShopAsync':
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _request(self, method: str, url: str, data: Any = None, headers: Optional[dict] = None) -> Tuple[Optional[aiohttp.ClientResponse], str]:
+        """! Send a request through the pooled session, retrying with exponential backoff on network errors and 5xx/429.
+
+        At most `max_in_flight` requests are sent at once; backoff delays do not hold a slot.
+        `data` must be re-sendable (bytes, str, dict or a factory returning `aiohttp.FormData`).
+        Non-idempotent requests (POST) are retried only when the server certainly did not process them:
+        the connection could not be established (`ClientConnectorError`) or the server answered 429.
+        A POST that failed after sending or got 5xx may already have created the resource and is not repeated.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            data (Any, optional): Request body, or a callable that builds it for every attempt.
+            headers (dict, optional): Request headers.
+
+        Returns:
+            Tuple[aiohttp.ClientResponse | None, str]: The (closed) response and its text. `(None, '')` if all attempts failed.
+        """
+        idempotent: bool = method.upper() in self.idempotent_methods
+        for attempt in range(self.retries + 1):
+            try:
+                async with self.limiter:
+                    async with self.session.request(
+                        method=method,
+                        url=url,
+                        data=data() if callable(data) else data,
+                        headers=headers,
+                    ) as response:
+                        text: str = await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                if attempt == self.retries or not (idempotent or isinstance(ex, aiohttp.ClientConnectorError)):
+                    logger.error(f'Request failed: {method} {url}', ex, False)
+                    return None, ''
+                delay: float = self.backoff * 2 ** attempt
+                logger.debug(f'Request error: {method} {url}. Retry {attempt + 1}/{self.retries} in {delay} sec.', ex, False)
+            else:
+                if (response.status == 429 or (idempotent and response.status >= 500)) and attempt < self.retries:
+                    retry_after: str = response.headers.get('Retry-After', '')
+                    delay = float(retry_after) if retry_after.isdigit() else self.backoff * 2 ** attempt
+                    logger.debug(f'HTTP {response.status}: {method} {url}. Retry {attempt + 1}/{self.retries} in {delay} sec.')
+                else:
+                    return response, text
+            await asyncio.sleep(delay)
+        return None, ''
 
 
     async def ping(self) -> bool:
@@ -152,14 +239,11 @@ class PrestaShopAsync:
         Returns:
             bool: Result of the ping test. Returns `True` if the webservice is working, otherwise `False`.
         """
-        async with self.client.request(
-            method='HEAD',
-            url=self.API_DOMAIN
-        ) as response:
-            return await self._check_response(response.status, response)
+        response, text = await self._request('HEAD', self.API_DOMAIN)
+        return bool(response) and self._check_response(response.status, response, text=text)
 
     def _check_response(self, status_code: int, response, method: Optional[str] = None, url: Optional[str] = None,
-                        headers: Optional[dict] = None, data: Optional[dict] = None) -> bool:
+                        headers: Optional[dict] = None, data: Optional[dict] = None, text: str = '') -> bool:
         """! Check the response status code and handle errors asynchronously.
 
         Args:
@@ -169,6 +253,7 @@ class PrestaShopAsync:
             url (str, optional): The URL of the request.
             headers (dict, optional): The headers used in the request.
             data (dict, optional): The data sent in the request.
+            text (str, optional): The response text.
 
         Returns:
             bool: `True` if the status code is 200 or 201, otherwise `False`.
@@ -176,11 +261,11 @@ class PrestaShopAsync:
         if status_code in (200, 201):
             return True
         else:
-            self._parse_response_error(response, method, url, headers, data)
+            self._parse_response_error(response, method, url, headers, data, text=text)
             return False
 
     def _parse_response_error(self, response, method: Optional[str] = None, url: Optional[str] = None,
-                              headers: Optional[dict] = None, data: Optional[dict] = None):
+                              headers: Optional[dict] = None, data: Optional[dict] = None, text: str = ''):
         """! Parse the error response from PrestaShop API asynchronously.
 
         Args:
@@ -189,11 +274,11 @@ class PrestaShopAsync:
             url (str, optional): The URL of the request.
             headers (dict, optional): The headers used in the request.
             data (dict, optional): The data sent in the request.
+            text (str, optional): The response text.
         """
         if self.data_format == 'JSON':
             status_code = response.status
             if not status_code in (200, 201):
-                text = response.text()
                 logger.critical(f"""response status code: {status_code}
                     url: {response.request_info.url}
                     --------------
@@ -202,7 +287,7 @@ class PrestaShopAsync:
                     response text: {text}""")
             return response
         else:
-            error_answer = self._parse(response.text())
+            error_answer = self._parse(text)
             if isinstance(error_answer, dict):
                 error_content = (error_answer
                                  .get('PrestaShop', {})
@@ -313,21 +398,18 @@ class PrestaShopAsync:
                                    'output_format': io_format})
             
             request_data = dict2xml(data) if data and io_format == 'XML' else data
-            
-            with self.client.request(
-                method=method,
-                url=prepared_url,
-                data=request_data,
-                headers=headers,
-            ) as response:
-
-                if not self._check_response(response.status, response, method, prepared_url, headers, request_data):
-                    return False
-
-                if io_format == 'JSON':
-                    return response.json()
-                else:
-                    return self._parse(await response.text())
+
+            response, text = await self._request(method, prepared_url, data=request_data, headers=headers)
+            if response is None:
+                return False
+
+            if not self._check_response(response.status, response, method, prepared_url, headers, request_data, text=text):
+                return False
+
+            if io_format == 'JSON':
+                return j_loads(text) if text else {}
+            else:
+                return self._parse(text)
 
 
     def _parse(self, text: str) -> dict | ElementTree.Element | bool:
@@ -422,15 +504,29 @@ class PrestaShopAsync:
         Returns:
             dict: Response from the API.
         """
-        with open(file_path, 'rb') as file:
-            headers = {'Content-Type': 'application/octet-stream'}
-            async with self.client.post(
-                url=f'{self.API_DOMAIN}{resource}',
-                headers=headers,
-                data=file.read()
-            ) as response:
+        content: bytes = await asyncio.to_thread(Path(file_path).read_bytes)
+        return await self._upload_image_bytes(resource, content, file_name)
 
-               return response.json()
+    async def _upload_image_bytes(self, resource: str, content: bytes, file_name: str) -> dict:
+        """! Upload image bytes as the multipart `image` field, as the webservice expects.
+
+        Args:
+            resource (str): API resource (e.g., 'images/products/22').
+            content (bytes): Image content.
+            file_name (str): File name.
+
+        Returns:
+            dict: Parsed response, or `{'error': ...}` on failure.
+        """
+        def form() -> aiohttp.FormData:
+            data = aiohttp.FormData()
+            data.add_field('image', content, filename=file_name, content_type=mimetypes.guess_type(file_name)[0] or 'application/octet-stream')
+            return data
+
+        response, text = await self._request('POST', f'{self.API_DOMAIN}{resource}', data=form)
+        if response is None or not self._check_response(response.status, response, 'POST', resource, text=text):
+            return {'error': f'Image upload failed: {resource}'}
+        return self._parse(text) if self.data_format == 'JSON' and text.lstrip().startswith('{') else {'status': response.status}
 
     def _save(self, file_name: str, data: dict):
         """! Save data to a file.
@@ -542,4 +638,155 @@ class PrestaShopAsync:
         Returns:
             dict | None: List of product images or `False` on failure.
         """
-        return await self._exec(f'products/{product_id}/images', method='GET', io_format=self.data_format)
\ No newline at end of file
+        return await self._exec(f'products/{product_id}/images', method='GET', io_format=self.data_format)
+
+    async def get_category_tree(self) -> Dict[int, int]:
+        """! Load the whole category tree with a single request.
+
+        Returns:
+            Dict[int, int]: `{id_category: id_parent}`. Empty dict on failure.
+        """
+        response = await self._exec('categories', display='[id,id_parent]', io_format='JSON')
+        try:
+            return {int(c['id']): int(c['id_parent']) for c in (response or {}).get('categories', [])}
+        except (AttributeError, KeyError, TypeError, ValueError) as ex:
+            logger.error('Error parsing category tree', ex, False)
+            return {}
+
+    def _product_payload(self, f: 'ProductFields', category_tree: Dict[int, int]) -> bytes:
+        """! Build the XML payload of a product, adding the parents of its categories as `PrestaProduct.add_new_product` does.
+
+        Args:
+            f (ProductFields): Product fields.
+            category_tree (Dict[int, int]): `{id_category: id_parent}` from `get_category_tree()`.
+
+        Returns:
+            bytes: XML payload for `POST products`.
+        """
+        f.additional_category_append(f.id_category_default)
+        seen_ids: set = set()
+        for category in list(f.additional_categories):
+            try:
+                current: int = int(category.get('id'))
+            except (AttributeError, TypeError, ValueError):
+                continue
+            seen_ids.add(current)
+            while current > 2 and current in category_tree:  # <- Дерево категорий начинается с 2
+                current = category_tree[current]
+                if current <= 2 or current in seen_ids:
+                    break
+                f.additional_category_append(current)
+                seen_ids.add(current)
+
+        return presta_dict2xml({'prestashop': {
+            'attrs': {'xmlns:xlink': 'http://www.w3.org/1999/xlink'},
+            'value': {'products': [f.to_dict()]},
+        }})
+
+    async def _add_product(self, f: 'ProductFields', category_tree: Dict[int, int], image_limiter: asyncio.Semaphore,
+                           download_session: ClientSession) -> SimpleNamespace:
+        """! Create one product and upload its image. Never raises: errors are returned in the result.
+
+        `download_session` is a separate session without the shop credentials, used to download `default_image_url`.
+
+        Returns:
+            SimpleNamespace: `ok`, `id_product`, `image` (upload response or `None`), `error`, `fields`.
+        """
+        result = SimpleNamespace(ok=False, id_product=None, image=None, error=None, fields=f)
+        try:
+            payload: bytes = self._product_payload(f, category_tree)
+            response = await self._exec(
+                'products', method='POST', data=payload, io_format='JSON',
+                headers={'Content-Type': 'application/xml'},
+            )
+            if not response:
+                result.error = 'Product was not created'
+                return result
+            product: dict = response.get('product') or (response.get('products') or [{}])[0]
+            result.id_product = int(product['id'])
+            result.ok = True
+        except Exception as ex:
+            logger.error(f'Error adding product {getattr(f, "reference", "")}', ex, False)
+            result.error = str(ex)
+            return result
+
+        try:
+            async with image_limiter:
+                if f.local_image_path:
+                    result.image = await self.create_binary(f'images/products/{result.id_product}', f.local_image_path, f'{result.id_product}.png')
+                elif getattr(f, 'default_image_url', None):
+                    async with download_session.get(f.default_image_url) as image_response:
+                        content: Optional[bytes] = await image_response.read() if image_response.status == 200 else None
+                    if content:
+                        result.image = await self._upload_image_bytes(f'images/products/{result.id_product}', content, f'{result.id_product}.jpg')
+                    else:
+                        result.image = {'error': f'Image download failed: {f.default_image_url}'}
+        except Exception as ex:
+            logger.error(f'Error uploading image for product {result.id_product}', ex, False)
+            result.image = {'error': str(ex)}
+        return result
+
+    async def add_products_bulk(self,
+                                products: Iterable['ProductFields'] | AsyncIterable['ProductFields'],
+                                concurrency: Optional[int] = None,
+                                image_concurrency: int = 4) -> List[SimpleNamespace]:
+        """! Upload a stream of products with a bounded number of in-flight requests.
+
+        The category tree is loaded once and parent categories are resolved in memory.
+        Product creates and image uploads share one pooled `ClientSession`; requests are retried
+        with backoff on 5xx/429 (`_request`). At most `concurrency` products are processed at once,
+        and at most `image_concurrency` of them upload images at the same time.
+
+        Args:
+            products (Iterable[ProductFields] | AsyncIterable[ProductFields]): Products to add. Consumed lazily.
+            concurrency (int, optional): Products processed concurrently. Defaults to `max_in_flight`.
+            image_concurrency (int, optional): Concurrent image uploads. Defaults to 4.
+
+        Returns:
+            List[SimpleNamespace]: One result per product, in input order: `ok`, `id_product`, `image`, `error`, `fields`.
+
+        Example:
+            >>> async with PrestaShopAsync(api_domain, api_key) as api:
+            >>>     results = await api.add_products_bulk(products, concurrency=8)
+            >>>     failed = [r for r in results if not r.ok]
+        """
+        concurrency = concurrency or self.max_in_flight
+        category_tree: Dict[int, int] = await self.get_category_tree()
+        image_limiter = asyncio.Semaphore(image_concurrency)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)  # <- Поток товаров не загружается в память целиком
+        results: Dict[int, SimpleNamespace] = {}
+        download_session = ClientSession(timeout=ClientTimeout(total=60))
+
+        async def worker() -> None:
+            while True:
+                item = await queue.get()
+                try:
+                    if item is None:
+                        return
+                    index, f = item
+                    results[index] = await self._add_product(f, category_tree, image_limiter, download_session)
+                finally:
+                    queue.task_done()
+
+        workers: List[asyncio.Task] = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            index: int = 0
+            if hasattr(products, '__aiter__'):
+                async for f in products:
+                    await queue.put((index, f))
+                    index += 1
+            else:
+                for f in products:
+                    await queue.put((index, f))
+                    index += 1
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await download_session.close()
+
+        ok: int = sum(1 for r in results.values() if r.ok)
+        logger.info(f'Bulk upload finished: {ok}/{len(results)} products added')
+        return [results[i] for i in sorted(results)]
@@ -12,10 +12,12 @@
 """
 import asyncio
 import os
+import threading
+import time
 from pathlib import Path
 from dataclasses import dataclass, field
 from types import SimpleNamespace
-from typing import List, Dict, Any, Optional
+from typing import ClassVar, List, Dict, Any, Optional, Tuple
 
 import header
 from src import gs
@@ -43,8 +45,16 @@ class PrestaProduct(PrestaShop):
 
     Initially, I instruct the grabber to fetch data from the product page,
     and then work with the PrestaShop API.
+
+    Дерево категорий (`id -> id_parent`) загружается одним запросом и хранится `category_tree_ttl` секунд,
+    общее для всех экземпляров с тем же `api_domain`. Родительские категории вычисляются в памяти.
+    После изменения категорий в магазине вызовите `invalidate_category_tree()`.
     """
 
+    category_tree_ttl: int = 3600  # <- Время жизни кэша дерева категорий, сек.
+    _category_trees: ClassVar[Dict[str, Tuple[float, Dict[int, int]]]] = {}  # <- api_domain: (время загрузки, {id: id_parent})
+    _category_tree_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, api_key: str, api_domain: str, *args, **kwargs):
         """Initializes a Product object.
 
@@ -75,21 +85,83 @@ class PrestaProduct(PrestaShop):
         """
         return self.get_schema(resource='products', resource_id=resource_id, schema=schema)
 
+    def get_category_tree(self, refresh: bool = False) -> Dict[int, int]:
+        """Return the cached category tree, loading it with a single API request when missing or expired.
+
+        Args:
+            refresh (bool, optional): Reload the tree even if the cache is valid. Defaults to False.
+
+        Returns:
+            Dict[int, int]: `{id_category: id_parent}`. Empty dict if the tree could not be loaded.
+        """
+        with self._category_tree_lock:
+            cached: Optional[Tuple[float, Dict[int, int]]] = self._category_trees.get(self.api_domain)
+            if cached and not refresh and time.monotonic() - cached[0] < self.category_tree_ttl:
+                return cached[1]
+
+            response = self.search('categories', display='[id,id_parent]', data_format='JSON')
+            categories: list = response.get('categories', []) if isinstance(response, dict) else []
+            try:
+                tree: Dict[int, int] = {int(c['id']): int(c['id_parent']) for c in categories}
+            except (KeyError, TypeError, ValueError) as ex:
+                logger.error('Error parsing category tree: ', ex)
+                tree = {}
+            if not tree:
+                # Неудача тоже кэшируется, чтобы не повторять запрос всего дерева на каждый товар
+                logger.error('Category tree is empty. Falling back to per-category requests.')
+
+            self._category_trees[self.api_domain] = (time.monotonic(), tree)
+            logger.debug(f'Category tree loaded: {len(tree)} categories')
+            return tree
+
+    def invalidate_category_tree(self) -> None:
+        """Drop the cached category tree. The next lookup reloads it."""
+        with self._category_tree_lock:
+            self._category_trees.pop(self.api_domain, None)
+
+    def get_category_ancestors(self, id_category: int) -> List[int]:
+        """Return the parent chain of a category (nearest first), excluding the root categories (`id <= 2`).
+
+        Args:
+            id_category (int): The category ID.
+
+        Returns:
+            List[int]: Parent category IDs.
+        """
+        ancestors: List[int] = []
+        current: Optional[int] = int(id_category)
+        while current and current > 2:
+            current = self.get_parent_category(current)
+            if current is None or current <= 2 or current in ancestors:  # <- `in ancestors`: защита от цикла в дереве
+                break
+            ancestors.append(current)
+        return ancestors
+
     def get_parent_category(self, id_category: int) -> Optional[int]:
         """Retrieve parent categories from PrestaShop for a given category recursively.
 
+        The parent is taken from the cached category tree (`get_category_tree`). Categories missing
+        from the tree (e.g. created after it was loaded) are requested individually and added to it.
+
         Args:
             id_category (int): The category ID.
 
         Returns:
             Optional[int]: parent category id (int).
         """
+        tree: Dict[int, int] = self.get_category_tree()
+        if int(id_category) in tree:
+            return tree[int(id_category)]
+
         try:
             category_response: dict = self.read(
                 'categories', resource_id=id_category, display='full', data_format='JSON'
             )['categories'][0]
 
-            return int(category_response['id_parent'])
+            parent_id: int = int(category_response['id_parent'])
+            if tree:
+                tree[int(id_category)] = parent_id
+            return parent_id
         except Exception as ex:
             logger.error(f'Error retrieving category with ID {id_category}: ', ex)
             return
@@ -152,31 +224,19 @@ class PrestaProduct(PrestaShop):
 
             logger.debug(f"Поиск родителей для стартовой категории ID: {current_search_id}")
 
-            # 3. Подъем по иерархии
-            while current_search_id > 2: # Пока не дошли до корня
-                parent_id: Optional[int] = self.get_parent_category(current_search_id)
-
-                # Проверка, найден ли родитель и не является ли он корнем
-                if parent_id is not None and parent_id > 2:
-                    # 4. Проверка на дубликат перед добавлением
-                    if parent_id not in seen_ids:
-                        logger.debug(f"Найден новый родитель ID: {parent_id}. Добавление.")
-                        # 5. Добавление родителя (предполагается, что метод сам создает dict {'id': parent_id})
-                        f.additional_category_append(parent_id)
-                        # 6. Добавление ID нового родителя в множество отслеживания
-                        seen_ids.add(parent_id)
-                    else:
-                        # Дубликат найден, просто логируем и идем дальше вверх
-                        logger.debug(f"Родитель ID {parent_id} уже присутствует/добавлен.")
-
-                    # Переход к следующему родителю вверх по иерархии
-                    current_search_id = parent_id
+            # 3. Подъем по иерархии (в памяти, по кэшированному дереву категорий)
+            for parent_id in self.get_category_ancestors(current_search_id):
+                # 4. Проверка на дубликат перед добавлением
+                if parent_id not in seen_ids:
+                    logger.debug(f"Найден новый родитель ID: {parent_id}. Добавление.")
+                    # 5. Добавление родителя (предполагается, что метод сам создает dict {'id': parent_id})
+                    f.additional_category_append(parent_id)
+                    # 6. Добавление ID нового родителя в множество отслеживания
+                    seen_ids.add(parent_id)
                 else:
-                    # Родитель не найден или является корнем - завершаем подъем для этой ветки
-                    logger.debug(f"Завершение поиска родителей для ветки (родитель: {parent_id})")
-                    break # Выход из while для текущей start_cat_id_val
+                    # Дубликат найден, просто логируем и идем дальше вверх
+                    logger.debug(f"Родитель ID {parent_id} уже присутствует/добавлен.")
 
-            # Конец цикла while
         # Конец цикла for
 
         logger.debug(f"Финальный набор уникальных ID категорий: {seen_ids}")
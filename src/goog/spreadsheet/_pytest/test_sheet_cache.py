@@ -0,0 +1,204 @@
+## \file /src/goog/spreadsheet/_pytest/test_sheet_cache.py
+# -*- coding: utf-8 -*-
+
+#! .pyenv/bin/python3
+
+"""
+.. module:: src.goog.spreadsheet._pytest
+	:platform: Windows, Unix
+	:synopsis: Tests for `SheetCache` reads and diff-based `sync`.
+
+The spreadsheet is an in-memory fake of the `gspread.Spreadsheet` calls used by `SheetCache` and `WorksheetBatch`.
+Like Sheets with `USER_ENTERED`, it stores numeric strings as numbers (`'1.50'` -> `'1.5'`).
+
+#Fixtures:
+ - sheet: Fake spreadsheet.
+ - ws: Fake worksheet of `sheet`.
+ - cache: `SheetCache` with snapshots in a temporary directory.
+
+#Tests:
+ - test_first_sync_writes_everything: An empty worksheet gets every non-empty cell.
+ - test_sync_writes_only_changed_cells: Unchanged cells are not sent; changed runs are sent as ranges.
+ - test_sync_blanks_removed_cells: Cells that are no longer in the data are blanked.
+ - test_sync_without_changes_makes_no_calls: Identical data makes no write calls.
+ - test_snapshot_holds_stored_values: The snapshot holds the values as Sheets stored them.
+ - test_read_uses_snapshot_until_revision_changes: Reads are served locally until the spreadsheet changes.
+ - test_sync_into_external_batch: Changes queued into a caller's batch update the snapshot on flush.
+"""
+
+import re
+
+import pytest
+
+from src.goog.spreadsheet.sheet_cache import SheetCache
+
+
+def _rowcol(a1: str) -> tuple[int, int]:
+    letters, row = re.match(r'([A-Z]+)(\d+)', a1).groups()
+    col: int = 0
+    for letter in letters:
+        col = col * 26 + ord(letter) - 64
+    return int(row), col
+
+
+class FakeSpreadsheet:
+    """Values of one worksheet in a dict `(row, col) -> str`, 1-based."""
+
+    id = 'spreadsheet-id'
+
+    def __init__(self):
+        self.cells: dict = {}
+        self.revision: int = 0
+        self.calls: dict = {'revision': 0, 'read': 0, 'write': 0, 'batch_get': 0}
+        self.written: list = []
+
+    def get_lastUpdateTime(self) -> str:
+        self.calls['revision'] += 1
+        return str(self.revision)
+
+    def values_batch_update(self, body: dict) -> None:
+        assert body['valueInputOption'] == 'USER_ENTERED'
+        self.calls['write'] += 1
+        self.revision += 1
+        for data in body['data']:
+            row, col = _rowcol(data['range'].split('!')[1])
+            self.written.append(data['range'].split('!')[1])
+            for r, line in enumerate(data['values']):
+                for c, value in enumerate(line):
+                    self.cells[(row + r, col + c)] = self._parse(value)
+
+    def values_batch_get(self, ranges: list) -> dict:
+        self.calls['batch_get'] += 1
+        value_ranges: list = []
+        for range_name in ranges:
+            first, last = range_name.split('!')[1].split(':')
+            row, col_first = _rowcol(first)
+            _, col_last = _rowcol(last)
+            line = [self.cells.get((row, col), '') for col in range(col_first, col_last + 1)]
+            while line and line[-1] == '':
+                line.pop()
+            value_ranges.append({'range': range_name, 'values': [line]} if line else {'range': range_name})
+        return {'valueRanges': value_ranges}
+
+    def batch_update(self, body: dict) -> None:
+        self.calls['write'] += 1
+        self.revision += 1
+
+    @staticmethod
+    def _parse(value: str) -> str:
+        """`USER_ENTERED`: numbers are stored as numbers and shown without trailing zeros."""
+        try:
+            return format(float(value), 'g') if re.fullmatch(r'-?\d+\.\d+', value) else value
+        except ValueError:
+            return value
+
+
+class FakeWorksheet:
+    """Worksheet reading the cells of `FakeSpreadsheet`."""
+
+    id = 1
+    title = 'categories'
+
+    def __init__(self, sheet: FakeSpreadsheet):
+        self.sheet = sheet
+
+    def get_all_values(self) -> list[list[str]]:
+        self.sheet.calls['read'] += 1
+        filled = [key for key, value in self.sheet.cells.items() if value]
+        if not filled:
+            return []
+        rows, cols = max(r for r, _ in filled), max(c for _, c in filled)
+        return [[self.sheet.cells.get((r, c), '') for c in range(1, cols + 1)] for r in range(1, rows + 1)]
+
+
+@pytest.fixture
+def sheet():
+    """Fake spreadsheet."""
+    return FakeSpreadsheet()
+
+
+@pytest.fixture
+def ws(sheet):
+    """Fake worksheet of `sheet`."""
+    return FakeWorksheet(sheet)
+
+
+@pytest.fixture
+def cache(sheet, tmp_path):
+    """`SheetCache` with snapshots in a temporary directory."""
+    cache = SheetCache(sheet, tmp_path)
+    cache.check_interval = 0  # <- revision is checked on every read
+    return cache
+
+
+ROWS: list = [['name', 'count'], ['a', 1], ['b', 2], ['c', 3]]
+
+
+def test_first_sync_writes_everything(cache, sheet, ws):
+    """An empty worksheet gets every non-empty cell."""
+    result = cache.sync(ws, ROWS)
+    assert result.cells == 8
+    assert ws.get_all_values() == [['name', 'count'], ['a', '1'], ['b', '2'], ['c', '3']]
+
+
+def test_sync_writes_only_changed_cells(cache, sheet, ws):
+    """Unchanged cells are not sent; changed runs are sent as ranges."""
+    cache.sync(ws, ROWS)
+    sheet.written.clear()
+    result = cache.sync(ws, [['name', 'count'], ['a', 10], ['B', 20], ['c', 3]])
+    assert (result.cells, result.ranges) == (3, 2)
+    assert sheet.written == ['B2', 'A3']
+    assert ws.get_all_values()[1:3] == [['a', '10'], ['B', '20']]
+
+
+def test_sync_blanks_removed_cells(cache, sheet, ws):
+    """Cells that are no longer in the data are blanked."""
+    cache.sync(ws, ROWS)
+    result = cache.sync(ws, [['name'], ['a']])
+    assert result.cells == 6
+    assert ws.get_all_values() == [['name'], ['a']]
+
+
+def test_sync_without_changes_makes_no_calls(cache, sheet, ws):
+    """Identical data makes no write calls."""
+    cache.sync(ws, ROWS)
+    calls = dict(sheet.calls)
+    assert cache.sync(ws, ROWS).cells == 0
+    assert sheet.calls['write'] == calls['write']
+    assert sheet.calls['read'] == calls['read']  # <- the snapshot is current, no download
+
+
+def test_snapshot_holds_stored_values(cache, sheet, ws):
+    """The snapshot holds the values as Sheets stored them."""
+    cache.sync(ws, [['price'], ['1.50']])
+    assert sheet.calls['batch_get'] == 1
+    reads = sheet.calls['read']
+    assert cache.get_values(ws) == [['price'], ['1.5']]
+    assert sheet.calls['read'] == reads  # <- served from the snapshot
+
+
+def test_read_uses_snapshot_until_revision_changes(cache, sheet, ws):
+    """Reads are served locally until the spreadsheet changes."""
+    cache.sync(ws, ROWS)
+    cache.get_records(ws)
+    assert cache.get_records(ws)[0] == {'name': 'a', 'count': 1}
+    assert cache.misses == 1  # <- the first sync read the empty worksheet
+    sheet.cells[(2, 1)] = 'external'
+    sheet.revision += 1
+    assert cache.get_values(ws)[1][0] == 'external'
+    assert cache.misses == 2
+
+
+def test_sync_into_external_batch(cache, sheet, ws):
+    """Changes queued into a caller's batch update the snapshot on flush."""
+    from src.goog.spreadsheet.spreadsheet import WorksheetBatch
+
+    batch = WorksheetBatch(sheet, ws)
+    result = cache.sync(ws, ROWS, batch=batch)
+    assert result.cells == 8
+    assert sheet.calls['write'] == 0
+    batch.flush()
+    assert sheet.calls['write'] == 1
+    reads = sheet.calls['read']
+    assert cache.get_values(ws) == [['name', 'count'], ['a', '1'], ['b', '2'], ['c', '3']]
+    assert sheet.calls['read'] == reads
@@ -0,0 +1,219 @@
+## \file /src/goog/spreadsheet/sheet_cache.py
+# -*- coding: utf-8 -*-
+
+#! .pyenv/bin/python3
+
+"""
+.. module:: src.goog.spreadsheet.sheet_cache
+	:platform: Windows, Unix
+	:synopsis: Local snapshots of worksheets with revision checks and diff-based writes.
+
+Each worksheet is stored locally (memory and `gs.path.tmp / 'gsheets' / <spreadsheet_id> / <sheet_id>.json`)
+together with the spreadsheet revision (`modifiedTime` from the Drive API) it was read at.
+A read costs one revision request instead of a full download while the spreadsheet is unchanged;
+within `check_interval` seconds after the last check it costs nothing.
+A write compares the new rows with the snapshot cell by cell and pushes only the changed ranges
+in one `values.batchUpdate` (see `WorksheetBatch`). Cells that are no longer in the data are blanked,
+so the worksheet does not need `ws.clear()` before a rewrite.
+Values are written with `USER_ENTERED`, so Sheets may store them differently (`'1.50'` -> `'1.5'`, formulas,
+dates). The written ranges are therefore read back with one `values.batchGet` before the snapshot is updated.
+Pass values in the form Sheets displays them (`1.5`, not `'1.50'`), otherwise such cells differ from the snapshot
+and are rewritten on every `sync`.
+
+```python
+cache = SheetCache(spreadsheet)
+records = cache.get_records(ws)          # <- local while the spreadsheet is unchanged
+result = cache.sync(ws, [headers, *rows]) # <- only changed cells are written
+```
+"""
+
+import json
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from gspread import Spreadsheet, Worksheet
+from gspread.utils import numericise_all, rowcol_to_a1
+
+from src import gs
+from src.logger.logger import logger
+
+
+def _cell(value: Any) -> str:
+    """ Value as Google Sheets returns it in `get_all_values()`: `None` -> `''`, `True` -> `'TRUE'`. """
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    return str(value)
+
+
+class SheetCache:
+    """ Read-through cache of worksheet values for one spreadsheet.
+
+    Attributes:
+        check_interval (float): Seconds during which the last known revision is trusted without asking the API.
+        hits (int): Reads served from a snapshot.
+        misses (int): Reads that downloaded the worksheet.
+    """
+
+    check_interval: float = 5.0
+    reread_ranges: int = 100  # <- ranges per `values.batchGet` call when reading written cells back
+
+    def __init__(self, spreadsheet: Spreadsheet, path: Optional[Path] = None):
+        """
+        @param spreadsheet `gspread.Spreadsheet`.
+        @param path Directory of the snapshot files. Default `gs.path.tmp / 'gsheets' / <spreadsheet_id>`.
+        """
+        self.spreadsheet = spreadsheet
+        self.path: Path = Path(path) if path else Path(gs.path.tmp) / 'gsheets' / spreadsheet.id
+        self.hits: int = 0
+        self.misses: int = 0
+        self._snapshots: dict[int, dict] = {}
+        self._revision: Optional[str] = None
+        self._checked_at: float = 0.0
+
+    def revision(self, force: bool = False) -> Optional[str]:
+        """ Spreadsheet revision (`modifiedTime`). Requested from the API at most once per `check_interval`. """
+        if force or not self._revision or time.monotonic() - self._checked_at > self.check_interval:
+            try:
+                self._revision = self.spreadsheet.get_lastUpdateTime()
+            except Exception as ex:
+                logger.warning("Не удалось получить ревизию таблицы. Снимки будут перечитаны.", ex, False)
+                self._revision = None
+            self._checked_at = time.monotonic()
+        return self._revision
+
+    def expire(self) -> None:
+        """ Forces a revision check at the next read (after writes made outside `sync`). """
+        self._checked_at = 0.0
+
+    def _snapshot_path(self, ws: Worksheet) -> Path:
+        return self.path / f'{ws.id}.json'
+
+    def _load(self, ws: Worksheet) -> Optional[dict]:
+        snapshot: Optional[dict] = self._snapshots.get(ws.id)
+        if snapshot is None:
+            path: Path = self._snapshot_path(ws)
+            try:
+                snapshot = json.loads(path.read_text(encoding='utf-8')) if path.exists() else None
+            except (OSError, ValueError) as ex:
+                logger.debug(f"Снимок листа не прочитан: {path}", ex, False)
+                snapshot = None
+            if snapshot:
+                self._snapshots[ws.id] = snapshot
+        return snapshot
+
+    def _store(self, ws: Worksheet, values: list[list[str]], revision: Optional[str]) -> None:
+        snapshot: dict = {'title': ws.title, 'revision': revision, 'values': values}
+        self._snapshots[ws.id] = snapshot
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._snapshot_path(ws).write_text(json.dumps(snapshot, ensure_ascii=False), encoding='utf-8')
+        except OSError as ex:
+            logger.debug(f"Снимок листа не сохранен: {ws.title}", ex, False)
+
+    def get_values(self, ws: Worksheet) -> list[list[str]]:
+        """ All worksheet values (as `ws.get_all_values()`). Downloaded only if the spreadsheet changed. """
+        revision: Optional[str] = self.revision()
+        snapshot: Optional[dict] = self._load(ws)
+        if snapshot and revision and snapshot['revision'] == revision:
+            self.hits += 1
+            return [list(row) for row in snapshot['values']]
+        self.misses += 1
+        values: list[list[str]] = ws.get_all_values()
+        self._store(ws, values, revision)
+        return [list(row) for row in values]
+
+    def get_records(self, ws: Worksheet, head: int = 1) -> list[dict]:
+        """ Rows as dictionaries keyed by the header row (as `ws.get_all_records()`). """
+        values: list[list[str]] = self.get_values(ws)
+        if len(values) < head:
+            return []
+        keys: list[str] = values[head - 1]
+        return [dict(zip(keys, numericise_all(row + [''] * (len(keys) - len(row))))) for row in values[head:]]
+
+    def _read_back(self, ws: Worksheet, values: list[list[str]], written: list[tuple[int, int, int]]) -> bool:
+        """ Replaces the written cells of `values` with what Sheets stored after `USER_ENTERED` parsing.
+
+        @param ws Worksheet.
+        @param values Rows sent to the worksheet. Changed in place.
+        @param written Written ranges `(row, first column, column after the last)`, 0-based.
+        @return `False` if the values could not be read back.
+        """
+        title: str = ws.title.replace("'", "''")
+        try:
+            for start in range(0, len(written), self.reread_ranges):
+                chunk: list[tuple[int, int, int]] = written[start:start + self.reread_ranges]
+                response: dict = self.spreadsheet.values_batch_get(
+                    [f"'{title}'!{rowcol_to_a1(r + 1, c1 + 1)}:{rowcol_to_a1(r + 1, c2)}" for r, c1, c2 in chunk]
+                )
+                for (r, c1, c2), value_range in zip(chunk, response.get('valueRanges', [])):
+                    stored: list[str] = (value_range.get('values') or [[]])[0]
+                    while len(values) <= r:  # <- blanked rows below the new data
+                        values.append([])
+                    values[r].extend([''] * (c2 - len(values[r])))
+                    values[r][c1:c2] = [str(v) for v in stored] + [''] * (c2 - c1 - len(stored))
+        except Exception as ex:
+            logger.warning(f"Записанные ячейки листа '{ws.title}' не перечитаны. Снимок будет обновлен при чтении.", ex, False)
+            return False
+        return True
+
+    def sync(self, ws: Worksheet, rows: list[list[Any]], batch: Optional['WorksheetBatch'] = None) -> SimpleNamespace:
+        """ Writes `rows` starting at A1, pushing only the cells that differ from the snapshot.
+
+        Cells of the previous data outside `rows` are blanked. After the write the changed ranges
+        are read back (`values.batchGet`), so the snapshot holds the values as Sheets stored them.
+
+        @param ws Worksheet.
+        @param rows New worksheet contents, the header row included.
+        @param batch Batch to queue the changes into (for example, together with formatting).
+            The caller flushes it. By default the changes are sent immediately.
+        @return `SimpleNamespace(cells, ranges)` - changed cells and ranges queued.
+        """
+        from src.goog.spreadsheet.spreadsheet import WorksheetBatch
+
+        old: list[list[str]] = self.get_values(ws)
+        new: list[list[str]] = [[_cell(value) for value in row] for row in rows]
+        own_batch: bool = batch is None
+        batch = batch or WorksheetBatch(self.spreadsheet, ws)
+        cells: int = 0
+        ranges: int = 0
+        written: list[tuple[int, int, int]] = []  # <- (row, first column, column after the last), 0-based
+
+        for r in range(max(len(old), len(new))):
+            old_row: list[str] = old[r] if r < len(old) else []
+            new_row: list[str] = new[r] if r < len(new) else []
+            width: int = max(len(old_row), len(new_row))
+            old_row = old_row + [''] * (width - len(old_row))
+            new_row = new_row + [''] * (width - len(new_row))
+            c: int = 0
+            while c < width:
+                if old_row[c] == new_row[c]:
+                    c += 1
+                    continue
+                start: int = c
+                while c < width and old_row[c] != new_row[c]:
+                    c += 1
+                batch.update(rowcol_to_a1(r + 1, start + 1), [new_row[start:c]])
+                written.append((r, start, c))
+                cells += c - start
+                ranges += 1
+
+        def commit() -> None:
+            if not cells:
+                self._store(ws, new, self._revision)
+            elif self._read_back(ws, new, written):
+                self._store(ws, new, self.revision(force=True))
+            else:
+                self._store(ws, new, None)  # <- snapshot without revision: the next read downloads the worksheet
+
+        if own_batch:
+            if cells:
+                batch.flush()
+            commit()
+        else:
+            batch.on_flush.append(commit)
+        logger.debug(f"Лист '{ws.title}': изменено ячеек {cells}, диапазонов {ranges}")
+        return SimpleNamespace(cells=cells, ranges=ranges)
@@ -30,16 +30,182 @@ if __name__ == "__main__":
 """ 
 """
 
+import json
+import time
 from pathlib import Path
+from types import SimpleNamespace
 import gspread
 from gspread import Spreadsheet, Worksheet
+from gspread.utils import a1_range_to_grid_range, a1_to_rowcol, rowcol_to_a1
 from oauth2client.service_account import ServiceAccountCredentials
 import pandas as pd
 from src.logger.logger import logger
 from src import gs
+from src.goog.spreadsheet.sheet_cache import SheetCache
 from src.utils.printer import pprint
 
 
+class WorksheetBatch:
+    """ Batched writes to one worksheet.
+
+    Value updates and format requests are collected in memory and sent by `flush()`:
+    values with `values.batchUpdate`, formatting with `spreadsheets.batchUpdate`.
+    Payloads larger than `max_cells` / `max_payload_bytes` / `max_requests` are split into several calls.
+    Calls rejected with 429 (quota) or 5xx are retried with exponential backoff.
+    Used as a context manager, the batch is flushed on exit without an exception.
+
+    ```python
+    with spreadsheet.batch(ws) as batch:
+        batch.update('A2', rows)                 # <- all rows in one range
+        batch.set_column_width('A:Y', 200)
+        batch.format('A1:Y1', {'textFormat': {'bold': True}})
+    # 2 API calls instead of len(rows) + 27
+    ```
+    """
+
+    max_cells: int = 50_000  # <- cells per `values.batchUpdate` call
+    max_payload_bytes: int = 2_000_000  # <- estimated JSON size per `values.batchUpdate` call
+    max_requests: int = 500  # <- requests per `spreadsheets.batchUpdate` call
+    retries: int = 5  # <- attempts after 429/5xx
+    retry_delay: float = 2.0  # <- first backoff delay, seconds (doubled on each attempt)
+    value_input_option: str = 'USER_ENTERED'
+
+    def __init__(self, spreadsheet: Spreadsheet, worksheet: Worksheet):
+        """
+        @param spreadsheet `gspread.Spreadsheet` the worksheet belongs to.
+        @param worksheet Worksheet to write to.
+        """
+        self.spreadsheet = spreadsheet
+        self.worksheet = worksheet
+        self._values: list[tuple[int, int, list]] = []  # <- (row, col, values) of the top-left cell
+        self._requests: list[dict] = []
+        self.calls: int = 0
+        self.on_flush: list = []  # <- callbacks after a successful flush (for example, `SheetCache` snapshot update)
+
+    def __enter__(self) -> 'WorksheetBatch':
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def update(self, range_name: str, values: list[list]) -> 'WorksheetBatch':
+        """ Queue values starting at the top-left cell of `range_name` (`'A2'` or `'A2:Y501'`).
+        @param range_name Range in A1 notation.
+        @param values Rows of values.
+        """
+        if values:
+            row, col = a1_to_rowcol(range_name.split(':')[0])
+            self._values.append((row, col, values))
+        return self
+
+    def request(self, request: dict) -> 'WorksheetBatch':
+        """ Queue a raw `spreadsheets.batchUpdate` request. """
+        self._requests.append(request)
+        return self
+
+    def _dimension_range(self, dimension: str, span: str) -> dict:
+        """ `'A:C'`, `'B'` (columns) or `'1:1'`, `'3'` (rows) -> `DimensionRange`. """
+        first, _, last = span.partition(':')
+        last = last or first
+        if dimension == 'COLUMNS':
+            start, end = a1_to_rowcol(f'{first}1')[1], a1_to_rowcol(f'{last}1')[1]
+        else:
+            start, end = int(first), int(last)
+        return {'sheetId': self.worksheet.id, 'dimension': dimension, 'startIndex': start - 1, 'endIndex': end}
+
+    def set_column_width(self, columns: str, width: int) -> 'WorksheetBatch':
+        """ Queue column width. @param columns `'A'` or `'A:Y'`. @param width Width in pixels. """
+        return self.request({'updateDimensionProperties': {
+            'range': self._dimension_range('COLUMNS', columns),
+            'properties': {'pixelSize': width},
+            'fields': 'pixelSize',
+        }})
+
+    def set_row_height(self, rows: str, height: int) -> 'WorksheetBatch':
+        """ Queue row height. @param rows `'1'` or `'1:3'`. @param height Height in pixels. """
+        return self.request({'updateDimensionProperties': {
+            'range': self._dimension_range('ROWS', rows),
+            'properties': {'pixelSize': height},
+            'fields': 'pixelSize',
+        }})
+
+    def format(self, range_name: str, cell_format: dict) -> 'WorksheetBatch':
+        """ Queue cell formatting (`CellFormat` of the Sheets API) for `range_name`.
+        @param range_name Range in A1 notation.
+        @param cell_format For example `{'textFormat': {'bold': True}, 'horizontalAlignment': 'CENTER'}`.
+        """
+        grid_range: dict = {'sheetId': self.worksheet.id, **a1_range_to_grid_range(range_name)}
+        return self.request({'repeatCell': {
+            'range': grid_range,
+            'cell': {'userEnteredFormat': cell_format},
+            'fields': f"userEnteredFormat({','.join(cell_format)})",
+        }})
+
+    def _chunks(self):
+        """ Split queued values into `values.batchUpdate` data lists under the cell and payload limits. """
+        title: str = self.worksheet.title.replace("'", "''")
+        data: list[dict] = []
+        next_cell: tuple | None = None  # <- cell right below the last queued row
+        cells: int = 0
+        size: int = 0
+        for row, col, values in self._values:
+            for offset, line in enumerate(values):
+                line_size: int = len(json.dumps(line, ensure_ascii=False, default=str))
+                if data and (cells + len(line) > self.max_cells or size + line_size > self.max_payload_bytes):
+                    yield data
+                    data, next_cell, cells, size = [], None, 0, 0
+                # Consecutive rows stay in one range: a new range starts at another anchor or after a split
+                if next_cell == (row + offset, col):
+                    data[-1]['values'].append(line)
+                else:
+                    data.append({'range': f"'{title}'!{rowcol_to_a1(row + offset, col)}", 'values': [line]})
+                next_cell = (row + offset + 1, col)
+                cells += len(line)
+                size += line_size
+        if data:
+            yield data
+
+    def _execute(self, func, body: dict):
+        """ Call the API, retrying on 429 and 5xx with exponential backoff (`Retry-After` if present). """
+        delay: float = self.retry_delay
+        for attempt in range(self.retries + 1):
+            try:
+                self.calls += 1
+                return func(body)
+            except gspread.exceptions.APIError as ex:
+                response = getattr(ex, 'response', None)
+                status: int = getattr(response, 'status_code', 0)
+                if attempt == self.retries or not (status == 429 or status >= 500):
+                    raise
+                retry_after: str = (getattr(response, 'headers', None) or {}).get('Retry-After', '')
+                wait: float = float(retry_after) if retry_after.isdigit() else delay
+                logger.warning(f"Google Sheets API {status}. Повтор через {wait} сек.", None, False)
+                time.sleep(wait)
+                delay *= 2
+
+    def flush(self) -> SimpleNamespace:
+        """ Send queued values and format requests.
+        @return `SimpleNamespace(calls, cells, requests)` - API calls made (with retries), cells written, format requests sent.
+        """
+        calls_before: int = self.calls
+        cells: int = 0
+        for data in self._chunks():
+            cells += sum(len(line) for entry in data for line in entry['values'])
+            self._execute(self.spreadsheet.values_batch_update, {'valueInputOption': self.value_input_option, 'data': data})
+        requests: int = len(self._requests)
+        for start in range(0, requests, self.max_requests):
+            self._execute(self.spreadsheet.batch_update, {'requests': self._requests[start:start + self.max_requests]})
+        self._values.clear()
+        self._requests.clear()
+        for callback in self.on_flush:
+            callback()
+        self.on_flush.clear()
+        result = SimpleNamespace(calls=self.calls - calls_before, cells=cells, requests=requests)
+        logger.debug(f"Worksheet '{self.worksheet.title}': {result.cells} cells, {result.requests} format requests, {result.calls} API calls")
+        return result
+
+
 class SpreadSheet:
     """ Class for working with Google Sheets.
 
@@ -141,6 +307,45 @@ class SpreadSheet:
             logger.error(f"Ошибка создания нового листа {title}")
             
     
+    def batch(self, worksheet: str | Worksheet) -> WorksheetBatch:
+        """ Batched writes to a worksheet: values and formatting are sent in one or a few API calls.
+
+        @param worksheet Worksheet or its name.
+        @return `WorksheetBatch`. Use as a context manager or call `flush()`.
+        """
+        ws: Worksheet = worksheet if isinstance(worksheet, Worksheet) else self.get_worksheet(worksheet)
+        batch = WorksheetBatch(self.spreadsheet, ws)
+        batch.on_flush.append(self.cache.expire)
+        return batch
+
+    @property
+    def cache(self) -> SheetCache:
+        """ Local snapshots of the worksheets of this spreadsheet. Created on first access. """
+        if getattr(self, '_cache', None) is None:
+            self._cache = SheetCache(self.spreadsheet)
+        return self._cache
+
+    def get_values(self, worksheet: str | Worksheet) -> list[list[str]]:
+        """ All values of the worksheet. Served from the local snapshot while the spreadsheet is unchanged. """
+        ws: Worksheet = worksheet if isinstance(worksheet, Worksheet) else self.get_worksheet(worksheet)
+        return self.cache.get_values(ws)
+
+    def get_records(self, worksheet: str | Worksheet) -> list[dict]:
+        """ Cached equivalent of `ws.get_all_records()`. """
+        ws: Worksheet = worksheet if isinstance(worksheet, Worksheet) else self.get_worksheet(worksheet)
+        return self.cache.get_records(ws)
+
+    def sync_values(self, worksheet: str | Worksheet, rows: list[list], batch: WorksheetBatch | None = None) -> SimpleNamespace:
+        """ Write `rows` from A1, pushing only the cells that differ from the snapshot (see `SheetCache.sync`).
+
+        @param worksheet Worksheet or its name.
+        @param rows New contents, the header row included.
+        @param batch Batch to queue the changes into. By default they are sent immediately.
+        @return `SimpleNamespace(cells, ranges)`.
+        """
+        ws: Worksheet = worksheet if isinstance(worksheet, Worksheet) else self.get_worksheet(worksheet)
+        return self.cache.sync(ws, rows, batch)
+
     def copy_worksheet(self, from_worksheet: str, to_worksheet: str):
         """ Copy worksheet by name."""
         ...
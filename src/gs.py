@@ -15,4 +15,4 @@ from header import __root__
 from src.utils.jjson import j_loads_ns
 from pathlib import Path
 
-gs = j_loads_ns(__root__ / 'src' / 'config.json')
\ No newline at end of file
+gs = j_loads_ns(__root__ / 'src' / 'config.json', use_cache=True)
\ No newline at end of file
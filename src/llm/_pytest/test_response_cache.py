@@ -0,0 +1,99 @@
+## \file /src/llm/_pytest/test_response_cache.py
+# -*- coding: utf-8 -*-
+
+#! .pyenv/bin/python3
+
+"""
+.. module:: src.llm._pytest
+	:platform: Windows, Unix
+	:synopsis: Tests for `LLMResponseCache`.
+
+#Fixtures:
+ - clock: Controllable `time.time` of the cache module.
+ - cache: Cache in a temporary SQLite file, eviction on every write.
+
+#Tests:
+ - test_make_key: The key depends on every part of the request.
+ - test_put_get: A stored response is returned; empty responses are not stored.
+ - test_ttl: An entry older than `ttl` is not returned and is removed by eviction.
+ - test_max_entries_evicts_least_recently_used: Above `max_entries` the least recently read entries are removed.
+ - test_persists_between_instances: A new instance reads the responses of the previous one.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.llm import response_cache
+from src.llm.response_cache import LLMResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable `time.time` of the cache module."""
+    now = SimpleNamespace(value=1_000_000.0)
+    monkeypatch.setattr(response_cache, 'time', SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    """Cache in a temporary SQLite file, eviction on every write."""
+    cache = LLMResponseCache(tmp_path / 'responses.sqlite3', ttl=100, max_entries=3)
+    cache.EVICT_EVERY = 1
+    yield cache
+    cache.close()
+
+
+def test_make_key():
+    """The key depends on every part of the request."""
+    key = LLMResponseCache.make_key('model', 'system', {'temperature': 0}, 'prompt')
+    assert key == LLMResponseCache.make_key('model', 'system', {'temperature': 0}, 'prompt')
+    assert key != LLMResponseCache.make_key('other', 'system', {'temperature': 0}, 'prompt')
+    assert key != LLMResponseCache.make_key('model', None, {'temperature': 0}, 'prompt')
+    assert key != LLMResponseCache.make_key('model', 'system', {'temperature': 1}, 'prompt')
+    assert key != LLMResponseCache.make_key('model', 'system', {'temperature': 0}, 'prompt 2')
+
+
+def test_put_get(cache):
+    """A stored response is returned; empty responses are not stored."""
+    assert cache.get('k') is None
+    assert cache.put('k', 'response', model='model')
+    assert cache.get('k') == 'response'
+    assert not cache.put('empty', '')
+    assert cache.stats() == {'entries': 1, 'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+
+
+def test_ttl(cache, clock):
+    """An entry older than `ttl` is not returned and is removed by eviction."""
+    cache.put('old', 'response')
+    clock.value += 101
+    assert cache.get('old') is None
+    cache.put('new', 'response')  # <- eviction runs on this write
+    assert cache.stats()['entries'] == 1
+    assert cache.get('new') == 'response'
+
+
+def test_max_entries_evicts_least_recently_used(cache, clock):
+    """Above `max_entries` the least recently read entries are removed."""
+    for n in range(3):
+        clock.value += 1
+        cache.put(f'k{n}', f'r{n}')
+    clock.value += 1
+    cache.get('k0')  # <- k1 becomes the least recently used
+    clock.value += 1
+    cache.put('k3', 'r3')
+    assert cache.stats()['entries'] == 3
+    assert cache.get('k1') is None
+    assert [cache.get(key) for key in ('k0', 'k2', 'k3')] == ['r0', 'r2', 'r3']
+
+
+def test_persists_between_instances(tmp_path, clock):
+    """A new instance reads the responses of the previous one."""
+    path = tmp_path / 'responses.sqlite3'
+    first = LLMResponseCache(path)
+    first.put('k', 'response')
+    first.close()
+    second = LLMResponseCache(path)
+    assert second.get('k') == 'response'
+    second.close()
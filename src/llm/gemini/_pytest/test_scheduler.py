@@ -0,0 +1,182 @@
+## \file /src/llm/gemini/_pytest/test_scheduler.py
+# -*- coding: utf-8 -*-
+
+#! .pyenv/bin/python3
+
+"""
+.. module:: src.llm.gemini._pytest
+	:platform: Windows, Unix
+	:synopsis: Tests for `RequestScheduler` and `TokenBucket`.
+
+#Tests:
+ - test_token_bucket_queues_reservations: Reservations over the capacity wait for the refill in order.
+ - test_token_bucket_adjust: `adjust` charges the difference between the estimate and the real usage.
+ - test_retry_after: The delay is taken from the API error text.
+ - test_max_in_flight: No more than `max_in_flight` requests run at once.
+ - test_interactive_priority: A waiting interactive request is served before waiting batch requests.
+ - test_cancelled_waiter_releases_slot: A cancelled waiter does not hold a slot.
+ - test_backoff_pauses_new_requests: `backoff` delays the next request.
+ - test_slot_sync: The synchronous slot shares the limit with the asynchronous one.
+ - test_get_scheduler_is_shared: One scheduler per model name.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.llm.gemini.scheduler import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    RequestScheduler,
+    TokenBucket,
+    get_scheduler,
+    retry_after,
+)
+
+
+def test_token_bucket_queues_reservations():
+    """Reservations over the capacity wait for the refill in order."""
+    bucket = TokenBucket(60)  # <- 1 per second
+    now = time.monotonic()
+    assert bucket.reserve(60, now) == 0.0
+    assert bucket.reserve(30, now) == pytest.approx(30.0)
+    assert bucket.reserve(30, now) == pytest.approx(60.0)
+    assert bucket.reserve(1, now + 61) == pytest.approx(0.0, abs=1.0)
+
+
+def test_token_bucket_adjust():
+    """`adjust` charges the difference between the estimate and the real usage."""
+    bucket = TokenBucket(100)
+    now = time.monotonic()
+    bucket.reserve(10, now)
+    bucket.adjust(40, now)
+    assert bucket.level == pytest.approx(50.0)
+    bucket.adjust(-20, now)
+    assert bucket.level == pytest.approx(70.0)
+
+
+def test_retry_after():
+    """The delay is taken from the API error text."""
+    assert retry_after(Exception('Please retry in 37.5s'), 5) == 37.5
+    assert retry_after(Exception('retry_delay {\n  seconds: 12\n}'), 5) == 12
+    assert retry_after(Exception('quota exceeded'), 5) == 5
+
+
+def test_max_in_flight():
+    """No more than `max_in_flight` requests run at once."""
+    scheduler = RequestScheduler('test-in-flight', rpm=10_000, tpm=10**9, max_in_flight=2)
+    running: list = []
+    peak: list = [0]
+
+    async def job():
+        async with scheduler.slot():
+            running.append(1)
+            peak[0] = max(peak[0], len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+    async def main():
+        await asyncio.gather(*(job() for _ in range(6)))
+
+    asyncio.run(main())
+    assert peak[0] == 2
+    assert scheduler.stats['requests'] == 6
+    assert scheduler._in_flight == 0
+
+
+def test_interactive_priority():
+    """A waiting interactive request is served before waiting batch requests."""
+    scheduler = RequestScheduler('test-priority', rpm=10_000, tpm=10**9, max_in_flight=1)
+    order: list = []
+
+    async def job(name: str, priority: int):
+        async with scheduler.slot(priority=priority):
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        tasks = [asyncio.create_task(job(f'batch{n}', PRIORITY_BATCH)) for n in range(3)]
+        await asyncio.sleep(0.001)  # <- batch0 runs, batch1 and batch2 wait
+        tasks.append(asyncio.create_task(job('interactive', PRIORITY_INTERACTIVE)))
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert order == ['batch0', 'interactive', 'batch1', 'batch2']
+
+
+def test_cancelled_waiter_releases_slot():
+    """A cancelled waiter does not hold a slot."""
+    scheduler = RequestScheduler('test-cancel', rpm=10_000, tpm=10**9, max_in_flight=1)
+
+    async def job(delay: float):
+        async with scheduler.slot():
+            await asyncio.sleep(delay)
+
+    async def main():
+        first = asyncio.create_task(job(0.02))
+        await asyncio.sleep(0.001)
+        waiting = asyncio.create_task(job(0))
+        await asyncio.sleep(0.001)
+        waiting.cancel()
+        await first
+        await asyncio.wait_for(job(0), timeout=1)
+
+    asyncio.run(main())
+    assert scheduler._in_flight == 0
+    assert not [w for w in scheduler._waiters if not w[2].cancelled]
+
+
+def test_backoff_pauses_new_requests():
+    """`backoff` delays the next request."""
+    scheduler = RequestScheduler('test-backoff', rpm=10_000, tpm=10**9)
+
+    async def main() -> float:
+        scheduler.backoff(0.1)
+        start = time.monotonic()
+        async with scheduler.slot():
+            return time.monotonic() - start
+
+    assert asyncio.run(main()) >= 0.09
+    assert scheduler.stats['backoffs'] == 1
+    assert scheduler.stats['throttled'] == 1
+
+
+def test_slot_sync():
+    """The synchronous slot shares the limit with the asynchronous one."""
+    scheduler = RequestScheduler('test-sync', rpm=10_000, tpm=10**9, max_in_flight=1)
+    inside = threading.Event()
+    release = threading.Event()
+
+    def worker():
+        with scheduler.slot_sync():
+            inside.set()
+            release.wait(1)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    inside.wait(1)
+
+    async def main() -> bool:
+        task = asyncio.create_task(asyncio.wait_for(_enter_and_leave(), timeout=1))
+        await asyncio.sleep(0.02)
+        blocked = not task.done()
+        release.set()
+        await task
+        return blocked
+
+    async def _enter_and_leave():
+        async with scheduler.slot():
+            pass
+
+    assert asyncio.run(main())
+    thread.join(1)
+    assert scheduler._in_flight == 0
+
+
+def test_get_scheduler_is_shared():
+    """One scheduler per model name."""
+    first = get_scheduler('test-shared-model', {'max_in_flight': 3})
+    assert get_scheduler('test-shared-model') is first
+    assert first.max_in_flight == 3
@@ -19,7 +19,8 @@ import requests
 import http
 from io import IOBase
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from collections import deque
+from typing import Optional, Dict, List, Any, Callable
 from types import SimpleNamespace
 import base64
 
@@ -45,10 +46,19 @@ from src import gs
 
 from src.utils.file import read_text_file, save_text_file
 from src.utils.date_time import TimeoutCheck
-from src.utils.jjson import j_loads, j_loads_ns, j_dumps
+from src.utils.jjson import j_loads, j_loads_ns, j_dumps, JsonlWriter, jl_iter
 from src.utils.image import get_image_bytes
 from src.utils.string.ai_string_utils import normalize_answer, string_for_train
 from src.utils.printer import pprint as print # Используется кастомный print
+from src.llm.gemini.scheduler import (
+    RequestScheduler,
+    get_scheduler,
+    estimate_tokens,
+    retry_after,
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+)
+from src.llm.response_cache import llm_cache
 from src.logger import logger
 
 timeout_check = TimeoutCheck()
@@ -72,9 +82,16 @@ class GoogleGenerativeAi:
         timestamp (str): Текущая временная метка для именования файлов истории.
         model (Any): Инициализированный клиент модели `genai.GenerativeModel`.
         _chat (Any): Активный сеанс чата с моделью.
-        chat_history (List[Dict]): История текущего диалога в памяти.
+        chat_history (List[Dict]): Окно последних сообщений диалога в памяти (не более `history_window`).
         chat_name (str): Имя текущего чата для сохранения истории.
-        history_json_file (Path): Путь к JSON файлу с историей текущего чата.
+        history_json_file (Path): Путь к JSONL файлу с историей текущего чата (сообщения дописываются в конец).
+        history_window (int): Максимум сообщений в памяти и в контексте чата.
+        history_snapshot_every (int): Через сколько сообщений сохраняется снимок окна для быстрой загрузки.
+        on_history_trim (Optional[Callable]): Обработчик сообщений, вытесненных из окна. Может вернуть
+            сообщение-резюме (`{'role': 'user', 'parts': [...]}`), которое встанет в начало окна.
+        priority (int): Приоритет запросов `ask`/`ask_async` в планировщике. `chat` всегда интерактивный.
+        scheduler (RequestScheduler): Общий для модели планировщик запросов (`src.llm.gemini.scheduler`).
+        use_cache (bool): Использовать кэш ответов `ask`/`ask_async` (`src.llm.response_cache`).
         # dialogue_txt_path (Path): (Не используется активно в текущей логике, но объявлено)
         # history_txt_file (Path): (Не используется активно в текущей логике, но объявлено)
     """
@@ -84,6 +101,9 @@ class GoogleGenerativeAi:
     system_instruction: str
     model_name: str = config.model_name
     model: 'genai.GenerativeModel'
+    priority: int = PRIORITY_BATCH
+    scheduler: RequestScheduler
+    use_cache: bool = False
 
     timestamp: str
     _chat: Any
@@ -91,6 +111,9 @@ class GoogleGenerativeAi:
     chat_session_name: str = gs.now
     history_dir: Path = Path()
     history_json_file: Path = Path()
+    history_window: int = 200  # <- сообщений в памяти и в контексте чата
+    history_snapshot_every: int = 100  # <- снимок окна после стольких новых сообщений
+    on_history_trim: Optional[Callable[[List[Dict]], Optional[Dict]]] = None
     dialogue_txt_path: Path = Path() 
     history_txt_file: Path = Path() 
 
@@ -101,6 +124,8 @@ class GoogleGenerativeAi:
         model_name: str,
         generation_config: Optional[Dict] = {'response_mime_type': 'text/plain'},
         system_instruction: Optional[str] = None,
+        priority: int = PRIORITY_BATCH,
+        use_cache: bool = False,
     ):
         """
         Инициализирует экземпляр класса GoogleGenerativeAi.
@@ -112,15 +137,27 @@ class GoogleGenerativeAi:
                                                 По умолчанию `{'response_mime_type': 'text/plain'}`.
             system_instruction (Optional[str], optional): Системная инструкция для модели.
                                                          По умолчанию `None`.
+            priority (int, optional): Приоритет запросов в планировщике: `PRIORITY_BATCH` (по умолчанию)
+                                      или `PRIORITY_INTERACTIVE`.
+            use_cache (bool, optional): Кэшировать ответы `ask`/`ask_async`. По умолчанию `False`.
         """
         
         self.api_key = api_key
         self.model_name = model_name 
         self.generation_config = generation_config
         self.system_instruction = system_instruction
+        self.priority = priority
+        self.use_cache = use_cache
+        self.scheduler = get_scheduler(self.model_name, self._rate_limits())
 
         self.history_dir = Path(__root__, gs.path.external_storage, 'chats')
         self.timestamp = gs.now
+        self.chat_history = []
+        self._history_writer: Optional[JsonlWriter] = None
+        self._history_count: int = 0  # <- сообщений в журнале
+        self._history_first: int = 0  # <- номер в журнале первого сообщения окна
+        self._history_snapshot_at: int = 0  # <- `_history_count` на момент последнего снимка
+        self._history_path: Optional[Path] = None  # <- журнал, загруженный `_load_chat_history`: сообщения дописываются в него
 
 
         try:
@@ -144,6 +181,27 @@ class GoogleGenerativeAi:
         ...
 
 
+    def _rate_limits(self) -> dict:
+        """Лимиты модели из раздела `rate_limits` файла `gemini.json` (или `default`)."""
+        rate_limits: Optional[SimpleNamespace] = getattr(self.config, 'rate_limits', None)
+        if not rate_limits:
+            return {}
+        limits: Optional[SimpleNamespace] = getattr(rate_limits, self.model_name, None) or getattr(rate_limits, 'default', None)
+        return vars(limits) if limits else {}
+
+    def _charge_usage(self, response: Any, estimated_tokens: int) -> None:
+        """Сообщает планировщику фактический расход токенов из `usage_metadata`."""
+        usage: Any = getattr(response, 'usage_metadata', None)
+        total_tokens: int = getattr(usage, 'total_token_count', 0) if usage else 0
+        if total_tokens:
+            self.scheduler.charge(total_tokens - estimated_tokens)
+
+    def _cache_key(self, q: Any, use_cache: Optional[bool]) -> Optional[str]:
+        """Ключ кэша ответа или `None`, если кэш для вызова выключен."""
+        if not (self.use_cache if use_cache is None else use_cache):
+            return None
+        return llm_cache.make_key(self.model_name, self.system_instruction, self.generation_config, str(q))
+
     def _start_chat(self,system_instruction: Optional[str] = '') -> Any: # Возвращаемый тип Any, т.к. genai.ChatSession не экспортируется явно
         """
         Функция запускает новый сеанс чата с моделью.
@@ -161,46 +219,105 @@ class GoogleGenerativeAi:
             return self.model.start_chat(history=[])
 
 
-    async def _save_chat_history(self) -> bool:
+    def _history_files(self) -> tuple[Path, Path]:
+        """Пути к журналу (JSONL) и снимку окна текущего чата. После загрузки журнала - пути загруженного журнала."""
+        history_file: Path = self._history_path or Path(self.history_dir, f'{self.chat_session_name}-{self.timestamp}.jsonl')
+        return history_file, history_file.with_name(history_file.name.replace('.jsonl', '.snapshot.json'))
+
+    async def _save_chat_history(self, messages: Optional[List[Dict]] = None) -> bool:
         """
-        Функция асинхронно сохраняет текущую историю чата в JSON файл.
+        Функция дописывает новые сообщения в журнал чата (JSONL).
 
-        Имя файла формируется из `chat_name` и `timestamp`.
+        Существующий журнал не перечитывается и не перезаписывается, поэтому время сохранения
+        не зависит от длины диалога. Каждые `history_snapshot_every` сообщений окно `chat_history`
+        сохраняется в снимок (`<chat>.snapshot.json`), из которого чат загружается без чтения всего журнала.
+
+        Args:
+            messages (Optional[List[Dict]]): Новые сообщения. По умолчанию - последний обмен (2 сообщения).
 
         Returns:
             bool: `True` в случае успешного сохранения, `False` при ошибке.
         """
-        json_file_name: str = f'{self.chat_session_name}-{self.timestamp}.json'
-        self.history_json_file = Path(self.history_dir, json_file_name)
+        messages = messages if messages is not None else self.chat_history[-2:]
+        history_file, snapshot_file = self._history_files()
+
+        if self._history_writer is None or self._history_writer.path != history_file:
+            if self._history_writer:
+                self._history_writer.close()
+            self._history_writer = JsonlWriter(history_file, flush_every=1)
+            self.history_json_file = history_file
+
+        for message in messages:
+            if not self._history_writer.write(message):
+                logger.error(f"Ошибка сохранения истории чата в файл {self.history_json_file=}", None, False)
+                return False
+        self._history_count += len(messages)
+
+        self._trim_history()
+        if self._history_count - self._history_snapshot_at >= self.history_snapshot_every:
+            snapshot: dict = {
+                'messages': self._history_count,
+                'first': self._history_first,
+                'offset': history_file.stat().st_size,  # <- сообщения после снимка читаются с этой позиции журнала
+                'window': self.chat_history,
+            }
+            if j_dumps(snapshot, snapshot_file, mode='w'):
+                self._history_snapshot_at = self._history_count
+        return True
 
-        # Создание директории, если она не существует
-        try:
-            self.history_dir.mkdir(parents=True, exist_ok=True)
-        except Exception as ex:
-            logger.error(f'Не удалось создать директорию для истории чата: {self.history_dir}', ex)
-            return False
+    def _trim_history(self) -> None:
+        """
+        Вытесняет старые сообщения, если окно превысило `history_window`.
 
-        if not j_dumps(data=self.chat_history, file_path=self.history_json_file, mode='w'):
-            logger.error(f"Ошибка сохранения истории чата в файл {self.history_json_file=}", None, False)
-            return False
-        logger.info(f"История чата сохранена в файл {self.history_json_file=}", None, False)
-        return True
+        Окно сокращается примерно до 3/4 `history_window` так, чтобы оно начиналось с вопроса пользователя,
+        поэтому контекст чата перестраивается не на каждом сообщении.
+        Вытесненные сообщения остаются в журнале и доступны через `get_older_history`.
+        """
+        if len(self.chat_history) <= self.history_window:
+            return
+        drop: int = len(self.chat_history) - self.history_window * 3 // 4
+        while drop < len(self.chat_history) and self.chat_history[drop].get('role') != 'user':
+            drop += 1
+        dropped: List[Dict] = self.chat_history[:drop]
+        self.chat_history = self.chat_history[drop:]
+        summary: Optional[Dict] = None
+        if self.on_history_trim:
+            try:
+                summary = self.on_history_trim(dropped)
+            except Exception as ex:
+                logger.error('Ошибка обработчика on_history_trim', ex, False)
+        self._history_first += sum(1 for message in dropped if not message.get('summary'))
+        if summary:
+            self.chat_history.insert(0, {**summary, 'summary': True})
+        self._replay_history()
+
+    def _replay_history(self) -> None:
+        """Перезапускает чат с окном `chat_history` в качестве контекста."""
+        self._chat = self._start_chat() # Начинаем с чистого чата (возможно, с system prompt)
+        for entry in self.chat_history:
+            # Проверка на валидность роли (должна быть 'user' или 'model')
+            if entry.get('role') in ('user', 'model') and isinstance(entry.get('parts'), list):
+                self._chat.history.append({'role': entry['role'], 'parts': entry['parts']})
+            else:
+                logger.warning(f"Пропуск записи истории с некорректным форматом: {entry}")
 
     async def _load_chat_history(self, chat_data_folder: Optional[str | Path]) -> None:
         """
-        Функция асинхронно загружает историю чата из JSON файла.
+        Функция асинхронно загружает историю чата.
 
-        Опционально принимает путь к папке с данными чата. Если указан,
-        использует 'history.json' из этой папки. Иначе использует
-        текущий `self.history_json_file`.
+        Для журнала JSONL загружается последний снимок окна и сообщения, дописанные после него;
+        более старые сообщения не читаются (см. `get_older_history`). Новые сообщения дописываются в этот же журнал.
+        JSON файл старого формата (полный список сообщений) загружается целиком, в окно попадают последние `history_window`.
+        Окно записывается в начало нового журнала текущего чата, и счетчики журнала отсчитываются от него:
+        сообщения старше окна остаются только в JSON файле.
 
         Args:
             chat_data_folder (Optional[str | Path]): Путь к папке с файлом 'history.json'.
+                По умолчанию используется текущий `self.history_json_file`.
 
         Returns:
             None
         """
-        history_to_load: Optional[List[Dict]] = None
         target_file: Path = self.history_json_file # По умолчанию используем текущий файл
 
         try:
@@ -208,49 +325,99 @@ class GoogleGenerativeAi:
                 # Если указана папка, формируем путь к history.json в ней
                 target_file = Path(chat_data_folder, 'history.json')
 
-            if target_file.exists():
-                history_to_load = j_loads(target_file)
-                if history_to_load is not None:
-                    self.chat_history = history_to_load
-                    # Перезапускаем чат с загруженной историей
-                    self._chat = self._start_chat() # Начинаем с чистого чата (возможно, с system prompt)
-                    # Добавляем загруженные сообщения в историю сеанса _chat
-                    for entry in self.chat_history:
-                        # Проверка на валидность роли (должна быть 'user' или 'model')
-                        if entry.get('role') in ('user', 'model'):
-                             # Убедимся, что parts существует и является списком
-                             if isinstance(entry.get('parts'), list):
-                                 self._chat.history.append(entry)
-                             else:
-                                 logger.warning(f"Пропуск записи истории с некорректным форматом 'parts': {entry}")
-                        else:
-                            logger.warning(f"Пропуск записи истории с некорректной ролью: {entry}")
-
-                    logger.info(f"История чата ({len(self.chat_history)} сообщений) загружена из файла. \n{target_file=}", None, False)
-                else:
-                     logger.error(f"Файл истории {target_file=} пуст или содержит некорректные данные.", None, False)
-            else:
+            if not target_file.is_file():
                 logger.info(f"Файл истории {target_file=} не найден. Новая история будет создана.", None, False)
                 self.chat_history = [] # Убедимся, что история пуста, если файл не найден
                 self._chat = self._start_chat() # Начинаем новый чат
+                return
+
+            if target_file.suffix != '.jsonl':
+                history: Any = j_loads(target_file)
+                if not isinstance(history, list):
+                    logger.error(f"Файл истории {target_file=} пуст или содержит некорректные данные.", None, False)
+                    return
+                self.chat_history = history[-self.history_window:]
+                self._history_path = None
+                self._history_count = self._history_first = self._history_snapshot_at = 0
+                if not await self._save_chat_history(list(self.chat_history)):
+                    logger.warning(f"Окно истории из {target_file=} не записано в новый журнал.", None, False)
+            else:
+                snapshot_file: Path = target_file.with_name(target_file.name.replace('.jsonl', '.snapshot.json'))
+                snapshot: Any = j_loads(snapshot_file) if snapshot_file.is_file() else None
+                window: List[Dict] = []
+                offset: int = 0
+                self._history_count = self._history_first = 0
+                if isinstance(snapshot, dict):
+                    window = list(snapshot.get('window') or [])
+                    offset = snapshot.get('offset', 0)
+                    self._history_count = snapshot.get('messages', 0)
+                    self._history_first = snapshot.get('first', 0)
+                with target_file.open('r', encoding='utf-8') as f:
+                    f.seek(offset)
+                    for line in f:
+                        try:
+                            window.append(json.loads(line))
+                            self._history_count += 1
+                        except json.JSONDecodeError:
+                            continue  # <- недописанная строка после аварийного завершения
+                self.chat_history = window
+                self._history_snapshot_at = self._history_count
+                self.history_json_file = self._history_path = target_file
+                if len(self.chat_history) > self.history_window:
+                    self._trim_history()
+                    logger.info(f"История чата ({len(self.chat_history)} из {self._history_count} сообщений) загружена из файла. \n{target_file=}", None, False)
+                    return
+
+            self._replay_history()
+            logger.info(f"История чата ({len(self.chat_history)} из {self._history_count} сообщений) загружена из файла. \n{target_file=}", None, False)
 
         except Exception as ex:
             logger.error(f"Ошибка загрузки истории чата из файла {target_file=}", ex) # Добавлено exc_info
             self.chat_history = [] # Сброс истории при ошибке загрузки
             self._chat = self._start_chat() # Начинаем новый чат при ошибке
 
+    def get_older_history(self, count: int = 50) -> List[Dict]:
+        """
+        Возвращает до `count` сообщений журнала, предшествующих окну `chat_history`.
+
+        Контекст чата не меняется. Журнал читается только при вызове.
+
+        Args:
+            count (int): Количество сообщений.
+
+        Returns:
+            List[Dict]: Сообщения в хронологическом порядке.
+        """
+        if not self._history_first or not self.history_json_file.is_file() or self.history_json_file.suffix != '.jsonl':
+            return []
+        if self._history_writer:
+            self._history_writer.flush()
+        older: deque = deque(maxlen=count)
+        for index, message in enumerate(jl_iter(self.history_json_file)):
+            if index >= self._history_first:
+                break
+            older.append(message)
+        return list(older)
+
     def clear_history(self) -> None:
         """
-        Функция очищает историю чата в памяти и удаляет связанный JSON файл истории.
+        Функция очищает историю чата в памяти и удаляет журнал и снимок истории.
 
         Returns:
             None
         """
         try:
             self.chat_history = []  # Очистка истории в памяти
-            if hasattr(self, 'history_json_file') and self.history_json_file.exists():
-                self.history_json_file.unlink()  # Удаление файла истории
-                logger.info(f"Файл истории {self.history_json_file} удалён.")
+            self._history_count = self._history_first = self._history_snapshot_at = 0
+            if self._history_writer:
+                self._history_writer.close()
+                self._history_writer = None
+            history_file, snapshot_file = self._history_files()
+            for path in {self.history_json_file, history_file, snapshot_file}:
+                if path.is_file():
+                    path.unlink()  # Удаление файла истории
+                    logger.info(f"Файл истории {path} удалён.")
+            self._history_path = None
         except Exception as ex:
             logger.error('Ошибка при очистке истории чата.', ex) # Добавлено exc_info
 
@@ -310,17 +477,17 @@ class GoogleGenerativeAi:
 
         try:
             # Отправка запроса модели
+            tokens: int = estimate_tokens(q)
             try:
-                # Асинхронная отправка сообщения
-                response = await self._chat.send_message_async(q)
+                # Асинхронная отправка сообщения. Чат - интерактивный вызов, обслуживается раньше пакетных
+                async with self.scheduler.slot(tokens, PRIORITY_INTERACTIVE):
+                    response = await self._chat.send_message_async(q)
+                self._charge_usage(response, tokens)
 
             except ResourceExhausted as ex:
                 logger.error("Исчерпан ресурс (Resource exhausted)", ex, False)
-                # Попытка перезапуска чата через некоторое время
-                await asyncio.sleep(30000) # Пауза перед перезапуском
-                self._start_chat()
-                # Рекурсивный вызов не рекомендуется, лучше вернуть None или поднять исключение
-                # await self.chat(q, chat_name, flag)
+                # Пауза для всех запросов к модели вместо ожидания внутри чата
+                self.scheduler.backoff(retry_after(ex, default=60))
                 return None # Возврат None после исчерпания ресурса
 
             except InvalidArgument as ex:
@@ -397,7 +564,7 @@ class GoogleGenerativeAi:
             logger.error(f"Критическая ошибка в методе chat. Ответ: {response}", ex) # exc_info=True
             return None # Возврат None при критической ошибке
 
-    def ask(self, q: str, attempts: int = 15, save_dialogue: bool = False, clean_response: bool = True) -> Optional[str]:
+    def ask(self, q: str, attempts: int = 15, save_dialogue: bool = False, clean_response: bool = True, priority: Optional[int] = None, use_cache: Optional[bool] = None) -> Optional[str]:
         """
         Метод синхронно отправляет текстовый запрос модели и возвращает ответ.
 
@@ -409,6 +576,9 @@ class GoogleGenerativeAi:
             save_dialogue (bool): Флаг сохранения диалога (вопрос/ответ) в файл.
                                  (Примечание: использует нереализованный `_save_dialogue`). По умолчанию False.
             clean_response (bool): Флаг очистки ответа от разметки кода. По умолчанию True.
+            priority (Optional[int]): Приоритет в планировщике. По умолчанию `self.priority`.
+            use_cache (Optional[bool]): Взять ответ из кэша / сохранить в кэш. `False` - обойти кэш.
+                                        По умолчанию `self.use_cache`.
 
         Returns:
             Optional[str]: Текстовый ответ модели или `None` в случае неудачи после всех попыток.
@@ -418,10 +588,19 @@ class GoogleGenerativeAi:
         """
         response: Any = None # Объявление переменной для ответа
         response_text: Optional[str] = None # Объявление переменной для текста ответа
+        tokens: int = estimate_tokens(q)
+        priority = self.priority if priority is None else priority
+        cache_key: Optional[str] = self._cache_key(q, use_cache)
+        if cache_key:
+            cached: Optional[str] = llm_cache.get(cache_key)
+            if cached is not None:
+                return normalize_answer(cached) if clean_response else cached
 
         for attempt in range(attempts):
             try:
-                response = self.model.generate_content(q)
+                with self.scheduler.slot_sync(tokens, priority):
+                    response = self.model.generate_content(q)
+                self._charge_usage(response, tokens)
 
                 # Проверка наличия текста в ответе
                 if hasattr(response, 'text') and response.text:
@@ -434,6 +613,8 @@ class GoogleGenerativeAi:
                         # ])
                         logger.warning("Функция _save_dialogue не реализована, история не сохранена.")
 
+                    if cache_key:
+                        llm_cache.put(cache_key, response_text, model=self.model_name)
                     # Возврат очищенного или полного ответа
                     return normalize_answer(response_text) if clean_response else response_text
                 else:
@@ -472,35 +653,11 @@ class GoogleGenerativeAi:
                 continue # Переход к следующей попытке
 
             except ResourceExhausted as ex:
-                logger.critical(f"""
-                ------------------------------------------------------------------------
-                           
-                Исчерпн лимит
-                           Внимание! В ответе будет передан `ResourceExhausted` строкой
-
-                -------------------------------------------------------------------------
-                """, None, False)
-                # print(ex)
-                # TOO_MANY_REQUESTS_TIMEOUT:int = 20
-                # if ex.code == http.HTTPStatus.TOO_MANY_REQUESTS:
-                #     logger.debug(
-                #         f"Много запросов в минуту. \nПопытка: {attempt + 1}/{attempts}. \nПауза: {TOO_MANY_REQUESTS_TIMEOUT} сек. Время: {gs.now}\n",
-                #         ex,
-                #         False,
-                #     )
-                #     time.sleep(TOO_MANY_REQUESTS_TIMEOUT)  
-                #     continue # Переход к следующей попытке
-
-                # # Длительная пауза при исчерпании квоты
-                # timeout_quota = 14400 # 4 часа
-                # logger.debug(
-                #     f"Исчерпана квота. Попытка: {attempt + 1}/{attempts}. Пауза: {timeout_quota/3600} час(ов). Время: {gs.now}",
-                #     ex,
-                #     False,
-                # )
-                # time.sleep(timeout_quota)
-                # continue # Переход к следующей попытке
-                return "ResourceExhausted"
+                # Пауза для всех запросов к модели. Следующая попытка дождется ее в `slot_sync`
+                delay: float = retry_after(ex, default=min(2 ** attempt * 5, 300))
+                logger.debug(f"Исчерпан лимит. Попытка: {attempt + 1}/{attempts}. Пауза: {delay} сек.", ex, False)
+                self.scheduler.backoff(delay)
+                continue # Переход к следующей попытке
 
             except (DefaultCredentialsError, RefreshError) as ex:
                 logger.error("Ошибка аутентификации.", ex, False)
@@ -531,7 +688,66 @@ class GoogleGenerativeAi:
         logger.error(f"Не удалось получить ответ от модели после {attempts} попыток.")
         return None # Возврат None, если все попытки исчерпаны
 
-    async def ask_async(self, q: str, attempts: int = 15, save_dialogue: bool = False, clean_response: bool = True) -> Optional[str]:
+    async def describe_image_async(
+        self, image: Path | bytes, mime_type: Optional[str] = 'image/jpeg', prompt: Optional[str] = '',
+        attempts: int = 5, priority: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Асинхронный вариант `describe_image` для пакетной обработки изображений.
+
+        Слот и лимиты модели ожидаются в планировщике без блокировки event loop, поэтому несколько
+        одновременных вызовов выполняются с той скоростью, которую допускает квота модели.
+        После `ResourceExhausted` запросы к модели приостанавливаются (`scheduler.backoff`) и вызов повторяется.
+
+        Args:
+            image (Path | bytes): Путь к файлу изображения или байты изображения.
+            mime_type (Optional[str]): MIME-тип изображения. По умолчанию 'image/jpeg'.
+            prompt (Optional[str]): Текстовый промпт для модели вместе с изображением. По умолчанию ''.
+            attempts (int): Количество попыток. По умолчанию 5.
+            priority (Optional[int]): Приоритет в планировщике. По умолчанию `self.priority`.
+
+        Returns:
+            Optional[str]: Текстовое описание изображения от модели или `None` при ошибке.
+        """
+        image_data: Optional[bytes] = await asyncio.to_thread(get_image_bytes, image) if isinstance(image, Path) else image
+        if not isinstance(image_data, bytes):
+            logger.error(f"Не удалось получить байты изображения: {image}", None, False)
+            return None
+
+        content_parts: List[Any] = [prompt] if prompt else []
+        content_parts.append({'mime_type': mime_type, 'data': image_data})
+        tokens: int = estimate_tokens(prompt) + 258  # <- изображение до 384x384 стоит 258 токенов, крупные - больше (уточняется по `usage_metadata`)
+        priority = self.priority if priority is None else priority
+
+        for attempt in range(attempts):
+            try:
+                async with self.scheduler.slot(tokens, priority):
+                    response = await self.model.generate_content_async(content_parts)
+                self._charge_usage(response, tokens)
+                if hasattr(response, 'text') and response.text:
+                    return response.text
+                logger.info(f"Модель вернула ответ без текста: {getattr(response, 'prompt_feedback', response)}", None, False)
+                return None
+            except ResourceExhausted as ex:
+                delay: float = retry_after(ex, default=min(2 ** attempt * 5, 300))
+                logger.debug(f"Исчерпана квота. Попытка: {attempt + 1}/{attempts}. Пауза: {delay} сек.", ex, False)
+                self.scheduler.backoff(delay)
+            except (GatewayTimeout, ServiceUnavailable) as ex:
+                logger.debug(f"Сервис недоступен. Попытка: {attempt + 1}/{attempts}", ex, False)
+                await asyncio.sleep(2 ** attempt + 5)
+            except (DefaultCredentialsError, RefreshError) as ex:
+                logger.error("Ошибка аутентификации:", ex)
+                return None
+            except (InvalidArgument, RpcError) as ex:
+                logger.error("Ошибка API:", ex, False)
+                return None
+            except Exception as ex:
+                logger.error("Ошибка при отправке запроса модели:", ex, False)
+                return None
+        logger.error(f"Изображение не описано после {attempts} попыток", None, False)
+        return None
+
+    async def ask_async(self, q: str, attempts: int = 15, save_dialogue: bool = False, clean_response: bool = True, priority: Optional[int] = None, use_cache: Optional[bool] = None) -> Optional[str]:
         """
         Метод асинхронно отправляет текстовый запрос модели и возвращает ответ.
 
@@ -543,6 +759,9 @@ class GoogleGenerativeAi:
             save_dialogue (bool): Флаг сохранения диалога (вопрос/ответ) в файл.
                                  (Примечание: использует нереализованный `_save_dialogue`). По умолчанию False.
             clean_response (bool): Флаг очистки ответа от разметки кода. По умолчанию True.
+            priority (Optional[int]): Приоритет в планировщике. По умолчанию `self.priority`.
+            use_cache (Optional[bool]): Взять ответ из кэша / сохранить в кэш. `False` - обойти кэш.
+                                        По умолчанию `self.use_cache`.
 
         Returns:
             Optional[str]: Текстовый ответ модели или `None` в случае неудачи после всех попыток.
@@ -552,11 +771,20 @@ class GoogleGenerativeAi:
         """
         response: Any = None # Объявление переменной для ответа
         response_text: Optional[str] = None # Объявление переменной для текста ответа
+        tokens: int = estimate_tokens(q)
+        priority = self.priority if priority is None else priority
+        cache_key: Optional[str] = self._cache_key(q, use_cache)
+        if cache_key:
+            cached: Optional[str] = await asyncio.to_thread(llm_cache.get, cache_key)  # <- SQLite не блокирует event loop
+            if cached is not None:
+                return normalize_answer(cached) if clean_response else cached
 
         for attempt in range(attempts):
             try:
-                # Запуск синхронного метода generate_content в отдельном потоке
-                response = await self.model.generate_content_async(str(q))
+                # Слот и лимиты модели ожидаются без блокировки event loop
+                async with self.scheduler.slot(tokens, priority):
+                    response = await self.model.generate_content_async(str(q))
+                self._charge_usage(response, tokens)
                 logger.info(f'Модель {self.model.model_name} Обработала запрос',None, False)
                 # Проверка наличия текста в ответе
                 if hasattr(response, 'text') and response.text:
@@ -569,6 +797,8 @@ class GoogleGenerativeAi:
                         # ])
                         logger.warning("Функция _save_dialogue не реализована, история не сохранена.")
 
+                    if cache_key:
+                        await asyncio.to_thread(llm_cache.put, cache_key, response_text, model=self.model_name)
                     # Возврат очищенного или полного ответа
                     return normalize_answer(response_text) if clean_response else response_text
 
@@ -609,14 +839,15 @@ class GoogleGenerativeAi:
                 continue # Переход к следующей попытке
 
             except ResourceExhausted as ex:
-                 # Длительная асинхронная пауза при исчерпании квоты
-                timeout_quota: int = 14400 # 4 часа
+                # Пауза для всех запросов к модели (с учетом `retry_delay` из ответа API).
+                # Следующая попытка дождется ее в `slot`, не блокируя event loop
+                delay: float = retry_after(ex, default=min(2 ** attempt * 5, 300))
                 logger.debug(
-                    f"Исчерпана квота. Попытка: {attempt + 1}/{attempts}. Асинхронная пауза: {timeout_quota/3600} час(ов). Время: {gs.now}",
+                    f"Исчерпана квота. Попытка: {attempt + 1}/{attempts}. Асинхронная пауза: {delay} сек. Время: {gs.now}",
                     ex,
                     False,
                 )
-                await asyncio.sleep(timeout_quota)  # Асинхронная пауза
+                self.scheduler.backoff(delay)
                 continue # Переход к следующей попытке
 
             except (DefaultCredentialsError, RefreshError) as ex:
@@ -708,7 +939,8 @@ class GoogleGenerativeAi:
             # Отправка запроса и получение ответа
             try:
                 # Передаем список частей [prompt, image_dict]
-                response = self.model.generate_content(content_parts)
+                with self.scheduler.slot_sync(estimate_tokens(prompt), self.priority):
+                    response = self.model.generate_content(content_parts)
 
             except DefaultCredentialsError as ex:
                 logger.error("Ошибка аутентификации:", ex)
@@ -0,0 +1,258 @@
+## \file /src/llm/gemini/scheduler.py
+# -*- coding: utf-8 -*-
+#! .pyenv/bin/python3
+
+"""
+Планировщик запросов к моделям Gemini.
+======================================
+Один планировщик на модель, общий для всех экземпляров `GoogleGenerativeAi` процесса
+(кампании, code_assistant, боты):
+
+- корзины токенов (token bucket) на запросы в минуту (`rpm`) и токены в минуту (`tpm`);
+- ограничение одновременных запросов (`max_in_flight`);
+- приоритеты: освободившийся слот получает интерактивный вызов (чат, бот) раньше пакетного (кампания);
+- общая пауза после `ResourceExhausted` с учетом задержки, которую вернул API (`retry_delay`).
+
+В асинхронном коде ожидание не блокирует event loop, синхронные вызовы ждут в своем потоке.
+Лимиты моделей задаются в `gemini.json`, раздел `rate_limits`.
+
+Пример:
+
+.. code-block:: python
+
+    scheduler = get_scheduler('gemini-1.5-flash', {'rpm': 15, 'tpm': 1000000, 'max_in_flight': 4})
+    async with scheduler.slot(tokens=estimate_tokens(prompt), priority=PRIORITY_INTERACTIVE):
+        response = await model.generate_content_async(prompt)
+
+```rst
+.. module:: src.llm.gemini.scheduler
+```
+"""
+
+import asyncio
+import heapq
+import itertools
+import re
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Iterator, Optional
+
+import header
+from src.logger.logger import logger
+
+
+PRIORITY_INTERACTIVE: int = 0
+PRIORITY_BATCH: int = 10
+
+DEFAULT_LIMITS: dict = {'rpm': 15, 'tpm': 1_000_000, 'max_in_flight': 4}
+
+# `retry_delay { seconds: 37 }`, `Retry-After: 37`, `Please retry in 37.5s`
+_RETRY_PATTERN = re.compile(r'(?:retry_delay\s*\{\s*seconds:\s*|retry-after:?\s*|retry in\s+)(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+
+def estimate_tokens(text: Any) -> int:
+    """Оценка количества токенов запроса (~4 символа на токен) до получения `usage_metadata`."""
+    return len(str(text)) // 4 + 1
+
+
+def retry_after(ex: Exception, default: float) -> float:
+    """Задержка, которую API вернул вместе с ошибкой, или `default`."""
+    match = _RETRY_PATTERN.search(str(ex))
+    return float(match.group(1)) if match else default
+
+
+class TokenBucket:
+    """
+    Корзина токенов емкостью `capacity`, полностью пополняется за `period` секунд.
+
+    Списание выполняется сразу, уровень может уйти в минус - тогда `reserve` возвращает время,
+    через которое списанное будет покрыто пополнением. Так ожидающие запросы выстраиваются
+    в очередь без повторных проверок.
+    """
+
+    def __init__(self, capacity: float, period: float = 60.0):
+        self.capacity: float = float(capacity)
+        self.rate: float = self.capacity / period
+        self.level: float = self.capacity
+        self.updated: float = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Списывает `amount`. Возвращает ожидание в секундах (0 - можно выполнять сразу)."""
+        self._refill(now)
+        self.level -= min(amount, self.capacity)
+        return 0.0 if self.level >= 0 else -self.level / self.rate
+
+    def adjust(self, amount: float, now: float) -> None:
+        """Корректирует списание, например, на разницу между оценкой и `usage_metadata`."""
+        self._refill(now)
+        self.level = max(self.level - amount, -self.capacity)
+
+
+class _Waiter:
+    """Запрос, ожидающий свободный слот. Асинхронный ждет future своего loop, синхронный - `threading.Event`."""
+
+    __slots__ = ('loop', 'future', 'event', 'granted', 'cancelled')
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.loop = loop
+        self.future: Optional[asyncio.Future] = loop.create_future() if loop else None
+        self.event: Optional[threading.Event] = None if loop else threading.Event()
+        self.granted: bool = False
+        self.cancelled: bool = False
+
+    def wake(self) -> bool:
+        """Передает слот ожидающему. Возвращает `False`, если его event loop уже закрыт."""
+        if not self.loop:
+            self.granted = True
+            self.event.set()
+            return True
+        try:
+            self.loop.call_soon_threadsafe(lambda: self.future.done() or self.future.set_result(True))
+        except RuntimeError:
+            return False
+        self.granted = True
+        return True
+
+
+class RequestScheduler:
+    """
+    Ограничитель запросов к одной модели.
+
+    Attributes:
+        name (str): Имя модели.
+        max_in_flight (int): Максимум одновременных запросов.
+        stats (dict): `requests` - выполнено запросов, `throttled` - запросов, ожидавших лимит,
+            `waited` - суммарное ожидание лимитов в секундах, `backoffs` - пауз после `ResourceExhausted`.
+    """
+
+    def __init__(self, name: str, rpm: int = DEFAULT_LIMITS['rpm'], tpm: int = DEFAULT_LIMITS['tpm'],
+                 max_in_flight: int = DEFAULT_LIMITS['max_in_flight']):
+        self.name = name
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._rpm = TokenBucket(rpm)
+        self._tpm = TokenBucket(tpm)
+        self._lock = threading.Lock()
+        self._waiters: list = []  # <- heap: (priority, seq, _Waiter)
+        self._seq = itertools.count()
+        self._in_flight: int = 0
+        self._paused_until: float = 0.0
+        self.stats: dict = {'requests': 0, 'throttled': 0, 'waited': 0.0, 'backoffs': 0}
+
+    def _enter(self, priority: int, loop: Optional[asyncio.AbstractEventLoop] = None) -> Optional[_Waiter]:
+        """Занимает слот. Если свободного нет - ставит в очередь и возвращает `_Waiter`."""
+        with self._lock:
+            if self._in_flight < self.max_in_flight and not self._waiters:
+                self._in_flight += 1
+                return None
+            waiter = _Waiter(loop)
+            heapq.heappush(self._waiters, (priority, next(self._seq), waiter))
+            return waiter
+
+    def _leave(self) -> None:
+        """Освобождает слот: передает его первому по приоритету ожидающему или уменьшает счетчик."""
+        with self._lock:
+            while self._waiters:
+                _, _, waiter = heapq.heappop(self._waiters)
+                if not waiter.cancelled and waiter.wake():
+                    return
+            self._in_flight -= 1
+
+    def _cancel(self, waiter: _Waiter) -> None:
+        """Снимает ожидающего с очереди. Если слот уже передан - освобождает его."""
+        with self._lock:
+            waiter.cancelled = True
+            granted: bool = waiter.granted
+        if granted:
+            self._leave()
+
+    def _reserve(self, tokens: int) -> float:
+        """Списывает запрос и токены. Возвращает необходимое ожидание в секундах."""
+        with self._lock:
+            now: float = time.monotonic()
+            delay: float = max(
+                self._paused_until - now,
+                self._rpm.reserve(1, now),
+                self._tpm.reserve(tokens, now),
+                0.0,
+            )
+            self.stats['requests'] += 1
+            if delay > 0:
+                self.stats['throttled'] += 1
+                self.stats['waited'] += delay
+            return delay
+
+    @asynccontextmanager
+    async def slot(self, tokens: int = 1, priority: int = PRIORITY_BATCH) -> AsyncIterator['RequestScheduler']:
+        """
+        Асинхронно ждет слот и лимиты, не блокируя event loop.
+
+        Args:
+            tokens (int): Оценка токенов запроса (`estimate_tokens`).
+            priority (int): `PRIORITY_INTERACTIVE` или `PRIORITY_BATCH`. Меньшее значение обслуживается раньше.
+        """
+        waiter: Optional[_Waiter] = self._enter(priority, asyncio.get_running_loop())
+        if waiter:
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                self._cancel(waiter)
+                raise
+        try:
+            delay: float = self._reserve(tokens)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield self
+        finally:
+            self._leave()
+
+    @contextmanager
+    def slot_sync(self, tokens: int = 1, priority: int = PRIORITY_BATCH) -> Iterator['RequestScheduler']:
+        """Синхронный вариант `slot`: ожидание в текущем потоке."""
+        waiter: Optional[_Waiter] = self._enter(priority)
+        if waiter:
+            waiter.event.wait()
+        try:
+            delay: float = self._reserve(tokens)
+            if delay > 0:
+                time.sleep(delay)
+            yield self
+        finally:
+            self._leave()
+
+    def charge(self, tokens: int) -> None:
+        """Довносит в `tpm` разницу между фактическим расходом токенов и оценкой (может быть отрицательной)."""
+        if tokens:
+            with self._lock:
+                self._tpm.adjust(tokens, time.monotonic())
+
+    def backoff(self, delay: float) -> None:
+        """Приостанавливает все новые запросы к модели на `delay` секунд (после `ResourceExhausted`)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            self.stats['backoffs'] += 1
+        logger.warning(f'Лимит модели {self.name} исчерпан. Запросы приостановлены на {delay:.1f} сек.', None, False)
+
+
+_schedulers: dict = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(model_name: str, limits: Optional[dict] = None) -> RequestScheduler:
+    """
+    Возвращает общий планировщик модели, создавая его при первом обращении.
+
+    Args:
+        model_name (str): Имя модели.
+        limits (Optional[dict]): `rpm`, `tpm`, `max_in_flight`. Учитываются только при создании планировщика.
+    """
+    with _schedulers_lock:
+        scheduler: Optional[RequestScheduler] = _schedulers.get(model_name)
+        if not scheduler:
+            scheduler = RequestScheduler(model_name, **{**DEFAULT_LIMITS, **(limits or {})})
+            _schedulers[model_name] = scheduler
+        return scheduler
@@ -29,6 +29,7 @@ from src.utils.csv import save_csv_file
 from src.utils.printer import pprint
 from src.utils.convertors.base64 import base64encode
 from src.utils.convertors.md import md2dict
+from src.llm.response_cache import llm_cache
 from src.logger.logger import logger
 
 class OpenAIModel:
@@ -46,19 +47,22 @@ class OpenAIModel:
     dialogue: List[Dict[str, str]] = []
     assistants: List[SimpleNamespace]
     models_list: List[str]
+    use_cache: bool = False
 
-    def __init__(self, api_key:str, system_instruction: str = None, model_name:str = 'gpt-4o-mini', assistant_id: str = None):
+    def __init__(self, api_key:str, system_instruction: str = None, model_name:str = 'gpt-4o-mini', assistant_id: str = None, use_cache: bool = False):
         """Initialize the Model object with API key, assistant ID, and load available models and assistants.
 
         Args:
             system_instruction (str, optional): An optional system instruction for the model.
             assistant_id (str, optional): An optional assistant ID. Defaults to 'asst_dr5AgQnhhhnef5OSMzQ9zdk9'.
+            use_cache (bool, optional): Cache `ask` replies in `src.llm.response_cache`. Defaults to False.
         """
         #self.client = OpenAI(api_key = gs.credentials.openai.project_api)
         self.client = OpenAI(api_key = api_key if api_key else gs.credentials.openai.api_key)
         self.current_job_id = None
         self.assistant_id = assistant_id or gs.credentials.openai.assistant_id.code_assistant
         self.system_instruction = system_instruction
+        self.use_cache = use_cache
 
         # Load assistant and thread during initialization
         self.assistant = self.client.beta.assistants.retrieve(self.assistant_id)
@@ -137,17 +141,25 @@ class OpenAIModel:
         else:
             return "neutral"
 
-    def ask(self, message: str, system_instruction: str = None, attempts: int = 3) -> str:
+    def ask(self, message: str, system_instruction: str = None, attempts: int = 3, use_cache: Optional[bool] = None) -> str:
         """Send a message to the model and return the response, along with sentiment analysis.
 
         Args:
             message (str): The message to send to the model.
             system_instruction (str, optional): Optional system instruction.
             attempts (int, optional): Number of retry attempts. Defaults to 3.
+            use_cache (bool, optional): Read/write the reply cache. `False` bypasses it. Defaults to `self.use_cache`.
 
         Returns:
             str: The response from the model.
         """
+        use_cache = self.use_cache if use_cache is None else use_cache
+        cache_key: Optional[str] = None
+        if use_cache:
+            cache_key = llm_cache.make_key(self.model, system_instruction or self.system_instruction, {'temperature': 0, 'max_tokens': 8000}, message)
+            cached: Optional[str] = llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
         try:
             messages = []
             if self.system_instruction or system_instruction:
@@ -169,6 +181,8 @@ class OpenAIModel:
                 max_tokens=8000,
             )
             reply = response.choices[0].message.content.strip()
+            if cache_key:
+                llm_cache.put(cache_key, reply, model=self.model)
 
             # Анализ тональности
             sentiment = self.determine_sentiment(reply)
@@ -186,7 +200,7 @@ class OpenAIModel:
             logger.debug(f"An error occurred while sending the message: \n-----\n {pprint(messages)} \n-----\n", ex, True)
             time.sleep(3)
             if attempts > 0:
-                return self.ask(message, attempts - 1)
+                return self.ask(message, system_instruction, attempts - 1, use_cache)
             return 
 
     def describe_image(self, image_path: str | Path, prompt:Optional[str] = None, system_instruction:Optional[str] = None ) -> str:
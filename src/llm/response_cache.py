@@ -0,0 +1,166 @@
+## \file /src/llm/response_cache.py
+# -*- coding: utf-8 -*-
+#! .pyenv/bin/python3
+
+"""
+Кэш ответов LLM.
+================
+Ответы моделей (Gemini, OpenAI) сохраняются в SQLite по ключу
+`sha256(model, system_instruction, generation_config, prompt)`.
+Повторный запуск кампании после сбоя получает уже оплаченные ответы из кэша, без запросов к API.
+
+Кэш включается явно: `GoogleGenerativeAi(..., use_cache=True)`, `OpenAIModel(..., use_cache=True)`
+или `use_cache=True` в конкретном вызове `ask`. `use_cache=False` в вызове обходит кэш.
+Записи старше `ttl` не возвращаются, при превышении `max_entries` удаляются давно не использованные.
+
+Пример:
+
+.. code-block:: python
+
+    key = llm_cache.make_key('gemini-1.5-flash', system_instruction, generation_config, prompt)
+    response = llm_cache.get(key)
+    if response is None:
+        response = model.generate_content(prompt).text
+        llm_cache.put(key, response, model='gemini-1.5-flash')
+    print(llm_cache.stats())
+
+```rst
+.. module:: src.llm.response_cache
+```
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import header
+from src.logger.logger import logger
+
+
+class LLMResponseCache:
+    """
+    Кэш ответов LLM в SQLite.
+
+    Attributes:
+        path (Optional[Path]): Файл базы. По умолчанию `gs.path.external_storage / 'llm_cache' / 'responses.sqlite3'`.
+        ttl (float): Время жизни записи в секундах.
+        max_entries (int): Максимум записей. Лишние (давно не использованные) удаляются при записи.
+        hits (int): Попадания с момента запуска.
+        misses (int): Промахи с момента запуска.
+    """
+
+    EVICT_EVERY: int = 100  # <- Проверка `ttl`/`max_entries` раз на столько записей
+
+    def __init__(self, path: Optional[Path | str] = None, ttl: float = 30 * 24 * 3600, max_entries: int = 50_000):
+        self.path: Optional[Path] = Path(path) if path else None
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits: int = 0
+        self.misses: int = 0
+        self._puts: int = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, system_instruction: Any, generation_config: Any, prompt: Any) -> str:
+        """Ключ записи: sha256 от модели, системной инструкции, настроек генерации и запроса."""
+        payload: str = json.dumps([model, system_instruction, generation_config, prompt], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Открывает базу при первом обращении. Вызывается под `self._lock`."""
+        if self._connection is None:
+            if not self.path:
+                from src import gs
+                self.path = Path(gs.path.external_storage) / 'llm_cache' / 'responses.sqlite3'
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, model TEXT, response TEXT NOT NULL, '
+                'created_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+            )
+            self._connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+        return self._connection
+
+    def get(self, key: str) -> Optional[str]:
+        """Возвращает сохраненный ответ или `None`."""
+        now: float = time.time()
+        try:
+            with self._lock:
+                connection = self._connect()
+                row = connection.execute(
+                    'SELECT response FROM responses WHERE key = ? AND created_at > ?', (key, now - self.ttl)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                connection.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+                self.hits += 1
+                return row[0]
+        except sqlite3.Error as ex:
+            logger.error('Ошибка чтения кэша ответов LLM', ex, False)
+            return None
+
+    def put(self, key: str, response: str, model: Optional[str] = None) -> bool:
+        """Сохраняет ответ. Пустые ответы не сохраняются."""
+        if not response:
+            return False
+        now: float = time.time()
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    'INSERT OR REPLACE INTO responses (key, model, response, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)',
+                    (key, model, response, now, now),
+                )
+                self._puts += 1
+                if self._puts % self.EVICT_EVERY == 0:
+                    self._evict(connection, now)
+            return True
+        except sqlite3.Error as ex:
+            logger.error('Ошибка записи в кэш ответов LLM', ex, False)
+            return False
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        """Удаляет просроченные записи и давно не использованные сверх `max_entries`."""
+        connection.execute('DELETE FROM responses WHERE created_at <= ?', (now - self.ttl,))
+        connection.execute(
+            'DELETE FROM responses WHERE key IN ('
+            'SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+            (self.max_entries,),
+        )
+
+    def clear(self) -> None:
+        """Удаляет все записи."""
+        with self._lock:
+            self._connect().execute('DELETE FROM responses')
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """Количество записей, попадания, промахи и доля попаданий с момента запуска."""
+        with self._lock:
+            entries: int = self._connect().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+            requests: int = self.hits + self.misses
+            return {
+                'entries': entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / requests if requests else 0.0,
+            }
+
+    def close(self) -> None:
+        """Закрывает соединение с базой."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+llm_cache = LLMResponseCache()
@@ -7,17 +7,29 @@
     :platform: Windows, Unix
     :synopsis: Модуль логгера
 
+По умолчанию записи выводятся только в консоль, как и раньше.
+Неблокирующий режим (`Logger.start_queue()`): записи передаются через `QueueHandler` в фоновый
+`BatchQueueListener`, который пишет их в консоль и файлы и сбрасывает файлы пачками.
+Файлы (`info.log`, `debug.log`, `errors.log`, JSON) ведутся только в этом режиме -
+вызывающий поток никогда не пишет в файл сам.
+Сообщение может быть вызываемым объектом (`logger.debug(lambda: f"...")`) - оно вычисляется,
+только если уровень включен. Уровень по умолчанию - `DEBUG` (выводится все, как раньше),
+поэтому отбрасывание работает после `Logger.set_level(logging.INFO)` или `"logger": {"level": "INFO"}` в `config.json`.
+
 """
 
 
+import atexit
 import logging
+import logging.handlers
 import colorama
 import datetime
 import json
-import inspect
+import queue
+import sys
 import threading
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Callable, Optional, Tuple
 from types import SimpleNamespace
 
 import header
@@ -72,6 +84,17 @@ LOG_SYMBOLS = {
 }
 
 
+_THIS_FILE: str = __file__
+
+
+def _caller_frame():
+    """Returns the first frame outside this module. `sys._getframe` is much cheaper than `inspect.stack()`."""
+    frame = sys._getframe(1)
+    while frame and frame.f_code.co_filename == _THIS_FILE:
+        frame = frame.f_back
+    return frame
+
+
 class SingletonMeta(type):
     """Metaclass for Singleton pattern implementation."""
 
@@ -104,6 +127,54 @@ class JsonFormatter(logging.Formatter):
         return _json
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """`FileHandler` that, when `buffered`, does not flush after every record. Flushed by `BatchQueueListener` in batches."""
+
+    buffered: bool = False
+
+    def flush(self):
+        """Called by `emit()` after every record - skipped while `buffered`, see `flush_buffer()`."""
+        if not self.buffered:
+            super().flush()
+
+    def flush_buffer(self):
+        """Flushes the stream."""
+        super().flush()
+
+    def close(self):
+        self.flush_buffer()
+        super().close()
+
+
+class BatchQueueListener(logging.handlers.QueueListener):
+    """
+    `QueueListener` that routes records to the handlers of the logger they were created by
+    and flushes buffered handlers once per batch (`batch_size` records or an empty queue).
+    """
+
+    def __init__(self, log_queue: queue.Queue, routes: dict, batch_size: int = 100):
+        handlers = tuple({id(h): h for hs in routes.values() for h in hs}.values())
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.routes: dict = routes
+        self.batch_size: int = batch_size
+        self._pending: int = 0
+
+    def handle(self, record: logging.LogRecord):
+        record = self.prepare(record)
+        for handler in self.routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        self._pending += 1
+        if self._pending >= self.batch_size or self.queue.empty():
+            self.flush()
+
+    def flush(self):
+        """Flushes all handlers."""
+        for handler in self.handlers:
+            getattr(handler, 'flush_buffer', handler.flush)()
+        self._pending = 0
+
+
 class Logger(metaclass=SingletonMeta):
     """Logger class implementing Singleton pattern with console, file, and JSON logging."""
 
@@ -112,6 +183,8 @@ class Logger(metaclass=SingletonMeta):
     debug_log_path: Path
     errors_log_path: Path
     json_log_path: Path
+    level: int = logging.DEBUG  # <- Сообщения ниже этого уровня отбрасываются до форматирования. DEBUG - ничего не отбрасывается
+    listener: Optional[BatchQueueListener] = None
 
     def __init__(
         self,
@@ -119,8 +192,16 @@ class Logger(metaclass=SingletonMeta):
         debug_log_path: Optional[str] = None,
         errors_log_path: Optional[str] = None,
         json_log_path: Optional[str] = None,
+        queued: Optional[bool] = None,
     ):
-        """Initialize the Logger instance."""
+        """Initialize the Logger instance.
+
+        Args:
+            queued (Optional[bool]): Start in non-blocking mode (`start_queue()`).
+                By default taken from `"logger": {"queued": true}` in `config.json`.
+
+        The minimum level is taken from `"logger": {"level": "INFO"}` in `config.json` (default `DEBUG`).
+        """
         # Define file paths
         config = SimpleNamespace(
             **json.loads(Path(__root__ / "src" / "config.json").read_text(encoding="UTF-8"))
@@ -137,11 +218,7 @@ class Logger(metaclass=SingletonMeta):
         # Ensure directories exist
         self.log_files_path.mkdir(parents=True, exist_ok=True)
 
-        # Ensure log files exist
-        self.info_log_path.touch(exist_ok=True)
-        self.debug_log_path.touch(exist_ok=True)
-        self.errors_log_path.touch(exist_ok=True)
-        self.json_log_path.touch(exist_ok=True)
+        # Log files are opened on the first record (`delay=True`), not at import time
 
         # Console logger
         self.logger_console = logging.getLogger(name="logger_console")
@@ -150,36 +227,121 @@ class Logger(metaclass=SingletonMeta):
         # Info file logger
         self.logger_file_info = logging.getLogger(name="logger_file_info")
         self.logger_file_info.setLevel(logging.INFO)
-        info_handler = logging.FileHandler(self.info_log_path)
+        info_handler = BufferedFileHandler(self.info_log_path, delay=True)
+        info_handler.setLevel(logging.INFO)
         info_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
         self.logger_file_info.addHandler(info_handler)
 
         # Debug file logger
         self.logger_file_debug = logging.getLogger(name="logger_file_debug")
         self.logger_file_debug.setLevel(logging.DEBUG)
-        debug_handler = logging.FileHandler(self.debug_log_path)
+        debug_handler = BufferedFileHandler(self.debug_log_path, delay=True)
         debug_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
         self.logger_file_debug.addHandler(debug_handler)
 
         # Errors file logger
         self.logger_file_errors = logging.getLogger(name="logger_file_errors")
         self.logger_file_errors.setLevel(logging.ERROR)
-        errors_handler = logging.FileHandler(self.errors_log_path)
+        errors_handler = BufferedFileHandler(self.errors_log_path, delay=True)
+        errors_handler.setLevel(logging.ERROR)
         errors_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
         self.logger_file_errors.addHandler(errors_handler)
 
         # JSON file logger
         self.logger_file_json = logging.getLogger(name="logger_json")
         self.logger_file_json.setLevel(logging.DEBUG)
-        json_handler = logging.FileHandler(self.json_log_path)
+        json_handler = BufferedFileHandler(self.json_log_path, delay=True)
         json_handler.setFormatter(JsonFormatter())  # Используем наш кастомный форматтер
         self.logger_file_json.addHandler(json_handler)
 
         # Удаляем все обработчики, которые выводят в консоль
         for handler in self.logger_file_json.handlers:
-            if isinstance(handler, logging.StreamHandler):
+            if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler):
                 self.logger_file_json.removeHandler(handler)
 
+        self.file_loggers: Tuple[logging.Logger, ...] = (
+            self.logger_file_info,
+            self.logger_file_debug,
+            self.logger_file_errors,
+            self.logger_file_json,
+        )
+        for file_logger in self.file_loggers:
+            file_logger.propagate = False  # <- Файловые записи не дублируются в консоль через root
+
+        logger_config: dict = getattr(config, 'logger', None) or {}
+        level = logging.getLevelName(str(logger_config.get('level', 'DEBUG')).upper())
+        if isinstance(level, int):
+            self.set_level(level)
+
+        if queued if queued is not None else logger_config.get('queued', False):
+            self.start_queue()
+
+    def set_level(self, level: int) -> None:
+        """Sets the minimum level. Lower messages are dropped before any formatting."""
+        self.level = level
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Returns `True` if messages of `level` are logged."""
+        return level >= self.level
+
+    def start_queue(self, batch_size: int = 100) -> None:
+        """
+        Switches to non-blocking mode.
+
+        Handlers of the console and file loggers are moved to a `BatchQueueListener` thread.
+        The calling thread only puts the record into a queue; files are flushed in batches.
+        File logs (info, debug, errors, JSON) are written only in this mode.
+        The listener is stopped (and the queue drained) at exit or by `stop_queue()`.
+
+        Args:
+            batch_size (int): Records written before buffered files are flushed. They are also flushed whenever the queue is empty.
+        """
+        if self.listener:
+            return
+        log_queue: queue.Queue = queue.Queue(-1)
+        routes: dict = {}
+        self._routed_loggers: list = []
+        for _logger in (self.logger_console, *self.file_loggers):
+            handlers: list = self._collect_handlers(_logger)
+            for handler in handlers:
+                if isinstance(handler, BufferedFileHandler):
+                    handler.buffered = True
+            routes[_logger.name] = handlers
+            self._routed_loggers.append((_logger, list(_logger.handlers), _logger.propagate))
+            for handler in list(_logger.handlers):
+                _logger.removeHandler(handler)
+            _logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            _logger.propagate = False
+        self.listener = BatchQueueListener(log_queue, routes, batch_size)
+        self.listener.start()
+        atexit.register(self.stop_queue)
+
+    def stop_queue(self) -> None:
+        """Drains the queue, stops the listener and restores the handlers."""
+        if not self.listener:
+            return
+        self.listener.stop()
+        self.listener.flush()
+        for _logger, handlers, propagate in self._routed_loggers:
+            for handler in list(_logger.handlers):
+                _logger.removeHandler(handler)
+            for handler in handlers:
+                if isinstance(handler, BufferedFileHandler):
+                    handler.buffered = False
+                _logger.addHandler(handler)
+            _logger.propagate = propagate
+        self.listener = None
+
+    @staticmethod
+    def _collect_handlers(_logger: logging.Logger) -> list:
+        """Handlers a record of `_logger` reaches through propagation, as `Logger.callHandlers` finds them."""
+        handlers: list = []
+        current: Optional[logging.Logger] = _logger
+        while current:
+            handlers.extend(current.handlers)
+            current = current.parent if current.propagate else None
+        return handlers or [logging.lastResort]
+
     def _format_message(self, message, ex=None, color: Optional[Tuple[str, str]] = None, level=None):
         """Returns formatted message with optional color and exception information."""
         log_symbol = LOG_SYMBOLS.get(level, "")  # Get log symbol based on level
@@ -194,15 +356,22 @@ class Logger(metaclass=SingletonMeta):
 
     def _ex_full_info(self, ex):
         """Returns full exception information along with the previous function, file, and line details."""
-        frame_info = inspect.stack()[3]
-        file_name = frame_info.filename
-        function_name = frame_info.function
-        line_number = frame_info.lineno
+        frame = _caller_frame()
+        file_name = frame.f_code.co_filename if frame else ''
+        function_name = frame.f_code.co_name if frame else ''
+        line_number = frame.f_lineno if frame else 0
 
         return f"\nFile: {file_name}, \n |\n  -Function: {function_name}, \n   |\n    --Line: {line_number}\n{ex if ex else ''}"
 
-    def log(self, level, message, ex=None, exc_info=False, color: Optional[Tuple[str, str]] = None):
-        """General method to log messages at specified level with optional color."""
+    def log(self, level, message: Any | Callable[[], Any], ex=None, exc_info=False, color: Optional[Tuple[str, str]] = None):
+        """General method to log messages at specified level with optional color.
+
+        `message` may be a callable returning the message: it is called only if `level` is enabled.
+        """
+        if level < self.level:
+            return
+        if callable(message):
+            message = message()
         formatted_message = self._format_message(message, ex, color, level=level)
 
         if self.logger_console:
@@ -212,6 +381,15 @@ class Logger(metaclass=SingletonMeta):
             else:
                 self.logger_console.log(level, formatted_message, exc_info=exc_info)
 
+        if not self.listener:
+            return  # <- файлы пишет только фоновый поток (`start_queue()`), синхронный режим - только консоль
+        file_message: str = f"{message} {ex or ''}"
+        if level >= logging.ERROR and ex:
+            file_message = f"{message}{self._ex_full_info(ex)}"
+        for file_logger in self.file_loggers:
+            if file_logger.isEnabledFor(level):
+                file_logger.log(level, file_message)
+
     def info(self, message, ex=None, exc_info=False, text_color: str = "green", bg_color: str = ""):
         """Logs an info message with optional text and background colors."""
         color = (text_color, bg_color)
@@ -9,4 +9,12 @@
 .. module:: src.suppliers 
 	:platform: Windows, Unix
 """
-from src.suppliers.suppliers_list import *
+import importlib
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+	"""Классы граберов поставщиков (`AliexpressGraber`, ...) загружаются из `suppliers_list` при первом обращении."""
+	if name.startswith('_'):
+		raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+	return getattr(importlib.import_module(f'{__name__}.suppliers_list'), name)
@@ -10,6 +10,12 @@
 для заданного URL поставщика. У каждого поставщика есть свой собственный грабер, который
 извлекает значения полей с целевой HTML-страницы.
 
+Поставщик определяется по хосту URL без перехода на страницу: реестр `хост -> пакет поставщика`
+строится один раз из JSON конфигураций поставщиков (`<supplier>/<supplier>.json`, ключи `start_url` и `domains`).
+Поиск - словарь по хосту, по зарегистрированному домену (eTLD+1, `tldextract`) и по имени домена
+для записей вида `ebay.*`. Модуль грабера импортируется только для найденного поставщика.
+Для неизвестных хостов возвращается универсальный грабер `generic` (OpenGraph/schema.org).
+
 Пример использования
 -------------------
 
@@ -22,7 +28,7 @@
     url = 'https://www.example.com'
     graber = get_graber_by_supplier_url(driver, url, 2) # Пример с lang_index = 2
 
-    if graber:
+    if graber and await graber.open_page(url):
         # Использование грабера для извлечения данных
         product_data = graber.get_product_data()
         print(f'Data extracted: {product_data}')
@@ -34,44 +40,129 @@
 
 .. module:: src.suppliers.get_graber_by_supplier
 """
-from typing import Type # Используется для аннотации типа Driver без циклического импорта, если необходимо
-from src.suppliers.graber import Graber
-from src.suppliers.suppliers_list.aliexpress.graber import Graber as AliexpressGraber
-from src.suppliers.suppliers_list.amazon.graber import Graber as AmazonGraber
-from src.suppliers.suppliers_list.bangood.graber import Graber as BangoodGraber
-from src.suppliers.suppliers_list.cdata.graber import Graber as CdataGraber
-from src.suppliers.suppliers_list.ebay.graber import Graber as EbayGraber
-from src.suppliers.suppliers_list.etzmaleh.graber import Graber as EtzmalehGraber
-from src.suppliers.suppliers_list.gearbest.graber import Graber as GearbestGraber
-from src.suppliers.suppliers_list.grandadvance.graber import Graber as GrandadvanceGraber
-from src.suppliers.suppliers_list.hb.graber import Graber as HBGraber
-from src.suppliers.suppliers_list.ivory.graber import Graber as IvoryGraber
-from src.suppliers.suppliers_list.ksp.graber import Graber as KspGraber
-from src.suppliers.suppliers_list.kualastyle.graber import Graber as KualaStyleGraber
-from src.suppliers.suppliers_list.morlevi.graber import Graber as MorleviGraber
-from src.suppliers.suppliers_list.visualdg.graber import Graber as VisualDGGraber
-from src.suppliers.suppliers_list.wallashop.graber import Graber as WallaShopGraber
-from src.suppliers.suppliers_list.wallmart.graber import Graber as WallmartGraber
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlsplit
+
+import tldextract
+
+from header import __root__
+from src.suppliers.suppliers_list import GRABERS
+from src.utils.jjson import j_loads
 from src.logger.logger import logger
-# Предполагается, что класс Driver импортируется из модуля webdriver
-# Если это вызывает циклический импорт, можно использовать Type['Driver']
-from src.webdriver import Driver
 
+if TYPE_CHECKING:
+    from src.suppliers.graber import Graber
+    from src.webdriver import Driver
+
+
+GENERIC_SUPPLIER: str = 'generic'  # <- Универсальный грабер для хостов, которых нет в реестре
+
+# Разбор eTLD+1 по встроенному списку публичных суффиксов, без загрузки списка из сети
+_extract = tldextract.TLDExtract(suffix_list_urls=())
+
+_hosts: dict[str, str] = {}  # <- хост или eTLD+1 -> пакет поставщика
+_domain_names: dict[str, str] = {}  # <- имя домена для записей `name.*` (`ebay` -> `ebay`)
+_registry_lock = threading.Lock()
+_registry_loaded: bool = False
+
+
+def normalize_host(url_or_host: str) -> str:
+    """Хост URL в нижнем регистре, без порта, `www.` и `m.`."""
+    host: str = (urlsplit(url_or_host).hostname if '//' in url_or_host else url_or_host.split('/')[0].split(':')[0]) or ''
+    host = host.lower().rstrip('.')
+    for prefix in ('www.', 'm.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    return host
+
+
+def _register(domain: str, supplier: str) -> None:
+    """Добавляет в реестр домен поставщика: `host`, `eTLD+1` или `name.*`."""
+    domain = domain.strip().lower()
+    if domain.endswith('.*'):
+        _domain_names.setdefault(domain[:-2], supplier)
+        return
+    host: str = normalize_host(domain)
+    if host:
+        _hosts.setdefault(host, supplier)
+        _hosts.setdefault(_extract(host).registered_domain or host, supplier)
+
+
+def _load_registry() -> None:
+    """Строит реестр из JSON конфигураций поставщиков. Выполняется один раз."""
+    global _registry_loaded
+    with _registry_lock:
+        if _registry_loaded:
+            return
+        suppliers_dir = __root__ / 'src' / 'suppliers' / 'suppliers_list'
+        for supplier in dict.fromkeys(GRABERS.values()):
+            config_path = suppliers_dir / supplier / f'{supplier}.json'
+            config: dict = j_loads(config_path, use_cache=True) if config_path.exists() else {}
+            if not isinstance(config, dict):
+                continue
+            for domain in [config.get('start_url') or '', *config.get('domains', [])]:
+                if domain:
+                    _register(domain, supplier)
+        _registry_loaded = True
+        logger.debug(f'Реестр поставщиков: {len(_hosts)} доменов, {len(_domain_names)} шаблонов')
+
+
+def get_supplier_by_url(url: str) -> Optional[str]:
+    """
+    Определяет пакет поставщика по URL без перехода на страницу и без импорта граберов.
 
-def get_graber_by_supplier_url(driver: Driver, url: str, lang_index: int) -> Graber | None:
+    Args:
+        url (str): URL страницы поставщика.
+
+    Returns:
+        Optional[str]: Имя пакета поставщика (`'ksp'`, `'ebay'`, ...) или `None`, если хост не зарегистрирован.
+
+    Example:
+        >>> get_supplier_by_url('https://www.ksp.co.il/web/item/12345')
+        'ksp'
+        >>> get_supplier_by_url('https://www.ebay.co.uk/itm/1')
+        'ebay'
+    """
+    if not _registry_loaded:
+        _load_registry()
+    host: str = normalize_host(url)
+    if not host:
+        return None
+    supplier: Optional[str] = _hosts.get(host)
+    if supplier:
+        return supplier
+    parts = _extract(host)
+    return _hosts.get(parts.registered_domain) or _domain_names.get(parts.domain)
+
+
+def get_graber_class(supplier: str) -> Optional[type]:
+    """Импортирует и возвращает класс `Graber` пакета поставщика. Модули кэшируются в `sys.modules`."""
+    try:
+        return importlib.import_module(f'src.suppliers.suppliers_list.{supplier}.graber').Graber
+    except ModuleNotFoundError as ex:
+        logger.debug(f'грабер поставщика не найден: {supplier}', ex, False)
+        return None
+
+
+def get_graber_by_supplier_url(driver: Driver, url: str, lang_index: int, fallback: bool = True) -> Graber | None:
     """
     Функция возвращает соответствующий грабер для заданного URL поставщика.
 
-    Для каждого поставщика существует свой грабер, который извлекает значения полей
-    с целевой HTML-страницы. Функция сначала переходит по URL с помощью драйвера.
+    Поставщик определяется по хосту URL (`get_supplier_by_url`), переход по URL не выполняется.
+    Страницу открывает вызывающий код, например `await graber.open_page(url)`.
 
     Args:
         driver (Driver): Экземпляр веб-драйвера для взаимодействия со страницей.
         url (str): URL страницы поставщика.
         lang_index (int): Индекс языка в магазине Prestashop (например, для локализации).
+        fallback (bool): Для неизвестного хоста вернуть универсальный грабер `generic`. По умолчанию `True`.
 
     Returns:
-        Graber | None: Экземпляр соответствующего класса Graber, если совпадение найдено, иначе None.
+        Graber | None: Экземпляр соответствующего класса Graber или None, если поставщик не найден и `fallback=False`.
 
     Example:
         >>> from src.webdriver import Driver # Пример импорта
@@ -83,62 +174,14 @@ def get_graber_by_supplier_url(driver: Driver, url: str, lang_index: int) -> Gra
         ...     print(f'Grabber found: {type(grabber_instance).__name__}')
         Grabber found: KspGraber # Пример вывода
     """
-    # Переход по указанному URL
-    driver.get_url(url)
-
-    # Определение и возврат соответствующего грабера на основе URL
-    if url.startswith(('https://aliexpress.com', 'https://wwww.aliexpress.com')):
-        return AliexpressGraber(driver, lang_index)
-
-    if url.startswith(('https://amazon.com', 'https://wwww.amazon.com')):
-        return AmazonGraber(driver, lang_index)
-
-    if url.startswith(('https://bangood.com', 'https://wwww.bangood.com')):
-        return BangoodGraber(driver, lang_index)
-
-    if url.startswith(('https://cdata.co.il', 'https://wwww.cdata.co.il')):
-        return CdataGraber(driver, lang_index)
-
-    if url.startswith(('https://ebay.', 'https://wwww.ebay.')): # Учитывает разные домены ebay (com, co.uk и т.д.)
-        return EbayGraber(driver, lang_index)
-
-    if url.startswith(('https://etzmaleh.co.il', 'https://www.etzmaleh.co.il')):
-        return EtzmalehGraber(driver, lang_index)
-
-    if url.startswith(('https://gearbest.com', 'https://wwww.gearbest.com')):
-        return GearbestGraber(driver, lang_index)
-
-    if url.startswith(('https://grandadvance.co.il', 'https://www.grandadvance.co.il')):
-        return GrandadvanceGraber(driver, lang_index)
-
-    if url.startswith(('https://hb-digital.co.il', 'https://www.hb-digital.co.il')):
-        return HBGraber(driver, lang_index)
-
-    if url.startswith(('https://ivory.co.il', 'https://www.ivory.co.il')):
-        return IvoryGraber(driver, lang_index)
-
-    if url.startswith(('https://ksp.co.il', 'https://www.ksp.co.il')):
-        return KspGraber(driver, lang_index)
-
-    if url.startswith(('https://kualastyle.com', 'https://www.kualastyle.com')):
-        return KualaStyleGraber(driver, lang_index)
-
-    if url.startswith(('https://morlevi.co.il', 'https://www.morlevi.co.il')):
-        return MorleviGraber(driver, lang_index)
-
-    if url.startswith(('https://www.visualdg.com', 'https://visualdg.com')):
-        return VisualDGGraber(driver, lang_index)
-
-    if url.startswith(('https://wallashop.co.il', 'https://www.wallashop.co.il')):
-        return WallaShopGraber(driver, lang_index)
-
-    if url.startswith(('https://www.wallmart.com', 'https://wallmart.com')):
-        return WallmartGraber(driver, lang_index)
-
-    # Логгирование, если грабер для URL не найден
-    logger.debug(f'грабер для URL не найден: {url}')
-    ... # Оставлено без изменений согласно требованиям
-    return None # Явный возврат None, если ни одно условие не выполнено
+    supplier: Optional[str] = get_supplier_by_url(url)
+    if not supplier:
+        logger.debug(f'грабер для URL не найден: {url}')
+        if not fallback:
+            return None
+        supplier = GENERIC_SUPPLIER
+    graber_class = get_graber_class(supplier)
+    return graber_class(driver, lang_index) if graber_class else None
 
 
 def get_graber_by_supplier_prefix(driver: Driver, supplier_prefix: str, lang_index: int = 2) -> Graber | None:
@@ -147,7 +190,7 @@ def get_graber_by_supplier_prefix(driver: Driver, supplier_prefix: str, lang_ind
 
     Args:
         driver (Driver): Экземпляр веб-драйвера.
-        supplier_prefix (str): Строковый префикс или идентификатор поставщика (в нижнем регистре).
+        supplier_prefix (str): Строковый префикс или идентификатор поставщика (имя пакета в `suppliers_list`).
         lang_index (int, optional): Индекс языка. По умолчанию 2.
 
     Returns:
@@ -163,50 +206,9 @@ def get_graber_by_supplier_prefix(driver: Driver, supplier_prefix: str, lang_ind
         ...     print(f'Grabber found: {type(grabber_instance).__name__}')
         Grabber found: KspGraber # Пример вывода
     """
-    
-    grabber: Graber | None = None
-    ... # Оставлено без изменений согласно требованиям
-
-    # Определение грабера на основе префикса
-    # Приведение префикса к нижнему регистру для надежного сравнения
     prefix_lower: str = supplier_prefix.lower()
-
-    if prefix_lower == 'aliexpress':
-        grabber = AliexpressGraber(driver, lang_index)
-    elif prefix_lower == 'amazon':
-        grabber = AmazonGraber(driver, lang_index)
-    elif prefix_lower == 'bangood': # Добавлен недостающий префикс
-        grabber = BangoodGraber(driver, lang_index)
-    elif prefix_lower == 'cdata': # Добавлен недостающий префикс
-         grabber = CdataGraber(driver, lang_index)
-    elif prefix_lower == 'ebay':
-        grabber = EbayGraber(driver, lang_index)
-    elif prefix_lower == 'etzmaleh': # Добавлен недостающий префикс
-         grabber = EtzmalehGraber(driver, lang_index)
-    elif prefix_lower == 'gearbest':
-        grabber = GearbestGraber(driver, lang_index)
-    elif prefix_lower == 'grandadvance':
-        grabber = GrandadvanceGraber(driver, lang_index)
-    elif prefix_lower == 'hb':
-        grabber = HBGraber(driver, lang_index)
-    elif prefix_lower == 'ivory':
-        grabber = IvoryGraber(driver, lang_index)
-    elif prefix_lower == 'ksp':
-        grabber = KspGraber(driver, lang_index)
-    elif prefix_lower == 'kualastyle':
-        grabber = KualaStyleGraber(driver, lang_index)
-    elif prefix_lower == 'morlevi':
-        grabber = MorleviGraber(driver, lang_index)
-    elif prefix_lower == 'visualdg':
-        grabber = VisualDGGraber(driver, lang_index)
-    elif prefix_lower == 'wallashop':
-        grabber = WallaShopGraber(driver, lang_index)
-    elif prefix_lower == 'wallmart':
-        grabber = WallmartGraber(driver, lang_index)
-    else:
-         # Логгирование, если грабер для префикса не найден
-         logger.debug(f'грабер для префикса поставщика не найден: {supplier_prefix}')
-
-
-    # Возврат найденного грабера или None
-    return grabber
+    if prefix_lower not in GRABERS.values():
+        logger.debug(f'грабер для префикса поставщика не найден: {supplier_prefix}')
+        return None
+    graber_class = get_graber_class(prefix_lower)
+    return graber_class(driver, lang_index) if graber_class else None
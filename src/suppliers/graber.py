@@ -40,6 +40,7 @@ class G(Graber):
 """
 
 
+import copy
 import datetime
 import os
 import sys
@@ -58,6 +59,9 @@ from header import __root__
 from src import gs
 from src.webdriver.driver import Driver
 from src.webdriver.firefox import Firefox
+from src.webdriver.snapshot import PageSnapshot
+from src.webdriver.static_fetcher import StaticFetcher
+from src.webdriver.locator import compile_locators
 from src.endpoints.prestashop.product_fields import ProductFields
 # from src.endpoints.prestashop.category_async import PrestaCategoryAsync
 # from src.suppliers.scenario.scenario_executor import run_scenario as _runscenario, run_scenarios as _runscenarios, run_scenario_file as _run_scenario_file, run_scenario_files as _run_scenario_files
@@ -123,8 +127,10 @@ def close_pop_up() -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs):
             if Config.locator_for_decorator:
+                # Драйвер экземпляра грабера (в пуле у каждого воркера свой), иначе - глобальный `Config.driver`
+                driver = getattr(args[0], 'driver', None) if args else None
                 try:
-                    await Config.driver.execute_locator(Config.locator_for_decorator)  # Await async pop-up close  
+                    await (driver or Config.driver).execute_locator(Config.locator_for_decorator)  # Await async pop-up close  
                     ... 
                 except ExecuteLocatorException as ex:
                     logger.debug(f'Ошибка выполнения локатора:', ex, False)
@@ -140,6 +146,20 @@ def close_pop_up() -> Callable:
 class Graber:
     """Базовый класс сбора данных со страницы для всех поставщиков."""
     supplier_prefix:str = ''
+    static_mode:bool = False  # <- Страницы товара рендерятся на сервере: загрузка по HTTP без Selenium (`grab_url_static`). Переопределяется в классе поставщика
+    static_limit_per_host:int = 8  # <- Лимит HTTP-соединений к сайту поставщика в `static_mode`
+    page_load:dict = {'wait_for': 'ready_state'}  # <- Ожидание загрузки страниц по умолчанию (таймаут - см. `Driver.get_url_async`). Переопределяется разделом `page_load` в `<supplier_prefix>.json`
+    snapshot_mode:bool = False  # <- Сбор полей по снимку DOM в `grab_page_async`. Переопределяется в классе поставщика
+    max_concurrency:int = 1  # <- Лимит одновременно обрабатываемых страниц в `process_scenarios_pooled`. Переопределяется в классе поставщика
+    required_fields:tuple = ('id_product',
+                            'name',
+                            'price',
+                            'id_supplier',
+                            'description_short',
+                            'description',
+                            'specification',
+                            'local_image_path',
+                            'default_image_url')
     def __init__(self, supplier_prefix: str,  driver: Optional['Driver'] = None,  lang_index:Optional[int] = 2, ):
         """Инициализация класса Graber.
 
@@ -148,11 +168,18 @@ class Graber:
             driver ('Driver'): Экземпляр класса Driver.
         """
         self.supplier_prefix = supplier_prefix
-        self.product_locator: SimpleNamespace = j_loads_ns(__root__ / 'src' / 'suppliers' / 'suppliers_list' / supplier_prefix / 'locators' / 'product.json')
-        self.category_locator: SimpleNamespace = j_loads_ns(__root__ / 'src' / 'suppliers' / 'suppliers_list' / supplier_prefix / 'locators' / 'category.json')
+        self.lang_index = lang_index
+        # Локаторы компилируются один раз: `ExecuteLocator` не разбирает их повторно при каждом вызове
+        self.product_locator: SimpleNamespace = compile_locators(j_loads_ns(__root__ / 'src' / 'suppliers' / 'suppliers_list' / supplier_prefix / 'locators' / 'product.json', shared=True))
+        self.category_locator: SimpleNamespace = compile_locators(j_loads_ns(__root__ / 'src' / 'suppliers' / 'suppliers_list' / supplier_prefix / 'locators' / 'category.json', shared=True))
+        # Настройки ожидания загрузки страниц (`page_load`) из конфигурации поставщика
+        supplier_config_path: Path = __root__ / 'src' / 'suppliers' / 'suppliers_list' / supplier_prefix / f'{supplier_prefix}.json'
+        supplier_config: dict = j_loads(supplier_config_path, use_cache=True) if supplier_config_path.exists() else {}
+        self.page_load: dict = {**self.page_load, **((supplier_config.get('page_load') if isinstance(supplier_config, dict) else None) or {})}
         self.driver = driver or Driver(Firefox) 
         Config.driver = self.driver
         self.fields: ProductFields = ProductFields(lang_index ) # <- установка базового языка. Тип - `int`
+        self.static_fetcher: Optional[StaticFetcher] = None # <- создается при первой загрузке страницы в `static_mode`
 
         # ---------------------------- конфигурация для декоратора ------------------------------
         """Если будет установлен локатор в Config.locator_for_decorator - выполнится декоратор `@close_pop_up`"""
@@ -261,24 +288,20 @@ class Graber:
             return None # Или другое обозначение ошибки
 
 
-    async def process_scenarios(self, supplier_prefix: str, input_scenarios: List[Dict[str, Any]] | Dict[str, Any], id_lang:Optional[int]=1) -> Optional[List[Any]]:
+    def _normalize_scenarios(self, supplier_prefix: str, input_scenarios: List[Dict[str, Any]] | Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
         """
-        Выполняет один или несколько сценариев для указанного поставщика.
+        Приводит входные данные сценариев к списку словарей сценариев.
 
         Args:
             supplier_prefix (str): Префикс (идентификатор) поставщика.
-            input_scenarios (List[Dict[str, Any]] | Dict[str, Any]):
-                Данные сценариев: либо список словарей сценариев,
+            input_scenarios (List[Dict[str, Any]] | Dict[str, Any]): Список словарей сценариев
                 либо словарь вида {'scenarios': {'name': dict, ...}}.
 
         Returns:
-            Optional[List[Any]]: Список результатов выполнения каждого сценария
-                                 (например, списки обработанных URL товаров)
-                                 или None в случае критической ошибки.
+            Optional[List[Dict[str, Any]]]: Список словарей сценариев или `None` при некорректном вводе.
         """
         actual_scenarios_to_process: List[Dict[str, Any]] = []
 
-        # 1. Нормализация входных данных -> actual_scenarios_to_process (список словарей сценариев)
         if isinstance(input_scenarios, list):
             # Вход - список: валидация содержимого
             if all(isinstance(item, dict) for item in input_scenarios):
@@ -318,7 +341,19 @@ class Graber:
             ...
             return [] # Возврат пустого списка
 
-        # 2. Динамический импорт (вынесен до цикла)
+        return actual_scenarios_to_process
+
+    def _load_get_list_products_func(self, supplier_prefix: str) -> Optional[Callable]:
+        """
+        Импортирует функцию `get_list_products_in_category` из модуля сценариев поставщика.
+
+        Args:
+            supplier_prefix (str): Префикс (идентификатор) поставщика.
+
+        Returns:
+            Optional[Callable]: Функция получения списка товаров категории или `None` при ошибке импорта.
+        """
+        # Динамический импорт модуля сценариев поставщика
         try:
             module_path_str: str = f'src.suppliers.suppliers_list.{supplier_prefix}.scenario'
             scenario_module = importlib.import_module(module_path_str)
@@ -335,6 +370,34 @@ class Graber:
             logger.error(f"Ошибка импорта модуля/функции сценария для '{supplier_prefix}'", import_err, exc_info=True)
             ...
             return None
+        return get_list_func
+
+    async def process_scenarios(self, supplier_prefix: str, input_scenarios: List[Dict[str, Any]] | Dict[str, Any], id_lang:Optional[int]=1) -> Optional[List[Any]]:
+        """
+        Выполняет один или несколько сценариев для указанного поставщика.
+
+        Args:
+            supplier_prefix (str): Префикс (идентификатор) поставщика.
+            input_scenarios (List[Dict[str, Any]] | Dict[str, Any]):
+                Данные сценариев: либо список словарей сценариев,
+                либо словарь вида {'scenarios': {'name': dict, ...}}.
+
+        Returns:
+            Optional[List[Any]]: Список результатов выполнения каждого сценария
+                                 (например, списки обработанных URL товаров)
+                                 или None в случае критической ошибки.
+        """
+        # 1. Нормализация входных данных -> actual_scenarios_to_process (список словарей сценариев)
+        actual_scenarios_to_process: Optional[List[Dict[str, Any]]] = self._normalize_scenarios(supplier_prefix, input_scenarios)
+        if actual_scenarios_to_process is None:
+            return None
+        if not actual_scenarios_to_process:
+            return []
+
+        # 2. Динамический импорт (вынесен до цикла)
+        get_list_func: Optional[Callable] = self._load_get_list_products_func(supplier_prefix)
+        if not get_list_func:
+            return None
 
         # --- Основной цикл обработки сценариев ---
         all_results: List[Any] = []
@@ -358,7 +421,7 @@ class Graber:
             logger.info(f"Обработка сценария для '{supplier_prefix}'. URL: {scenario_url}")
 
             # 4. Переход по URL сценария
-            if not d.get_url(scenario_url):
+            if not await self.open_page(scenario_url, 'category'):
                 logger.error(f"Не удалось перейти по URL сценария: {scenario_url}", None, False)
                 ...
                 continue
@@ -393,40 +456,13 @@ class Graber:
                      ...
                      continue
 
-                if not d.get_url(product_url):
-                    logger.error(f'Ошибка навигации на страницу товара: {product_url}')
-                    ...
-                    continue
-                required_fields:tuple = ('id_product',
-                            'name',
-                            'price',
-                            'id_supplier',
-                            'description_short',
-                            'description',
-                            'specification',
-                            'local_image_path',
-                            'default_image_url')
-
-                f: Optional[ProductFields] = await self.grab_page_async(*required_fields, id_lang=id_lang)
+                f: Optional[ProductFields] = await self.grab_product_url_async(product_url, id_lang=id_lang)
                 if not f:
                     logger.error(f'Не удалось собрать поля товара с {product_url}')
                     ...
                     continue
 
-                try:
-                    f.id_category_default = scenario_data.get('presta_categories')['default_category']
-                    f.additional_category_append(f.id_category_default)
-                    additional_categories = scenario_data.get('presta_categories')['additional_categories']
-                    if additional_categories:
-                        for category in additional_categories:
-                            if category:
-                                f.additional_category_append(category)
-                except Exception as ex:
-                    logger.error(f'Ошибка добавления дополнительных категорий{print(f)}')
-                    ...
-                except Exception as ex:
-                    logger.error(f'Не удалось сохранить данные\n {print(f)}\n с {product_url}', ex, exc_info=True)
-                    ...
+                self._set_scenario_categories(f, scenario_data)
                 product: PrestaProduct = PrestaProduct()
                 product.add_new_product(f)
                 all_results.append(f)
@@ -435,10 +471,195 @@ class Graber:
             # --- Конец тела внешнего цикла ---
 
         # 8. Возврат агрегированных результатов
+        await self.close_static_fetcher()
         logger.info(f"Обработка всех сценариев для '{supplier_prefix}' завершена.")
         return all_results
         # --- Конец функции ---
 
+    def spawn_worker(self, driver: 'Driver') -> 'Graber':
+        """
+        Создает копию грабера для параллельной работы со своим драйвером и своим объектом `ProductFields`.
+
+        Локаторы (`product_locator`, `category_locator`) разделяются между копиями,
+        поля товара и драйвер у каждой копии собственные.
+
+        Args:
+            driver ('Driver'): Экземпляр драйвера, закрепленный за копией.
+
+        Returns:
+            Graber: Копия грабера того же класса поставщика.
+        """
+        worker: Graber = copy.copy(self)
+        worker.driver = driver
+        worker.fields = ProductFields(self.lang_index)
+        return worker
+
+    async def process_scenarios_pooled(
+        self,
+        supplier_prefix: str,
+        input_scenarios: List[Dict[str, Any]] | Dict[str, Any],
+        id_lang: Optional[int] = 1,
+        drivers: Optional[List['Driver']] = None,
+        concurrency: Optional[int] = None,
+        driver_factory: Optional[Callable[[], 'Driver']] = None,
+    ) -> Optional[List[ProductFields]]:
+        """
+        Выполняет сценарии поставщика пулом драйверов, обрабатывая несколько страниц одновременно.
+
+        Каждый воркер пула - копия грабера (`spawn_worker`) со своим драйвером и своим `ProductFields`.
+        Сначала воркеры собирают списки товаров категорий, затем - поля товаров из общей очереди `asyncio.Queue`.
+        Навигация (`open_page` -> `Driver.get_url_async`) не блокирует event loop, отправка товара в PrestaShop выполняется в потоке.
+
+        Args:
+            supplier_prefix (str): Префикс (идентификатор) поставщика.
+            input_scenarios (List[Dict[str, Any]] | Dict[str, Any]): Данные сценариев (как в `process_scenarios`).
+            id_lang (Optional[int]): Индекс языка.
+            drivers (Optional[List['Driver']]): Готовые драйверы для пула. Первым используется `self.driver`.
+            concurrency (Optional[int]): Количество одновременно обрабатываемых страниц.
+                По умолчанию - `max_concurrency` класса поставщика.
+            driver_factory (Optional[Callable[[], 'Driver']]): Фабрика недостающих драйверов. По умолчанию `Driver(Firefox)`.
+
+        Returns:
+            Optional[List[ProductFields]]: Поля товаров в порядке сценариев и ссылок в категориях
+                                           или `None` в случае критической ошибки.
+
+        Example:
+            >>> graber = Graber(supplier_prefix='ksp', driver=Driver(Firefox))
+            >>> products = asyncio.run(graber.process_scenarios_pooled('ksp', scenarios, concurrency=4))
+        """
+        actual_scenarios_to_process: Optional[List[Dict[str, Any]]] = self._normalize_scenarios(supplier_prefix, input_scenarios)
+        if actual_scenarios_to_process is None:
+            return None
+        if not actual_scenarios_to_process:
+            return []
+
+        get_list_func: Optional[Callable] = self._load_get_list_products_func(supplier_prefix)
+        if not get_list_func:
+            return None
+
+        # 1. Формирование пула драйверов
+        pool_size: int = max(1, concurrency or self.max_concurrency)
+        pool_drivers: List['Driver'] = [self.driver] + [d for d in (drivers or []) if d is not self.driver]
+        factory: Callable[[], 'Driver'] = driver_factory or (lambda: Driver(Firefox))
+        created_drivers: List['Driver'] = []  # <- драйверы фабрики закрываются по завершении пула
+        try:
+            while len(pool_drivers) < pool_size:
+                created_driver: 'Driver' = await asyncio.to_thread(factory)
+                created_drivers.append(created_driver)
+                pool_drivers.append(created_driver)
+        except Exception as ex:
+            logger.error(f"Не удалось создать драйвер для пула '{supplier_prefix}'. Размер пула: {len(pool_drivers)}", ex, False)
+        if self.static_mode and self.static_fetcher is None:
+            self.static_fetcher = StaticFetcher(limit_per_host=self.static_limit_per_host)  # <- один пул HTTP-соединений на всех воркеров
+        workers: List[Graber] = [self.spawn_worker(d) for d in pool_drivers[:pool_size]]
+        logger.info(f"Пул для '{supplier_prefix}': {len(workers)} драйверов, {len(actual_scenarios_to_process)} сценариев.")
+
+        async def run_pool(jobs: List[Any], handler: Callable) -> List[Any]:
+            """Раздает задания воркерам через очередь и возвращает результаты в порядке заданий."""
+            queue: asyncio.Queue = asyncio.Queue()
+            for index, job in enumerate(jobs):
+                queue.put_nowait((index, job))
+            results: List[Any] = [None] * len(jobs)
+
+            async def worker_loop(worker: Graber) -> None:
+                while True:
+                    try:
+                        index, job = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    try:
+                        results[index] = await handler(worker, job)
+                    except Exception as ex:
+                        logger.error(f"Ошибка обработки задания {job}", ex, False)
+                    finally:
+                        queue.task_done()
+
+            await asyncio.gather(*(worker_loop(w) for w in workers))
+            return results
+
+        async def collect_category(worker: Graber, scenario_data: Dict[str, Any]) -> Optional[List[str]]:
+            """Переходит на страницу категории и возвращает список ссылок на товары."""
+            scenario_url: Optional[str] = scenario_data.get('url')
+            if not scenario_url:
+                logger.warning(f"Сценарий для '{supplier_prefix}' не содержит ключ 'url'. Пропуск.")
+                return None
+            if not await worker.open_page(scenario_url, 'category'):
+                logger.error(f"Не удалось перейти по URL сценария: {scenario_url}", None, False)
+                return None
+            list_products_in_category = await get_list_func(worker.driver, worker.category_locator)
+            if not isinstance(list_products_in_category, list) or not list_products_in_category:
+                logger.warning(f'Нет ссылок на товары для URL {scenario_url}.')
+                return None
+            return list_products_in_category
+
+        async def grab_product(worker: Graber, job: tuple) -> Optional[ProductFields]:
+            """Собирает поля товара и отправляет его в PrestaShop."""
+            scenario_data, product_url = job
+            if not isinstance(product_url, str) or not product_url:
+                logger.warning(f"Некорректный URL товара получен: {product_url}. Пропуск.")
+                return None
+            worker.fields = ProductFields(self.lang_index)  # <- у каждого товара собственный объект полей
+            f: Optional[ProductFields] = await worker.grab_product_url_async(product_url, id_lang=id_lang)
+            if not f:
+                logger.error(f'Не удалось собрать поля товара с {product_url}')
+                return None
+            self._set_scenario_categories(f, scenario_data)
+            product: PrestaProduct = PrestaProduct()
+            await asyncio.to_thread(product.add_new_product, f)
+            return f
+
+        try:
+            # 2. Сбор ссылок на товары по категориям
+            scenarios: List[Dict[str, Any]] = [s for s in actual_scenarios_to_process if isinstance(s, dict)]
+            products_lists: List[Optional[List[str]]] = await run_pool(scenarios, collect_category)
+
+            # 3. Сбор полей товаров. Порядок результатов совпадает с порядком сценариев и ссылок
+            product_jobs: List[tuple] = [
+                (scenario_data, product_url)
+                for scenario_data, products in zip(scenarios, products_lists)
+                for product_url in (products or [])
+            ]
+            results: List[Optional[ProductFields]] = await run_pool(product_jobs, grab_product)
+        finally:
+            await self.close_static_fetcher()
+            await self._quit_drivers(created_drivers)
+
+        logger.info(f"Обработка всех сценариев для '{supplier_prefix}' завершена. Товаров: {len(product_jobs)}")
+        return [f for f in results if f]
+
+    async def _quit_drivers(self, drivers: List['Driver']) -> None:
+        """
+        Закрывает драйверы, созданные фабрикой пула. Драйвер грабера и драйверы вызывающего кода не закрываются.
+
+        Args:
+            drivers (List['Driver']): Драйверы для закрытия.
+        """
+        for driver in drivers:
+            try:
+                await asyncio.to_thread(driver.quit)
+            except Exception as ex:
+                logger.warning("Не удалось закрыть драйвер пула", ex, False)
+
+    def _set_scenario_categories(self, f: ProductFields, scenario_data: Dict[str, Any]) -> None:
+        """
+        Устанавливает категорию по умолчанию и дополнительные категории товара из сценария.
+
+        Args:
+            f (ProductFields): Поля товара.
+            scenario_data (Dict[str, Any]): Словарь сценария с ключом `presta_categories`.
+        """
+        try:
+            f.id_category_default = scenario_data.get('presta_categories')['default_category']
+            f.additional_category_append(f.id_category_default)
+            additional_categories = scenario_data.get('presta_categories')['additional_categories']
+            if additional_categories:
+                for category in additional_categories:
+                    if category:
+                        f.additional_category_append(category)
+        except Exception as ex:
+            logger.error('Ошибка добавления дополнительных категорий', ex, False)
+            ...
+
 
     async def set_field_value(
         self,
@@ -466,11 +687,107 @@ class Graber:
         await self.error(field_name)
         return default
 
+    async def open_page(self, url: str, page: str = 'product', driver: Optional['Driver'] = None) -> bool:
+        """
+        Открывает страницу вебдрайвером с настройками ожидания поставщика.
+
+        Настройки берутся из раздела `page_load` JSON конфигурации поставщика (`<supplier_prefix>.json`), например:
+        `{"wait_for": "locator", "timeout": 8, "product_locator": "name", "category_locator": "product_links"}`.
+        Для стратегии `locator` используется локатор с указанным именем из `product.json`/`category.json`.
+
+        Args:
+            url (str): URL страницы.
+            page (str): Тип страницы: `'product'` или `'category'`.
+            driver (Optional['Driver']): Драйвер. По умолчанию `self.driver`.
+
+        Returns:
+            bool: `True`, если страница открыта и готова.
+        """
+        driver = driver or self.driver
+        settings: dict = dict(self.page_load)
+        locator_name: Optional[str] = settings.pop(f'{page}_locator', None)
+        settings.pop('product_locator', None)
+        settings.pop('category_locator', None)
+        locators: SimpleNamespace = self.product_locator if page == 'product' else self.category_locator
+        locator = getattr(locators, locator_name, None) if locator_name else None
+        if settings.get('wait_for') == 'locator' and not locator:
+            settings['wait_for'] = 'ready_state'
+
+        if hasattr(driver, 'get_url_async'):
+            return await driver.get_url_async(url, locator=locator, **settings)
+        return await asyncio.to_thread(driver.get_url, url)
+
+    async def grab_product_url_async(self, product_url: str, id_lang: Optional[int] = 1) -> Optional[ProductFields]:
+        """
+        Открывает страницу товара и собирает поля `required_fields`.
+
+        Для поставщиков со `static_mode` страница сначала загружается по HTTP (`grab_url_static`).
+        Если HTML получить не удалось - страница открывается вебдрайвером.
+
+        Args:
+            product_url (str): URL страницы товара.
+            id_lang (Optional[int]): Индекс языка.
+
+        Returns:
+            Optional[ProductFields]: Поля товара или `None` при ошибке.
+        """
+        if self.static_mode:
+            f = await self.grab_url_static(product_url, *self.required_fields, id_lang=id_lang)
+            if f is not False:
+                return f
+            logger.debug(f'Страница не получена по HTTP, переход вебдрайвером: {product_url}')
+
+        if not await self.open_page(product_url):
+            logger.error(f'Ошибка навигации на страницу товара: {product_url}')
+            return None
+        return await self.grab_page_async(*self.required_fields, id_lang=id_lang)
+
+    async def grab_url_static(self, url: str, *args, **kwargs) -> ProductFields|bool|None:
+        """
+        Собирает поля товара со статической страницы без перехода вебдрайвером.
+
+        HTML загружается через общий `StaticFetcher`, локаторы разрешаются по снимку (`PageSnapshot`).
+        Вебдрайвер открывает страницу только если встретится локатор с событием или без `attribute`.
+
+        Args:
+            url (str): URL страницы товара.
+            *args, **kwargs: Передаются в `grab_page_async`.
+
+        Returns:
+            ProductFields|bool|None: Поля товара, `None` при ошибке сбора, `False` если страницу не удалось загрузить.
+        """
+        if self.static_fetcher is None:
+            self.static_fetcher = StaticFetcher(limit_per_host=self.static_limit_per_host)
+        html: Optional[str] = await self.static_fetcher.fetch(url)
+        if not html:
+            return False
+
+        live_driver = self.driver
+        self.driver = PageSnapshot(live_driver, html, url=url, navigate=lambda u: self.open_page(u, driver=live_driver))
+        try:
+            return await self.grab_page_async(*args, snapshot=False, **kwargs)
+        finally:
+            logger.debug(f"Статическая страница {url}: по снимку {self.driver.hits}, через драйвер {self.driver.misses}")
+            self.driver = live_driver
+
+    async def close_static_fetcher(self) -> None:
+        """Закрывает HTTP-сессию `StaticFetcher`, если она была открыта."""
+        if self.static_fetcher:
+            await self.static_fetcher.close()
+
     def grab_page(self, *args, **kwargs) -> ProductFields|bool:
         return asyncio.run(self.grab_page_async(*args, **kwargs))
 
-    async def grab_page_async(self, *args, **kwargs) -> ProductFields|bool:
-        """Асинхронная функция для сбора полей товара."""
+    async def grab_page_async(self, *args, snapshot: Optional[bool] = None, **kwargs) -> ProductFields|bool:
+        """Асинхронная функция для сбора полей товара.
+
+        Args:
+            *args: Имена полей для сбора. По умолчанию - базовый набор полей.
+            snapshot (Optional[bool]): Собирать поля по снимку DOM (`PageSnapshot`): `page_source` запрашивается один раз,
+                локаторы без событий разрешаются через `lxml`, остальные - через живой драйвер.
+                По умолчанию - `snapshot_mode` класса поставщика.
+            **kwargs: Значения полей, передаваемые в функции полей.
+        """
         async def fetch_all_data(*args, **kwargs):
             # Динамическое вызовы функций для каждого поля из args
             process_fields:list = list(args) or ['id_product',
@@ -487,6 +804,9 @@ class Graber:
                 function = getattr(self, filed_name, None)
                 if function:
                     await function(kwargs.get(filed_name, '')) # Просто вызываем с await, так как все функции асинхронные
+        live_driver = self.driver
+        if self.snapshot_mode if snapshot is None else snapshot:
+            self.driver = PageSnapshot(live_driver, await asyncio.to_thread(getattr, live_driver, 'page_source'))
         try:
             await fetch_all_data(*args, **kwargs)
             return self.fields
@@ -494,6 +814,10 @@ class Graber:
             logger.error(f"Ошибка в функции `fetch_all_data`", ex)
             ...
             return None
+        finally:
+            if self.driver is not live_driver:
+                logger.debug(f"Снимок DOM: по снимку {self.driver.hits}, через драйвер {self.driver.misses}")
+                self.driver = live_driver
 
     
     async def error(self, field: str):
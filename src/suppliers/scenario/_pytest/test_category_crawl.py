@@ -0,0 +1,135 @@
+## \file /src/suppliers/scenario/_pytest/test_category_crawl.py
+# -*- coding: utf-8 -*-
+
+#! .pyenv/bin/python3
+
+"""
+.. module:: src.suppliers.scenario._pytest
+	:platform: Windows, Unix
+	:synopsis: Tests for the breadth-first category crawl of `Category`.
+
+Pages are served by fake drivers from the `SITE` map: `url -> [(name, url), ...]`.
+
+#Fixtures:
+ - category: `Category` without PrestaShop credentials (the crawl does not use the API).
+
+#Tests:
+ - test_is_duplicate_url: URLs differing only in fragment, trailing slash or host case are duplicates.
+ - test_crawl_fetches_every_page_once: Each URL is fetched once, the tree is dumped and the journal removed.
+ - test_crawl_respects_depth: Pages deeper than `depth` are in the tree but not fetched.
+ - test_crawl_resumes_from_journal: Pages in the checkpoint journal are not fetched again.
+ - test_crawl_without_resume_discards_journal: `resume=False` ignores and removes an old journal.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.suppliers.scenario.category import Category
+from src.utils.jjson import JsonlWriter
+
+ROOT = 'https://shop.test/catalog'
+
+SITE: dict = {
+    ROOT: [('Phones', 'https://shop.test/phones'), ('Laptops', 'https://shop.test/laptops'),
+           ('External', 'https://other.test/x')],
+    'https://shop.test/phones': [('Android', 'https://shop.test/phones/android'),
+                                 ('Laptops again', 'https://SHOP.test/laptops/#top')],
+    'https://shop.test/laptops': [('Gaming', 'https://shop.test/laptops/gaming')],
+    'https://shop.test/phones/android': [('Deep', 'https://shop.test/phones/android/deep')],
+    'https://shop.test/laptops/gaming': [],
+}
+
+
+class FakeDriver:
+    """Driver whose pages are `SITE` entries. Records the opened URLs."""
+
+    def __init__(self, opened: list):
+        self.opened = opened
+        self.current = None
+
+    async def get_url_async(self, url: str) -> bool:
+        await asyncio.sleep(0)
+        self.opened.append(url)
+        self.current = url
+        return url in SITE
+
+    async def execute_locator(self, locator):
+        return [list(link) for link in SITE[self.current]]
+
+
+@pytest.fixture
+def category():
+    """`Category` without PrestaShop credentials (the crawl does not use the API)."""
+    return Category.__new__(Category)
+
+
+def _crawl(category, tmp_path, depth: int, opened: list, **kwargs) -> dict:
+    drivers = [FakeDriver(opened), FakeDriver(opened)]
+    return category.crawl_categories(ROOT, depth, drivers, locator=None, dump_file=tmp_path / 'tree.json',
+                                     default_category_id=3, host_delay=0, **kwargs)
+
+
+def test_is_duplicate_url(category):
+    """URLs differing only in fragment, trailing slash or host case are duplicates."""
+    seen: set = set()
+    assert not category._is_duplicate_url(seen, 'https://shop.test/phones')
+    assert category._is_duplicate_url(seen, 'https://SHOP.test/phones/')
+    assert category._is_duplicate_url(seen, 'https://shop.test/phones#reviews')
+    assert not category._is_duplicate_url(seen, 'https://shop.test/phones?page=2')
+    assert not category._is_duplicate_url(seen, 'https://shop.test/Phones')
+
+
+def test_crawl_fetches_every_page_once(category, tmp_path):
+    """Each URL is fetched once, the tree is dumped and the journal removed."""
+    opened: list = []
+    tree = _crawl(category, tmp_path, 3, opened)
+
+    assert sorted(opened) == sorted(SITE)
+    assert set(tree) == {'Phones', 'Laptops'}  # <- external host skipped
+    assert 'Laptops again' not in tree['Phones']  # <- already discovered from the root
+    assert tree['Phones']['Android']['url'] == 'https://shop.test/phones/android'
+    assert tree['Phones']['Android']['presta_categories']['default_category'] == 3
+    assert 'Deep' in tree['Phones']['Android']
+    assert json.loads((tmp_path / 'tree.json').read_text(encoding='utf-8'))['Laptops']['Gaming']['name'] == 'Gaming'
+    assert not (tmp_path / 'tree.crawl.jsonl').exists()
+
+
+def test_crawl_respects_depth(category, tmp_path):
+    """Pages deeper than `depth` are in the tree but not fetched."""
+    opened: list = []
+    tree = _crawl(category, tmp_path, 1, opened)
+    assert opened == [ROOT]
+    assert set(tree) == {'Phones', 'Laptops'}
+    assert set(tree['Phones']) == {'url', 'name', 'presta_categories'}
+
+
+def test_crawl_resumes_from_journal(category, tmp_path):
+    """Pages in the checkpoint journal are not fetched again."""
+    with JsonlWriter(tmp_path / 'tree.crawl.jsonl') as writer:
+        writer.write({'url': ROOT, 'depth': 3, 'links': [list(link) for link in SITE[ROOT]]})
+        writer.write({'url': 'https://shop.test/phones', 'depth': 2,
+                      'links': [list(link) for link in SITE['https://shop.test/phones']]})
+
+    opened: list = []
+    tree = _crawl(category, tmp_path, 3, opened)
+
+    assert ROOT not in opened
+    assert 'https://shop.test/phones' not in opened
+    assert sorted(opened) == sorted(['https://shop.test/laptops', 'https://shop.test/phones/android',
+                                     'https://shop.test/laptops/gaming'])
+    assert 'Deep' in tree['Phones']['Android']
+    assert not (tmp_path / 'tree.crawl.jsonl').exists()
+
+
+def test_crawl_without_resume_discards_journal(category, tmp_path):
+    """`resume=False` ignores and removes an old journal."""
+    with JsonlWriter(tmp_path / 'tree.crawl.jsonl') as writer:
+        writer.write({'url': ROOT, 'depth': 1, 'links': [['Stale', 'https://shop.test/stale']]})
+
+    opened: list = []
+    tree = _crawl(category, tmp_path, 1, opened, resume=False)
+
+    assert opened == [ROOT]
+    assert 'Stale' not in tree
@@ -16,16 +16,21 @@ processing product category data, particularly relevant for PrestaShop.
 """
 
 import asyncio
+from collections import defaultdict
 from pathlib import Path
 import os
+from types import SimpleNamespace
 from typing import Dict
+from urllib.parse import urlparse, urlsplit, urlunsplit
 from lxml import html
 import requests
 
 import header
 from src import gs
 from src.logger.logger import logger
-from src.utils.jjson import j_loads, j_dumps
+from src.utils.jjson import j_loads, j_dumps, JsonlWriter, jl_iter
+from src.webdriver.snapshot import PageSnapshot
+from src.webdriver.static_fetcher import StaticFetcher
 from src.endpoints.prestashop.category_async import PrestaCategoryAsync
 
 
@@ -44,109 +49,213 @@ class Category(PrestaCategoryAsync):
         super().__init__(api_credentials, *args, **kwargs)
 
 
-    async def crawl_categories_async(self, url, depth, driver, locator, dump_file, default_category_id, category=None):
-        """Asynchronously crawls categories, building a hierarchical dictionary.
+    # Crawler defaults. Override per call or on the class.
+    crawl_concurrency: int = 8  # <- HTTP fetchers when no driver is given
+    crawl_max_per_host: int = 4  # <- simultaneous requests to one host
+    crawl_host_delay: float = 0.25  # <- minimal interval between requests to one host, seconds
 
-        :param url: The URL of the category page.
-        :param depth: The depth of the crawling recursion.
-        :param driver: The Selenium WebDriver instance.
-        :param locator: The XPath locator for category links.
+    async def crawl_categories_async(self, url, depth, driver, locator, dump_file, default_category_id, category=None,
+                                     concurrency=None, max_per_host=None, host_delay=None, same_host=True, resume=True):
+        """Crawls the category tree breadth-first with a pool of fetchers.
+
+        Pages are taken from a shared frontier (`asyncio.Queue`) by workers. Each worker owns one fetcher:
+        a separate Selenium driver from `driver` (a list of drivers), or a shared HTTP connection pool
+        (`StaticFetcher`) when `driver` is `None`. One driver serves one page at a time, so browser
+        parallelism requires several drivers. Every URL is fetched once: discovered URLs go to a global
+        seen set. Requests to one host are limited by `max_per_host` and spaced by `host_delay`.
+
+        Every fetched page is appended to the checkpoint journal `<dump_file>.crawl.jsonl`. An interrupted
+        crawl restarted with the same `dump_file` replays the journal and fetches only the pages that were
+        not fetched yet. The tree is merged into `dump_file` once, when the crawl is finished,
+        and the journal is removed.
+
+        :param url: The URL of the root category page.
+        :param depth: Crawl depth. Pages deeper than `depth` are added to the tree but not fetched.
+        :param driver: Driver, list of drivers, or `None` to fetch pages over HTTP.
+        :param locator: Locator of category links. Must return (name, url) pairs or `{name: url}` dicts.
         :param dump_file: The path to the JSON file for saving results.
         :param default_category_id: The default category ID.
-        :param category: (Optional) An existing category dictionary (default=None).
-        :returns: The updated or new category dictionary.
+        :param category: (Optional) An existing category dictionary to extend (default=None).
+        :param concurrency: Number of HTTP fetchers (default `crawl_concurrency`).
+        :param max_per_host: Simultaneous requests to one host (default `crawl_max_per_host`).
+        :param host_delay: Minimal interval between requests to one host (default `crawl_host_delay`).
+        :param same_host: Follow only links on the host of `url` (default True).
+        :param resume: Continue from the checkpoint journal if it exists (default True).
+        :returns: Hierarchical dictionary of categories: `{name: {'url', 'name', 'presta_categories', <children>...}}`.
         """
-
-        if category is None:
-            category = {
-                'url': url,
-                'name': '',
-                'presta_categories': {
-                    'default_category': default_category_id,
-                    'additional_categories': []
-                },
-                'children': {}
-            }
-
+        category = {} if category is None else category
         if depth <= 0:
             return category
 
-        try:
-            driver.get(url)
-            await asyncio.sleep(1)  # Wait for page load
-            category_links = driver.execute_locator(locator)
-            if not category_links:
-                logger.error(f"Failed to locate category links on {url}")
-                return category
+        max_per_host = max_per_host or self.crawl_max_per_host
+        host_delay = self.crawl_host_delay if host_delay is None else host_delay
+        root_host = urlparse(url).netloc.lower()
 
-            tasks = [
-                self.crawl_categories_async(link_url, depth - 1, driver, locator, dump_file, default_category_id, new_category)
-                for name, link_url in category_links
-                if not self._is_duplicate_url(category, link_url)
-                for new_category in [{'url': link_url, 'name': name, 'presta_categories': {'default_category': default_category_id, 'additional_categories': []}, 'children': {}}]
-            ]
-            await asyncio.gather(*tasks)
+        dump_file = Path(dump_file)
+        journal_path = dump_file.with_suffix('.crawl.jsonl')
+        journal: dict = {}  # <- url -> links of pages fetched before restart
+        if journal_path.exists():
+            if resume:
+                journal = {record['url']: record['links'] for record in jl_iter(journal_path)}
+                logger.info(f"Resuming crawl of {url}: {len(journal)} pages in checkpoint")
+            else:
+                journal_path.unlink()
 
-            return category
-        except Exception as ex:
-            logger.error(f"An error occurred during category crawling: ", ex)
-            return category
+        frontier: asyncio.Queue = asyncio.Queue()
+        seen: set = set()
+        self._is_duplicate_url(seen, url)
+        frontier.put_nowait((url, depth, category))
+
+        host_limits: Dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(max_per_host))
+        host_next: Dict[str, float] = defaultdict(float)
+        stats = SimpleNamespace(fetched=0, replayed=0, failed=0)
+
+        async def polite(host):
+            """Reserves the next request slot of `host` and sleeps until it."""
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            start = max(now, host_next[host])
+            host_next[host] = start + host_delay
+            if start > now:
+                await asyncio.sleep(start - now)
+
+        async def worker(fetch, writer):
+            while True:
+                page_url, page_depth, node = await frontier.get()
+                try:
+                    links = journal.get(page_url)
+                    if links is not None:
+                        stats.replayed += 1
+                    else:
+                        host = urlparse(page_url).netloc.lower()
+                        async with host_limits[host]:
+                            await polite(host)
+                            links = await fetch(page_url)
+                        if links is None:
+                            stats.failed += 1
+                            continue
+                        writer.write({'url': page_url, 'depth': page_depth, 'links': links})
+                        stats.fetched += 1
+
+                    for name, link_url in links:
+                        if same_host and urlparse(link_url).netloc.lower() != root_host:
+                            continue
+                        if self._is_duplicate_url(seen, link_url):
+                            continue
+                        child = {
+                            'url': link_url,
+                            'name': name,
+                            'presta_categories': {
+                                'default_category': default_category_id,
+                                'additional_categories': []
+                            }
+                        }
+                        node[name] = child
+                        if page_depth > 1:
+                            frontier.put_nowait((link_url, page_depth - 1, child))
+                except Exception as ex:
+                    stats.failed += 1
+                    logger.error(f"An error occurred during category crawling: {page_url}", ex, False)
+                finally:
+                    frontier.task_done()
 
-    def crawl_categories(self, url, depth, driver, locator, dump_file, default_category_id, category={}):
+        drivers = [] if driver is None else driver if isinstance(driver, (list, tuple)) else [driver]
+        http = None if drivers else StaticFetcher(limit_per_host=max_per_host)
+        if drivers:
+            fetchers = [self._driver_fetcher(d, locator) for d in drivers]
+        else:
+            fetchers = [self._http_fetcher(http, locator)] * (concurrency or self.crawl_concurrency)
+
+        with JsonlWriter(journal_path, flush_every=20) as writer:
+            workers = [asyncio.create_task(worker(fetch, writer)) for fetch in fetchers]
+            try:
+                await frontier.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                if http:
+                    await http.close()
+
+        logger.info(f"Crawl of {url} finished: fetched {stats.fetched}, from checkpoint {stats.replayed}, failed {stats.failed}")
+        loaded_data = j_loads(dump_file) if dump_file.exists() else {}
+        category = {**(loaded_data or {}), **category}
+        if j_dumps(category, dump_file):
+            journal_path.unlink(missing_ok=True)
+        return category
+
+    def crawl_categories(self, url, depth, driver, locator, dump_file, default_category_id, category=None, **kwargs):
         """
-        Crawls categories recursively and builds a hierarchical dictionary.
+        Crawls categories and builds a hierarchical dictionary. Synchronous wrapper of `crawl_categories_async`.
 
         :param url: URL of the page to crawl.
-        :param depth: Depth of recursion.
-        :param driver: Selenium WebDriver instance.
-        :param locator: XPath locator for finding category links.
+        :param depth: Depth of crawling.
+        :param driver: Driver, list of drivers, or `None` to fetch pages over HTTP.
+        :param locator: Locator for finding category links.
         :param dump_file: File for saving the hierarchical dictionary.
-        :param id_category_default: Default category ID.
+        :param default_category_id: Default category ID.
         :param category: Category dictionary (default is empty).
+        :param kwargs: Crawler options of `crawl_categories_async` (`concurrency`, `max_per_host`, `host_delay`, `same_host`, `resume`).
         :return: Hierarchical dictionary of categories and their URLs.
         """
-        if depth <= 0:
-            return category
+        return asyncio.run(self.crawl_categories_async(url, depth, driver, locator, dump_file, default_category_id, category, **kwargs))
+
+    @staticmethod
+    def _link_pairs(result):
+        """Normalizes the locator result to a list of [name, url] pairs."""
+        if not result:
+            return []
+        items = result if isinstance(result, list) else [result]
+        pairs = []
+        for item in items:
+            if isinstance(item, dict):
+                pairs.extend([str(name), link] for name, link in item.items() if link)
+            elif isinstance(item, (list, tuple)) and len(item) == 2 and item[1]:
+                pairs.append([str(item[0]), item[1]])
+        return pairs
 
-        try:
-            driver.get(url)
-            driver.wait(1)  # Wait for page load
-            category_links = driver.execute_locator(locator)
-            if not category_links:
+    def _driver_fetcher(self, driver, locator):
+        """Returns a coroutine function that opens a page in `driver` and returns its category links."""
+        async def fetch(url):
+            if not await driver.get_url_async(url):
+                return None
+            result = driver.execute_locator(locator)
+            if asyncio.iscoroutine(result):
+                result = await result
+            links = self._link_pairs(result)
+            if not links:
                 logger.error(f"Failed to locate category links on {url}")
-                return category
-
-            for name, link_url in category_links:
-                if self._is_duplicate_url(category, link_url):
-                    continue
-                new_category = {
-                    'url': link_url,
-                    'name': name,
-                    'presta_categories': {
-                        'default_category': default_category_id,
-                        'additional_categories': []
-                    }
-                }
-                category[name] = new_category
-                self.crawl_categories(link_url, depth - 1, driver, locator, dump_file, default_category_id, new_category)
-            # Using j_loads and j_dumps for safe JSON handling
-            loaded_data = j_loads(dump_file)
-            category = {**loaded_data, **category}
-            j_dumps(category, dump_file)
-            return category
-        except Exception as ex:
-            logger.error(f"An error occurred during category crawling: ", ex)
-            return category
+            return links
+        return fetch
 
-    def _is_duplicate_url(self, category, url):
+    def _http_fetcher(self, http, locator):
+        """Returns a coroutine function that downloads a page over HTTP and resolves the locator on its DOM."""
+        async def fetch(url):
+            page_source = await http.fetch(url)
+            if page_source is None:
+                return None
+            links = self._link_pairs(await PageSnapshot(None, page_source, url).execute_locator(locator))
+            if not links:
+                logger.error(f"Failed to locate category links on {url}")
+            return links
+        return fetch
+
+    def _is_duplicate_url(self, seen, url):
         """
-        Checks if a URL already exists in the category dictionary.
+        Checks if a URL was already discovered by the crawl and marks it as seen.
+
+        URLs are compared without the fragment and the trailing slash, host case-insensitively.
 
-        :param category: Category dictionary.
+        :param seen: Set of normalized URLs discovered so far.
         :param url: URL to check.
         :return: True if the URL is a duplicate, False otherwise.
         """
-        return url in (item['url'] for item in category.values())
+        parts = urlsplit(url)
+        key = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/') or '/', parts.query, ''))
+        if key in seen:
+            return True
+        seen.add(key)
+        return False
 
 
 def compare_and_print_missing_keys(current_dict, file_path):
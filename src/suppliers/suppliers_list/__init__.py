@@ -3,22 +3,43 @@
 #! .pyenv/bin/python3
 """
 Импорты классов поставщиков
+===========================
+Классы `Graber` поставщиков импортируются при первом обращении (`from src.suppliers.suppliers_list import KspGraber`),
+а не при импорте пакета: модули граберов тянут за собой вебдрайвер и настройки поставщика.
 """
 
+import importlib
+from typing import Any
+
 import header
-from src.suppliers.suppliers_list.aliexpress.graber import Graber as AliexpressGraber  
-from src.suppliers.suppliers_list.amazon.graber import Graber as AmazonGraber
-from src.suppliers.suppliers_list.bangood.graber import Graber as BangoodGraber
-from src.suppliers.suppliers_list.cdata.graber import Graber as CadtaGraber
-from src.suppliers.suppliers_list.ebay.graber import Graber as EbayGraber
-from src.suppliers.suppliers_list.etzmaleh.graber import Graber as EtzmalehGraber
-from src.suppliers.suppliers_list.gearbest.graber import Graber as GearbestGraber
-from src.suppliers.suppliers_list.grandadvance.graber import Graber as GrandvanceGraber
-from src.suppliers.suppliers_list.hb.graber import Graber as HbGraber
-from src.suppliers.suppliers_list.ivory.graber import Graber as IvoryGraber
-from src.suppliers.suppliers_list.ksp.graber import Graber as KspGraber
-from src.suppliers.suppliers_list.kualastyle.graber import Graber as KualastyleGraber
-from src.suppliers.suppliers_list.morlevi.graber import Graber as MorleviGraber
-from src.suppliers.suppliers_list.visualdg.graber import Graber as VisualdgGraber
-from src.suppliers.suppliers_list.wallashop.graber import Graber as WallashhopleGraber
-from src.suppliers.suppliers_list.wallmart.graber import Graber as WallmartGraber
\ No newline at end of file
+
+# Имя класса -> пакет поставщика
+GRABERS: dict = {
+    'AliexpressGraber': 'aliexpress',
+    'AmazonGraber': 'amazon',
+    'BangoodGraber': 'bangood',
+    'CadtaGraber': 'cdata',
+    'EbayGraber': 'ebay',
+    'EtzmalehGraber': 'etzmaleh',
+    'GearbestGraber': 'gearbest',
+    'GenericGraber': 'generic',
+    'GrandvanceGraber': 'grandadvance',
+    'HbGraber': 'hb',
+    'IvoryGraber': 'ivory',
+    'KspGraber': 'ksp',
+    'KualastyleGraber': 'kualastyle',
+    'MorleviGraber': 'morlevi',
+    'VisualdgGraber': 'visualdg',
+    'WallashhopleGraber': 'wallashop',
+    'WallmartGraber': 'wallmart',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Импортирует класс `Graber` поставщика при первом обращении."""
+    supplier: str | None = GRABERS.get(name)
+    if supplier is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    graber = importlib.import_module(f'{__name__}.{supplier}.graber').Graber
+    globals()[name] = graber
+    return graber
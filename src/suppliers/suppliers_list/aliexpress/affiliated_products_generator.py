@@ -17,13 +17,16 @@ import html
 from pathlib import Path
 from urllib.parse import urlparse
 from types import SimpleNamespace
-from typing import List
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
 
 from src.logger.logger import logger
 from src import gs
 from src.suppliers.suppliers_list.aliexpress import AliApi
 from src.suppliers.suppliers_list.aliexpress.campaign.html_generators import ProductHTMLGenerator, CategoryHTMLGenerator, CampaignHTMLGenerator 
 from src.suppliers.suppliers_list.aliexpress.utils.ensure_https import ensure_https
+from src.suppliers.suppliers_list.aliexpress.utils.extract_product_id import extract_prod_ids
 from src.endpoints.prestashop.product_fields import ProductFields as f
 from src.utils.image import save_image_from_url_async 
 from src.utils.video import save_video_from_url
@@ -44,6 +47,12 @@ class AliAffiliatedProducts(AliApi):
     ...
     language:str = None
     currency:str = None
+    affiliate_links_batch_size: int = 50  # <- Максимум ссылок в одном запросе `aliexpress.affiliate.link.generate`
+    product_details_batch_size: int = 20  # <- Максимум ID в одном запросе `aliexpress.affiliate.productdetail.get`
+    api_concurrency: int = 4  # <- Одновременных запросов к API
+    api_min_interval: float = 0.2  # <- Минимальный интервал между запусками запросов к API, сек.
+    download_concurrency: int = 8  # <- Одновременных загрузок изображений и видео
+
     def __init__(self,
                  language: str | dict = 'EN',
                  currency: str = 'USD',
@@ -60,10 +69,82 @@ class AliAffiliatedProducts(AliApi):
             return
         super().__init__(language, currency)
         self.language, self.currency = language, currency
-        
+        self._api_semaphore: Optional[asyncio.Semaphore] = None
+        self._api_next_start: float = 0.0
+
+    async def _call_api(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Calls a synchronous API method in a thread, limited to `api_concurrency` concurrent calls
+        started at least `api_min_interval` seconds apart.
+        """
+        if self._api_semaphore is None:
+            self._api_semaphore = asyncio.Semaphore(self.api_concurrency)
+        loop = asyncio.get_running_loop()
+        async with self._api_semaphore:
+            start_at: float = max(loop.time(), self._api_next_start)
+            self._api_next_start = start_at + self.api_min_interval
+            await asyncio.sleep(start_at - loop.time())
+            try:
+                return await asyncio.to_thread(func, *args, **kwargs)
+            except Exception as ex:
+                logger.error(f"Ошибка запроса к API {getattr(func, '__name__', func)}", ex, False)
+                return None
+
+    @staticmethod
+    def _chunks(items: list, size: int) -> List[list]:
+        """Splits `items` into lists of at most `size` elements."""
+        return [items[i:i + size] for i in range(0, len(items), size)]
 
+    async def _get_promotion_links(self, prod_urls: List[str]) -> Dict[str, str]:
+        """
+        Generates affiliate links for all URLs in batches of `affiliate_links_batch_size`, sent concurrently.
 
-    async def process_affiliate_products(self, prod_ids: list[str], category_root: Path | str) -> list[SimpleNamespace]:
+        Returns:
+            Dict[str, str]: `{product_id: promotion_link}`.
+        """
+        chunks: List[List[str]] = self._chunks(prod_urls, self.affiliate_links_batch_size)
+        responses: list = await asyncio.gather(*(self._call_api(self.get_affiliate_links, chunk) for chunk in chunks))
+
+        promotion_links: Dict[str, str] = {}
+        for chunk, links in zip(chunks, responses):
+            for position, link in enumerate(links or []):
+                if not hasattr(link, 'promotion_link'):
+                    continue
+                # Ответ сопоставляется с запросом по `source_value`; если его нет - по позиции в пакете
+                source: Optional[str] = getattr(link, 'source_value', None) or (chunk[position] if position < len(chunk) else None)
+                product_id: Optional[str] = extract_prod_ids(source) if source else None
+                if product_id:
+                    promotion_links[product_id] = link.promotion_link
+                    logger.info(f"found affiliate for {link.promotion_link}")
+        return promotion_links
+
+    async def _retrieve_product_details(self, product_ids: List[str]) -> List[SimpleNamespace]:
+        """Retrieves product details in batches of `product_details_batch_size`, sent concurrently."""
+        chunks: List[List[str]] = self._chunks(product_ids, self.product_details_batch_size)
+        responses: list = await asyncio.gather(*(self._call_api(self.retrieve_product_details, chunk) for chunk in chunks))
+        return [product for products in responses for product in (products or [])]
+
+    async def _save_product_media(self, product: SimpleNamespace, category_root: Path, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore) -> None:
+        """Downloads the main image and the video of a product through the shared download pool."""
+        image_path = Path(category_root) / 'images' / f"{product.product_id}.png"
+        async with semaphore:
+            saved_image = await save_image_from_url_async(product.product_main_image_url, image_path, session=session)
+        if saved_image:
+            logger.info(f"Saved image for {product.product_id=}")
+        product.local_image_path = str(image_path)
+
+        if len(getattr(product, 'product_video_url', '') or '') > 1:
+            parsed_url = urlparse(product.product_video_url)
+            suffix: str = Path(parsed_url.path).suffix
+            video_path: Path = Path(category_root) / 'videos' / f'{product.product_id}{suffix}'
+            async with semaphore:
+                saved_video = await save_video_from_url(product.product_video_url, video_path, session=session)
+            if saved_video:
+                product.local_video_path = str(video_path)
+                logger.info(f"Saved video for {product.product_id=}")
+
+
+    async def process_affiliate_products(self, prod_ids: list[str], category_root: Path | str, session: Optional[aiohttp.ClientSession] = None) -> list[SimpleNamespace]:
         """
         Processes a list of product IDs or URLs and returns a list of products with affiliate links and saved images.
 
@@ -71,6 +152,8 @@ class AliAffiliatedProducts(AliApi):
             campaign (SimpleNamespace): The promotional campaign data.
             category_name (str): The name of the category to process.
             prod_ids (list[str]): List of product URLs or IDs.
+            session (Optional[aiohttp.ClientSession]): Shared session for image/video downloads,
+                e.g. one session for all categories of a campaign. If not given, a session is opened for this call.
 
         Returns:
             list[SimpleNamespace]: A list of processed products with affiliate links and saved images.
@@ -164,68 +247,46 @@ class AliAffiliatedProducts(AliApi):
         """
         ...
 
-        _promotion_links: list = []
-        _prod_urls: list = []
+        category_root = Path(category_root)
         normilized_prod_urls = ensure_https(prod_ids) # <- привожу к виду `https://aliexpress.com/item/<product_id>.html`
-        print_flag = '' # <- флаг переключения печати в одну строку
-
-
-        for prod_url in normilized_prod_urls:
-            _links = super().get_affiliate_links(prod_url)
-            if _links:
-                _links = _links[0]
-            if hasattr(_links, 'promotion_link'):
-                _promotion_links.append(_links.promotion_link)
-                _prod_urls.append(prod_url)
-                logger.info(f"found affiliate for {_links.promotion_link}")
-                # pprint(              # <- печать в одну строку
-                #     f'found affiliate for: {_links.promotion_link}', end=print_flag)
-                # print_flag = '\r'
-            else:
-                continue
+        if isinstance(normilized_prod_urls, str):
+            normilized_prod_urls = [normilized_prod_urls]
 
-        if not _promotion_links:
+        # Ссылки генерируются пакетами, пакеты отправляются одновременно (с ограничением частоты запросов)
+        promotion_links: Dict[str, str] = await self._get_promotion_links(normilized_prod_urls)
+        if not promotion_links:
             logger.warning(
                 f'No affiliate products returned {prod_ids=}/n', None, None)
             return
 
-        _affiliated_products: List[SimpleNamespace] = self.retrieve_product_details(
-            _prod_urls)
+        _affiliated_products: List[SimpleNamespace] = await self._retrieve_product_details(list(promotion_links))
         if not _affiliated_products:
             return
-        
-        affiliated_products_list:list[SimpleNamespace] = []
-        product_titles:list = []
-        for product, promotion_link in zip(_affiliated_products, _promotion_links):
-            product_titles.append(product.product_title)
+
+        affiliated_products_list: list[SimpleNamespace] = []
+        product_titles: list = []
+        for product in _affiliated_products:
+            promotion_link: Optional[str] = promotion_links.get(str(product.product_id))
+            if not promotion_link:
+                continue
             product.language = self.language
             product.promotion_link = promotion_link
-            image_path = Path(category_root) / 'images' / \
-                f"{product.product_id}.png"
-            await save_image_from_url(product.product_main_image_url, image_path)
-            #pprint(f"Saved image for {product.product_id=}", end=print_flag)
-            logger.info(f"Saved image for {product.product_id=}")
-            
-            product.local_image_path = str(image_path)
-            if len(product.product_video_url) > 1:
-                parsed_url:Path = urlparse(product.product_video_url)
-                suffix:str = Path(parsed_url.path).suffix
-
-                video_path:Path = Path(category_root) / 'videos' / \
-                    f'{product.product_id}{suffix}'
-                await save_video_from_url(product.product_video_url, video_path)
-                product.local_video_path = str(video_path)
-                logger.info(f"Saved video for {product.product_id=}")
+            affiliated_products_list.append(product)
+            product_titles.append(product.product_title)
+
+        # Изображения и видео загружаются через общий пул соединений, не более `download_concurrency` одновременно
+        semaphore = asyncio.Semaphore(self.download_concurrency)
+        if session:
+            await asyncio.gather(*(self._save_product_media(product, category_root, session, semaphore) for product in affiliated_products_list))
+        else:
+            async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.download_concurrency)) as session:
+                await asyncio.gather(*(self._save_product_media(product, category_root, session, semaphore) for product in affiliated_products_list))
 
+        for product in affiliated_products_list:
             #product.tags = f"#{f_normalizer.simplify_string(product.first_level_category_name)}, #{f_normalizer.simplify_string(product.second_level_category_name)}"
             logger.info(f"{product.product_title}")
-            j_dumps(product, Path(category_root) / f'{self.language}_{self.currency}' / f'{product.product_id}.json')
-            #pprint(f"Dumped in {Path(category_root) / f'{self.language}_{self.currency}' / f'{product.product_id}.json'} ")
+            j_dumps(product, category_root / f'{self.language}_{self.currency}' / f'{product.product_id}.json')
 
-            affiliated_products_list.append(product)
-        #print_flag = 'newline'
         product_titles_path:Path = category_root / f"{self.language}_{self.currency}" / 'product_titles.txt'
-        await save_text_file(product_titles, product_titles_path)
+        save_text_file(product_titles, product_titles_path)
         return affiliated_products_list
-
-
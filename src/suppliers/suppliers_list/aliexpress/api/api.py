@@ -13,9 +13,14 @@ module: src.suppliers.suppliers_list.aliexpress.api
 ...
 
 
-from typing import List, Union
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Optional, Union
 
 from src.logger.logger import logger
+from src.utils.jjson import j_dumps, j_loads
 from src.utils.printer import pprint
 
 from .models import ( 
@@ -31,7 +36,7 @@ from .models import (
                     SortBy as model_SortBy)
 
 from .errors.exceptions import CategoriesNotFoudException
-from .helpers.categories import filter_child_categories, filter_parent_categories
+from .helpers.categories import build_category_index
 from .skd import setDefaultAppInfo
 from .skd import api as aliapi
 from .errors import ProductsNotFoudException, InvalidTrackingIdException
@@ -39,7 +44,17 @@ from .helpers import api_request, parse_products, get_list_as_string, get_produc
 
 
 class AliexpressApi:
-    """Provides methods to get information from AliExpress using your API credentials."""
+    """Provides methods to get information from AliExpress using your API credentials.
+
+    Categories are cached for all instances: in memory and in a JSON snapshot on disk
+    (`categories_cache_path`, default `gs.path.tmp / 'aliexpress' / 'categories.json'`),
+    both valid for `categories_cache_ttl` seconds. Parent/child lookups use precomputed dicts.
+    """
+
+    categories_cache_ttl: int = 86400  # <- Время жизни кэша категорий, сек.
+    categories_cache_path: Optional[Path] = None
+    _categories_index: Optional[SimpleNamespace] = None  # <- Общий для всех экземпляров: categories, parents, children, by_id, saved_at
+    _categories_lock = threading.Lock()
 
     def __init__(self,
         key: str,
@@ -229,9 +244,13 @@ class AliexpressApi:
             raise ProductsNotFoudException('No products found with current parameters')
 
 
-    def get_categories(self, **kwargs) -> List[model_Category | model_ChildCategory]:
+    def get_categories(self, use_cache: bool = False, **kwargs) -> List[model_Category | model_ChildCategory]:
         """Get all available categories, both parent and child.
 
+        Args:
+            use_cache (``bool``): Return categories from the shared memory/disk cache if it is fresh.
+                Defaults to False (always request the API and refresh the cache).
+
         Returns:
             ``list[model_Category | model_ChildCategory]``: A list of categories.
 
@@ -240,17 +259,66 @@ class AliexpressApi:
             ``ApiRequestException``
             ``ApiRequestResponseException``
         """
+        if use_cache:
+            index: Optional[SimpleNamespace] = self._get_categories_index()
+            if index:
+                self.categories = index.categories
+                return self.categories
+
         request = aliapi.rest.AliexpressAffiliateCategoryGetRequest()
         request.app_signature = self._app_signature
 
         response = api_request(request, 'aliexpress_affiliate_category_get_response')
 
-        if response.total_result_count > 0:
+        if response and response.total_result_count > 0:
             self.categories = response.categories.category
+            self._set_categories_index(self.categories, time.time(), save=True)
             return self.categories
         else:
             raise CategoriesNotFoudException('No categories found')
 
+    def _get_categories_path(self) -> Path:
+        """Path of the on-disk categories snapshot."""
+        if self.categories_cache_path:
+            return Path(self.categories_cache_path)
+        from src import gs
+        return Path(gs.path.tmp) / 'aliexpress' / 'categories.json'
+
+    def _set_categories_index(self, categories: list, saved_at: float, save: bool = False) -> SimpleNamespace:
+        """Builds the shared category index and optionally writes the disk snapshot."""
+        index: SimpleNamespace = build_category_index(categories)
+        index.categories = categories
+        index.saved_at = saved_at
+        AliexpressApi._categories_index = index
+        if save:
+            j_dumps({'saved_at': saved_at, 'categories': [vars(c) for c in categories]}, self._get_categories_path())
+        return index
+
+    def _get_categories_index(self) -> Optional[SimpleNamespace]:
+        """Returns a fresh category index from memory or from the disk snapshot, or `None`."""
+        with self._categories_lock:
+            index: Optional[SimpleNamespace] = AliexpressApi._categories_index
+            if index and time.time() - index.saved_at < self.categories_cache_ttl:
+                return index
+
+            path: Path = self._get_categories_path()
+            if not path.exists():
+                return None
+            snapshot: dict = j_loads(path)
+            saved_at: float = snapshot.get('saved_at', 0) if isinstance(snapshot, dict) else 0
+            if not saved_at or time.time() - saved_at >= self.categories_cache_ttl:
+                return None
+            categories: list = [SimpleNamespace(**c) for c in snapshot.get('categories', [])]
+            return self._set_categories_index(categories, saved_at) if categories else None
+
+    def _categories(self, use_cache: bool) -> SimpleNamespace:
+        """Returns the category index, requesting the API if the cache is stale or `use_cache` is False."""
+        index: Optional[SimpleNamespace] = self._get_categories_index() if use_cache else None
+        if not index:
+            self.get_categories()
+            index = AliexpressApi._categories_index
+        self.categories = index.categories
+        return index
 
     def get_parent_categories(self, use_cache=True, **kwargs) -> List[model_Category]:
         """Get all available parent categories.
@@ -266,9 +334,7 @@ class AliexpressApi:
             ``ApiRequestException``
             ``ApiRequestResponseException``
         """
-        if not use_cache or not self.categories:
-            self.get_categories()
-        return filter_parent_categories(self.categories)
+        return list(self._categories(use_cache).parents)
 
 
     def get_child_categories(self, parent_category_id: int, use_cache=True, **kwargs) -> List[model_ChildCategory]:
@@ -286,6 +352,4 @@ class AliexpressApi:
             ``ApiRequestException``
             ``ApiRequestResponseException``
         """
-        if not use_cache or not self.categories:
-            self.get_categories()
-        return filter_child_categories(self.categories, parent_category_id)
\ No newline at end of file
+        return list(self._categories(use_cache).children.get(int(parent_category_id), []))
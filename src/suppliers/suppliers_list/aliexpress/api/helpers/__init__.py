@@ -3,7 +3,7 @@
  # <- venv win
 ## ~~~~~~~~~~~~~
 """ module: src.suppliers.suppliers_list.aliexpress.api.helpers """
-from .requests import api_request
+from .requests import api_request, api_request_async, response_cache
 from .arguments import get_list_as_string, get_product_ids
 from .products import parse_products
 from .categories import filter_parent_categories, filter_child_categories
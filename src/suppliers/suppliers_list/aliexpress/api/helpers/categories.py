@@ -5,7 +5,8 @@
 """ module: src.suppliers.suppliers_list.aliexpress.api.helpers """
 
 """  функции для фильтрации категорий и подкатегорий API Aliexpress"""
-from typing import List, Union
+from types import SimpleNamespace
+from typing import Dict, List, Union
 from .. import models
 #from src.suppliers.suppliers_list.aliexpress.api.api import models
 
@@ -47,3 +48,29 @@ def filter_child_categories(categories: List[models.Category | models.ChildCateg
 
     return filtered_categories
 
+
+
+
+def build_category_index(categories: List[models.Category | models.ChildCategory]) -> SimpleNamespace:
+    """
+    Builds lookup dicts for categories, so that parent/child queries do not scan the list.
+
+    @param categories: List of category or child category objects.
+    @return: SimpleNamespace with
+        `parents` - list of categories without a parent category,
+        `children` - dict `{parent_category_id: [child categories]}`,
+        `by_id` - dict `{category_id: category}`.
+    """
+    parents: List[models.Category] = []
+    children: Dict[int, List[models.ChildCategory]] = {}
+    by_id: Dict[int, models.Category | models.ChildCategory] = {}
+
+    for category in categories or []:
+        if hasattr(category, 'category_id'):
+            by_id[category.category_id] = category
+        if hasattr(category, 'parent_category_id'):
+            children.setdefault(category.parent_category_id, []).append(category)
+        else:
+            parents.append(category)
+
+    return SimpleNamespace(parents=parents, children=children, by_id=by_id)
@@ -3,6 +3,9 @@
  # <- venv win
 ## ~~~~~~~~~~~~~
 """ module: src.suppliers.suppliers_list.aliexpress.api.helpers """
+import threading
+import time
+from collections import OrderedDict
 from types import SimpleNamespace
 from time import sleep
 from src.logger.logger import logger
@@ -12,34 +15,120 @@ import json
 from ..errors import ApiRequestException, ApiRequestResponseException
 
 
-def api_request(request, response_name, attemps:int = 1):
+# API, ответы которых кэшируются по умолчанию: результат зависит только от параметров запроса
+CACHEABLE_APIS: set = {
+    'aliexpress.affiliate.productdetail.get',
+    'aliexpress.affiliate.category.get',
+}
+
+
+class ResponseCache:
+    """ LRU-кэш сырых ответов API с временем жизни.
+
+    Ключ - `RestApi.cache_key()`: (имя API, сессия, параметры запроса без `timestamp`/`sign`).
+    Хранятся байты ответа: при каждом попадании ответ декодируется заново,
+    поэтому вызывающий код получает собственные объекты.
+    """
+
+    def __init__(self, ttl: float = 3600, maxsize: int = 2048):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return None
+            if time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, raw: bytes) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), raw)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = ResponseCache()
+
+
+def _cache_key(request, use_cache: bool | None):
+    cacheable = use_cache if use_cache is not None else request.getapiname() in CACHEABLE_APIS
+    return request.cache_key() if cacheable else None
+
+
+def _parse_response(request, raw: bytes, response_name: str, cache_key=None, fresh: bool = False):
+    """ Декодирует ответ за один проход (`object_hook=SimpleNamespace`) и возвращает `result`.
+    Успешный свежий ответ сохраняется в `response_cache`.
+    """
     try:
-        response = request.getResponse()
-    except Exception as error:           
+        response = request.decodeResponse(raw, object_hook=lambda d: SimpleNamespace(**d))
+    except Exception as error:
         if hasattr(error, 'message'):
             #raise ApiRequestException(error.message) from error
-            #logger.critical(error.message,pprint(error))
-        #raise ApiRequestException(error) from error
-        #logger.critical(error.message,pprint(error))
-            ...    
-            return 
+            logger.warning(f'API error: {error}', exc_info=False)
+        return
 
     try:
-        response = response[response_name]['resp_result']
-        response = json.dumps(response)
-        response = json.loads(response, object_hook=lambda d: SimpleNamespace(**d))
+        response = getattr(response, response_name).resp_result
     except Exception as error:
         #raise ApiRequestResponseException(error) from error
-        logger.critical(error.message, pprint(error), exc_info=False)
-        return 
+        logger.critical(f'Unexpected response format: {response_name}', error, exc_info=False)
+        return
     try:
         if response.resp_code == 200:
+            if cache_key and fresh:
+                response_cache.put(cache_key, raw)
             return response.result
         else:
             #raise ApiRequestResponseException(f'Response code {response.resp_code} - {response.resp_msg}')
             logger.warning(f'Response code {response.resp_code} - {response.resp_msg}',exc_info=False)
-            return 
+            return
     except Exception as ex:
         logger.error(None, ex, exc_info=False)
-        return 
+        return
+
+
+def api_request(request, response_name, attemps:int = 1, use_cache: bool | None = None):
+    """ Выполняет запрос через пул соединений `RestApi`.
+
+    Args:
+        request (RestApi): Запрос SDK.
+        response_name (str): Ключ ответа, например `aliexpress_affiliate_productdetail_get_response`.
+        use_cache (bool | None): Использовать `response_cache`. По умолчанию - для API из `CACHEABLE_APIS`.
+    """
+    cache_key = _cache_key(request, use_cache)
+    raw = response_cache.get(cache_key) if cache_key else None
+    fresh = raw is None
+    if fresh:
+        try:
+            raw = request.getRawResponse()
+        except Exception as error:
+            #raise ApiRequestException(error) from error
+            logger.error(f'API request failed: {request.getapiname()}', error, exc_info=False)
+            return
+    return _parse_response(request, raw, response_name, cache_key, fresh)
+
 
+async def api_request_async(request, response_name, use_cache: bool | None = None):
+    """ Асинхронный вариант `api_request` (aiohttp, одна сессия на event loop). """
+    cache_key = _cache_key(request, use_cache)
+    raw = response_cache.get(cache_key) if cache_key else None
+    fresh = raw is None
+    if fresh:
+        try:
+            raw = await request.getRawResponseAsync()
+        except Exception as error:
+            logger.error(f'API request failed: {request.getapiname()}', error, exc_info=False)
+            return
+    return _parse_response(request, raw, response_name, cache_key, fresh)
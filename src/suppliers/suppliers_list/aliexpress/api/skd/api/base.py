@@ -15,8 +15,11 @@ import http.client as httplib
 import itertools
 import json
 import mimetypes
+import threading
 import time
 import urllib
+import urllib.parse
+import weakref
 
 """
 定义一些系统变量
@@ -43,6 +46,76 @@ P_SUB_MSG = "sub_msg"
 
 N_REST = "/sync"
 
+"""
+Пул соединений.
+http.client: одно keep-alive соединение на (домен, порт) в каждом потоке.
+HTTP/2 (RestApi.use_http2): общий httpx.Client(http2=True), если установлены httpx и h2.
+asyncio: одна aiohttp.ClientSession на event loop.
+"""
+_local = threading.local()
+_http2_client = None
+_http2_lock = threading.Lock()
+_async_sessions = weakref.WeakKeyDictionary()
+
+# Ошибки устаревшего keep-alive соединения: запрос повторяется один раз на новом соединении
+_RECONNECT_ERRORS = (httplib.HTTPException, ConnectionError, BrokenPipeError)
+
+
+def _get_connection(domain, port, timeout):
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    connection = connections.get((domain, port))
+    if connection is None:
+        connection_class = httplib.HTTPSConnection if port == 443 else httplib.HTTPConnection
+        connection = connections[(domain, port)] = connection_class(domain, port, timeout=timeout)
+    connection.timeout = timeout
+    if connection.sock is not None:
+        connection.sock.settimeout(timeout)
+    return connection
+
+
+def _drop_connection(domain, port):
+    connection = getattr(_local, "connections", {}).pop((domain, port), None)
+    if connection is not None:
+        connection.close()
+
+
+def _get_http2_client():
+    global _http2_client
+    if _http2_client is None:
+        with _http2_lock:
+            if _http2_client is None:
+                try:
+                    import httpx
+
+                    _http2_client = httpx.Client(http2=True)
+                except ImportError:  # <- httpx/h2 не установлены: используется http.client
+                    _http2_client = False
+    return _http2_client or None
+
+
+def _get_async_session():
+    import asyncio
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    session = _async_sessions.get(loop)
+    if session is None or session.closed:
+        session = _async_sessions[loop] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60)
+        )
+    return session
+
+
+async def close_async_session():
+    """Закрывает aiohttp-сессию текущего event loop."""
+    import asyncio
+
+    session = _async_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
 
 def sign(secret, parameters):
     # ===========================================================================
@@ -194,7 +267,9 @@ class RestApi(object):
     # Rest api的基类
     # ===========================================================================
 
-    def __init__(self, domain="api-sg.aliexpress.com", port=80):
+    use_http2 = False  # <- True: запросы через общий httpx.Client(http2=True), если httpx установлен
+
+    def __init__(self, domain="api-sg.aliexpress.com", port=443):
         # =======================================================================
         # 初始化基类
         # Args @param domain: 请求的域名或者ip
@@ -237,18 +312,10 @@ class RestApi(object):
     def _check_requst(self):
         pass
 
-    def getResponse(self, authrize=None, timeout=30):
+    def _prepare(self, authrize=None):
         # =======================================================================
-        # 获取response结果
+        # 签名并构造请求: (url, body, header)
         # =======================================================================
-        if self.__port == 443:
-            connection = httplib.HTTPSConnection(
-                self.__domain, self.__port, timeout=timeout
-            )
-        else:
-            connection = httplib.HTTPConnection(
-                self.__domain, self.__port, timeout=timeout
-            )
         timestamp_temp = "%.2f" % (float(time.time()))
         timestamp_temp = str(int(float(timestamp_temp) * 1000))
 
@@ -267,7 +334,6 @@ class RestApi(object):
         sign_parameter = sys_parameters.copy()
         sign_parameter.update(application_parameter)
         sys_parameters[P_SIGN] = sign(self.__secret, sign_parameter)
-        connection.connect()
 
         header = self.get_request_header()
         if self.getMultipartParas():
@@ -284,32 +350,118 @@ class RestApi(object):
             body = urllib.parse.urlencode(application_parameter)
 
         url = N_REST + "?" + urllib.parse.urlencode(sys_parameters)
-        connection.request(self.__httpmethod, url, body=body, headers=header)
-        response = connection.getresponse()
-        if response.status != 200:
+        return url, body, header
+
+    def cache_key(self, authrize=None):
+        # =======================================================================
+        # 缓存键: (api name, session, 应用参数). timestamp/sign 不参与
+        # =======================================================================
+        return (
+            self.getapiname(),
+            authrize,
+            tuple(sorted((key, str(value)) for key, value in self.getApplicationParameters().items())),
+        )
+
+    def _check_status(self, status, result):
+        if status != 200:
             raise RequestException(
                 "invalid http status "
-                + str(response.status)
+                + str(status)
                 + ",detail body:"
-                + response.read()
+                + result.decode("utf-8", errors="replace")
             )
-        result = response.read()
-        jsonobj = json.loads(result)
-        if "error_response" in jsonobj:
+        return result
+
+    def getRawResponse(self, authrize=None, timeout=30):
+        # =======================================================================
+        # 获取原始response (bytes). 连接复用 (keep-alive)
+        # =======================================================================
+        url, body, header = self._prepare(authrize)
+        scheme = "https" if self.__port == 443 else "http"
+
+        http2_client = _get_http2_client() if self.use_http2 else None
+        if http2_client is not None:
+            response = http2_client.request(
+                self.__httpmethod,
+                "%s://%s:%s%s" % (scheme, self.__domain, self.__port, url),
+                content=body.encode("utf-8"),
+                headers=header,
+                timeout=timeout,
+            )
+            self.__response_headers = dict(response.headers)
+            return self._check_status(response.status_code, response.content)
+
+        for attempt in range(2):
+            connection = _get_connection(self.__domain, self.__port, timeout)
+            try:
+                connection.request(self.__httpmethod, url, body=body, headers=header)
+                response = connection.getresponse()
+                result = response.read()
+            except _RECONNECT_ERRORS:
+                _drop_connection(self.__domain, self.__port)
+                if attempt:
+                    raise
+                continue
+            if response.will_close:
+                _drop_connection(self.__domain, self.__port)
+            break
+        self.__response_headers = dict(response.getheaders())
+        return self._check_status(response.status, result)
+
+    async def getRawResponseAsync(self, authrize=None, timeout=30):
+        # =======================================================================
+        # 获取原始response (bytes), asyncio 版本 (aiohttp, 每个 event loop 一个会话)
+        # =======================================================================
+        import aiohttp
+
+        url, body, header = self._prepare(authrize)
+        scheme = "https" if self.__port == 443 else "http"
+        async with _get_async_session().request(
+            self.__httpmethod,
+            "%s://%s:%s%s" % (scheme, self.__domain, self.__port, url),
+            data=body.encode("utf-8"),
+            headers=header,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            result = await response.read()
+            self.__response_headers = dict(response.headers)
+            return self._check_status(response.status, result)
+
+    def decodeResponse(self, result, object_hook=None):
+        # =======================================================================
+        # 一次解析: object_hook 直接构造模型 (例如 SimpleNamespace)
+        # =======================================================================
+        jsonobj = json.loads(result, object_hook=object_hook)
+        if isinstance(jsonobj, dict):
+            error_response = jsonobj.get("error_response")
+            get = lambda obj, key: obj.get(key) if isinstance(obj, dict) else None
+        else:
+            error_response = getattr(jsonobj, "error_response", None)
+            get = lambda obj, key: getattr(obj, key, None)
+        if error_response is not None:
+            headers = getattr(self, "_RestApi__response_headers", None) or {}
             error = TopException()
-            if P_CODE in jsonobj["error_response"]:
-                error.errorcode = jsonobj["error_response"][P_CODE]
-            if P_MSG in jsonobj["error_response"]:
-                error.message = jsonobj["error_response"][P_MSG]
-            if P_SUB_CODE in jsonobj["error_response"]:
-                error.subcode = jsonobj["error_response"][P_SUB_CODE]
-            if P_SUB_MSG in jsonobj["error_response"]:
-                error.submsg = jsonobj["error_response"][P_SUB_MSG]
-            error.application_host = response.getheader("Application-Host", "")
-            error.service_host = response.getheader("Location-Host", "")
+            error.errorcode = get(error_response, P_CODE)
+            error.message = get(error_response, P_MSG)
+            error.subcode = get(error_response, P_SUB_CODE)
+            error.submsg = get(error_response, P_SUB_MSG)
+            error.application_host = headers.get("Application-Host", "")
+            error.service_host = headers.get("Location-Host", "")
             raise error
         return jsonobj
 
+    def getResponse(self, authrize=None, timeout=30, object_hook=None):
+        # =======================================================================
+        # 获取response结果
+        # =======================================================================
+        return self.decodeResponse(self.getRawResponse(authrize, timeout), object_hook)
+
+    async def getResponseAsync(self, authrize=None, timeout=30, object_hook=None):
+        # =======================================================================
+        # 获取response结果 (asyncio)
+        # =======================================================================
+        return self.decodeResponse(await self.getRawResponseAsync(authrize, timeout), object_hook)
+
     def getApplicationParameters(self):
         application_parameter = {}
         for key in self.__dict__:
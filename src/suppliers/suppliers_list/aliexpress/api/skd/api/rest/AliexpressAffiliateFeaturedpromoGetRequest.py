@@ -10,7 +10,7 @@ from ..base import RestApi
 
 
 class AliexpressAffiliateFeaturedpromoGetRequest(RestApi):
-    def __init__(self, domain="api-sg.aliexpress.com", port=80):
+    def __init__(self, domain="api-sg.aliexpress.com", port=443):
         RestApi.__init__(self, domain, port)
         self.app_signature = None
         self.fields = None
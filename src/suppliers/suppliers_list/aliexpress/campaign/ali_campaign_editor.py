@@ -273,7 +273,7 @@ class AliCampaignEditor(AliPromoCampaign):
             / category_name
             / f"{self.language}_{self.currency}"
         )
-        json_filenames = await get_filenames_from_directory (category_path, extensions="json")
+        json_filenames = get_filenames_from_directory(category_path, ext="json")
         products = []
 
         if json_filenames:
@@ -286,5 +286,4 @@ class AliCampaignEditor(AliPromoCampaign):
             logger.error(
                 f"No JSON files found for {category_name=} at {category_path=}.\nStart prepare category"
             )
-            self.process_category_products(category_name)
-            return 
+            return await self.process_category_products_async(category_name)  # <- в работающем event loop `asyncio.run` недоступен
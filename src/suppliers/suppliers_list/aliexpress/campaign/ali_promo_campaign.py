@@ -27,6 +27,10 @@
     >>> campaign = AliPromoCampaign("new_campaign", "EN", "USD")
     >>> campaign.process_campaign()
 
+Пример параллельной обработки категорий в уже работающем event loop:
+
+    >>> results = await campaign.process_campaign_async(concurrency=8)
+
 Пример обработки данных о товарах в категории:
 
     >>> campaign = AliPromoCampaign("new_campaign", "EN", "USD")
@@ -46,6 +50,7 @@ import html
 from pathlib import Path
 from types import SimpleNamespace
 from typing import List, Optional, Dict
+import aiohttp
 import header
 from src import gs
 from src.suppliers.suppliers_list.aliexpress import campaign
@@ -64,7 +69,7 @@ from src.utils.file import (read_text_file,
                         get_filenames_from_directory,
                         get_directory_names,
                         )
-from src.utils.jjson import j_dumps, j_loads_ns, j_loads
+from src.utils.jjson import j_dumps, j_loads_ns, j_loads, JsonlWriter
 from src.utils.convertors.csv import csv2dict
 from src.utils.file import save_text_file
 from src.utils.printer import pprint
@@ -84,6 +89,10 @@ class AliPromoCampaign:
     campaign_ai: SimpleNamespace = None
     gemini: GoogleGenerativeAi = None
     openai: OpenAIModel = None
+    category_concurrency: int = 4  # <- Категорий, обрабатываемых одновременно в `process_campaign_async`
+    gemini_account: str = 'onela'  # <- Ключ API из `gs.credentials.gemini.<gemini_account>.api_key`
+    gemini_model_name: Optional[str] = None  # <- По умолчанию - модель из `gemini.json`
+    openai_assistant_id: str = "asst_dr5AgQnhhhnef5OSMzQ9zdk9"  # <- Ассистент OpenAI: категории и описания по списку названий товаров
 
     def __init__(
         self,
@@ -112,7 +121,7 @@ class AliPromoCampaign:
         self.base_path = gs.path.google_drive / "aliexpress" / "campaigns" / campaign_name
         campaign_file_path = self.base_path / f"{language}_{currency}.json"
         self.campaign = j_loads_ns(
-            campaign_file_path, exc_info=False
+            campaign_file_path
         )  # <- файла может не быть, если я создаю новую рекламную камапнию - файл будет создан ИИ
         if not self.campaign:
             logger.warning(
@@ -139,31 +148,120 @@ class AliPromoCampaign:
         self._models_payload()
 
 
-    def _models_payload(self):
-        """ """
+    def _models_payload(self) -> bool:
+        """Инициализирует модель Gemini для описаний категорий.
+
+        Returns:
+            bool: `True`, если модель инициализирована. Без ключа API категории обрабатываются без описаний LLM.
+        """
         #self.campaign_ai_file_name = f"{self.language}_{self.currency}_{model}_{gs.now}.json"
         system_instruction_path = gs.path.src / 'ai' / 'prompts' / 'aliexpress_campaign' / 'system_instruction.txt'
-        system_instruction: str = read_text_file(system_instruction_path)
+        system_instruction: str = read_text_file(system_instruction_path, exc_info=False)
         #self.model = OpenAIModel(system_instruction=system_instruction, 
         #                         assistant_id = gs.credentials.openai.assistant.category_descriptions)  
-        self.gemini = GoogleGenerativeAi(system_instruction = system_instruction)
-        assistant_id = "asst_dr5AgQnhhhnef5OSMzQ9zdk9" # <-  задача asst_dr5AgQnhhhnef5OSMzQ9zdk9 создание категорий и описаний на основе списка названий товаров
-        #self.openai = OpenAIModel(system_instruction = system_instruction, assistant_id = assistant_id)
+        api_key: Optional[str] = getattr(getattr(gs.credentials.gemini, self.gemini_account, None), 'api_key', None)
+        if not api_key:
+            logger.error(f"Не найден ключ API Gemini `gs.credentials.gemini.{self.gemini_account}.api_key`", None, False)
+            return False
+        try:
+            self.gemini = GoogleGenerativeAi(
+                api_key = api_key,
+                model_name = self.gemini_model_name or GoogleGenerativeAi.model_name,
+                system_instruction = system_instruction,
+                use_cache = True,  # <- повторный запуск кампании берет ответы из кэша
+            )
+        except Exception as ex:
+            logger.error("Не удалось инициализировать модель Gemini для кампании", ex, False)
+            return False
+        return True
 
-    def process_campaign(self):
-        """Функция итерируется по категориям рекламной кампании и обрабатывает товары категории через генератор партнерских ссылок.
+    def process_campaign(self, concurrency: Optional[int] = None) -> List[SimpleNamespace]:
+        """Функция обрабатывает категории рекламной кампании: товары категории через генератор партнерских ссылок,
+        затем описание категории через LLM. Категории обрабатываются параллельно (`process_campaign_async`).
+
+        Args:
+            concurrency (Optional[int]): Категорий одновременно. По умолчанию `category_concurrency`.
+
+        Returns:
+            List[SimpleNamespace]: Результаты по категориям (см. `process_campaign_async`).
 
         Example:
             >>> campaign.process_campaign()
         """
-        ...
-        categories_names_list = get_directory_names(self.base_path / 'category') # читаю название папок категорий
-        for category_name in categories_names_list:
+        return asyncio.run(self.process_campaign_async(concurrency=concurrency))
+
+    async def process_campaign_async(
+        self,
+        categories: Optional[List[str]] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[SimpleNamespace]:
+        """Параллельная обработка категорий рекламной кампании.
+
+        Все категории обрабатываются в одном event loop и используют один `AliAffiliatedProducts`
+        (общий лимит запросов к API), одну HTTP-сессию для загрузки изображений и видео и одну модель LLM.
+        Одновременно обрабатывается не более `concurrency` категорий.
+        Результат каждой категории дописывается строкой в `ai/campaign_<gs.now>_<language>_<currency>.jsonl`
+        сразу по ее завершении. AI-кампания сохраняется в `ai/gemini_<gs.now>_<language>_<currency>.json`.
+
+        Args:
+            categories (Optional[List[str]]): Названия категорий. По умолчанию - названия директорий в `category`.
+            concurrency (Optional[int]): Категорий одновременно. По умолчанию `category_concurrency`.
+
+        Returns:
+            List[SimpleNamespace]: Результаты в порядке завершения: `category_name`, `products` (количество товаров),
+            `llm` (описание категории получено), `error`.
+
+        Example:
+            >>> results = await campaign.process_campaign_async(concurrency=8)
+            >>> print([r.category_name for r in results if r.error])
+        """
+        if categories is None:
+            categories = get_directory_names(self.base_path / 'category')  # <- читаю название папок категорий
+        if not categories:
+            logger.warning(f"No categories found in {self.base_path / 'category'}")
+            return []
+
+        if not self.gemini and not self._models_payload():
+            logger.warning("Категории будут обработаны без описаний LLM")
+        campaign_ai = copy.copy(self.campaign)
+        promo_generator = AliAffiliatedProducts(language=self.language, currency=self.currency)
+        semaphore = asyncio.Semaphore(concurrency or self.category_concurrency)
+        timestamp: str = gs.now
+        results: List[SimpleNamespace] = []
+
+        async def _run(category_name: str) -> SimpleNamespace:
+            async with semaphore:
+                return await self._process_category_async(category_name, campaign_ai, promo_generator, session)
+
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=promo_generator.download_concurrency)) as session:
+            with JsonlWriter(self.base_path / 'ai' / f'campaign_{timestamp}_{self.language}_{self.currency}.jsonl', flush_every=1) as writer:
+                for task in asyncio.as_completed([_run(category_name) for category_name in categories]):
+                    result: SimpleNamespace = await task
+                    writer.write(result)
+                    results.append(result)
+
+        j_dumps(campaign_ai, self.base_path / 'ai' / f'gemini_{timestamp}_{self.language}_{self.currency}.json')
+        return results
+
+    async def _process_category_async(
+        self,
+        category_name: str,
+        campaign_ai: SimpleNamespace,
+        promo_generator: AliAffiliatedProducts,
+        session: aiohttp.ClientSession,
+    ) -> SimpleNamespace:
+        """Обрабатывает одну категорию для `process_campaign_async`. Ошибка категории не прерывает остальные."""
+        result = SimpleNamespace(category_name=category_name, products=0, llm=False, error=None)
+        try:
             logger.info(f"Starting {category_name=}")
-            self.process_category_products(category_name)
-            logger.info(f"Starting AI category")
-            self.process_llm_category(category_name)
-            ...
+            products = await self.process_category_products_async(category_name, promo_generator=promo_generator, session=session)
+            result.products = len(products or [])
+            logger.info(f"Starting AI {category_name=}")
+            result.llm = await self.process_llm_category_async(category_name, campaign_ai)
+        except Exception as ex:
+            logger.error(f"Error processing {category_name=}", ex, exc_info=False)
+            result.error = str(ex)
+        return result
 
 
     def process_campaign_category(
@@ -284,14 +382,11 @@ class AliPromoCampaign:
                 self.campaign
             )  # <- паралельно создаю ai кампанию
             self.campaign_ai_file_name = f"{language}_{currency}_AI_{gs.now}.json"
-            for category_name in self.campaign.category.__dict__:
-                self.process_category_products(category_name)
-
-                self.process_llm_category(category_name)
-                j_dumps(
-                    self.campaign_ai,
-                    self.base_path / f"{self.language}_{self.currency}.json",
-                )  # <- в вновь созданный файл категорий
+            asyncio.run(self.process_campaign_async(categories=list(vars(self.campaign.category))))
+            j_dumps(
+                self.campaign_ai,
+                self.base_path / f"{self.language}_{self.currency}.json",
+            )  # <- в вновь созданный файл категорий
 
     def process_llm_category(self, category_name: Optional[str] = None):
         """Processes the AI campaign for a specified category or all categories.
@@ -350,48 +445,8 @@ class AliPromoCampaign:
         """
         campaign_ai = copy.copy(self.campaign)
 
-
-        def _process_category(category_name: str):
-            """Processes AI-generated category data and updates the campaign category."""
-
-            titles_path: Path = (
-                self.base_path
-                / "category"
-                / category_name
-                / f"{campaign_ai.language}_{campaign_ai.currency}"
-                / "product_titles.txt"
-            )
-            product_titles = read_text_file(titles_path, as_list=True)
-            prompt = f"language={campaign_ai.language}\n{category_name=}\n{product_titles=}"
-
-            if not self.gemini or not self.openai:
-                self._models_payload()
-
-            def get_response(_attempts: int = 5):
-                """Gets the response from the AI model."""
-                #return [self.gemini.ask(prompt), self.openai.ask(prompt)]
-                #gemini_response, openai_response = self.gemini.ask(prompt), self.openai.ask(prompt)
-                return self.gemini.ask(prompt)
-                ...
-
-            response = get_response()
-            if not response:
-                return
-
-            try:
-                res_ns: SimpleNamespace = j_loads_ns(response)  # <- превращаю ответ машины в объект SimpleNamespace
-                if hasattr(campaign_ai.category, category_name):
-                    current_category = getattr(campaign_ai.category, category_name)
-                    nested_category_ns = getattr(res_ns, category_name)
-                    for key, value in vars(nested_category_ns).items():
-                        setattr(current_category, key, fix_json_string(value))
-                    logger.debug(f"Category {category_name=} updated", None, False)
-                else:
-                    setattr(campaign_ai.category, category_name, res_ns)
-                    logger.debug(f"Category {category_name=} created")
-            except Exception as ex:
-                logger.error(f"Error updating campaign for {category_name=}: ", ex, exc_info=False)
-                ...
+        if not self.gemini and not self._models_payload():
+            return
 
         # if category_name:
         #     if not _process_category(category_name):
@@ -401,11 +456,60 @@ class AliPromoCampaign:
         #         _process_category(category_name)
         
         for category_name in vars(campaign_ai.category).keys():
-            _process_category(category_name)
+            response = self.gemini.ask(self._llm_category_prompt(campaign_ai, category_name))
+            if response:
+                self._update_llm_category(campaign_ai, category_name, response)
 
         j_dumps(campaign_ai, self.base_path / "ai" / f"gemini_{gs.now}_{self.language}_{self.currency}.json")
         return
 
+    async def process_llm_category_async(self, category_name: str, campaign_ai: SimpleNamespace) -> bool:
+        """Асинхронно запрашивает у модели описание одной категории и обновляет `campaign_ai`.
+
+        Args:
+            category_name (str): Название категории.
+            campaign_ai (SimpleNamespace): AI-кампания, в которую записывается результат.
+
+        Returns:
+            bool: `True`, если ответ модели получен и записан в кампанию.
+        """
+        if not self.gemini:
+            return False
+        response = await self.gemini.ask_async(self._llm_category_prompt(campaign_ai, category_name))
+        if not response:
+            return False
+        return self._update_llm_category(campaign_ai, category_name, response)
+
+    def _llm_category_prompt(self, campaign_ai: SimpleNamespace, category_name: str) -> str:
+        """Builds the LLM prompt from the product titles of the category."""
+        titles_path: Path = (
+            self.base_path
+            / "category"
+            / category_name
+            / f"{campaign_ai.language}_{campaign_ai.currency}"
+            / "product_titles.txt"
+        )
+        product_titles = read_text_file(titles_path, as_list=True)
+        return f"language={campaign_ai.language}\n{category_name=}\n{product_titles=}"
+
+    def _update_llm_category(self, campaign_ai: SimpleNamespace, category_name: str, response: str) -> bool:
+        """Processes AI-generated category data and updates the campaign category."""
+        try:
+            res_ns: SimpleNamespace = j_loads_ns(response)  # <- превращаю ответ машины в объект SimpleNamespace
+            if hasattr(campaign_ai.category, category_name):
+                current_category = getattr(campaign_ai.category, category_name)
+                nested_category_ns = getattr(res_ns, category_name)
+                for key, value in vars(nested_category_ns).items():
+                    setattr(current_category, key, html.unescape(value) if isinstance(value, str) else value)
+                logger.debug(f"Category {category_name=} updated", None, False)
+            else:
+                setattr(campaign_ai.category, category_name, res_ns)
+                logger.debug(f"Category {category_name=} created")
+            return True
+        except Exception as ex:
+            logger.error(f"Error updating campaign for {category_name=}: ", ex, exc_info=False)
+            return False
+
     def process_category_products(
         self, category_name: str
     ) -> Optional[List[SimpleNamespace]]:
@@ -476,6 +580,25 @@ class AliPromoCampaign:
 
         """
 
+        return asyncio.run(self.process_category_products_async(category_name))
+
+    async def process_category_products_async(
+        self,
+        category_name: str,
+        promo_generator: Optional[AliAffiliatedProducts] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> Optional[List[SimpleNamespace]]:
+        """Асинхронный вариант `process_category_products`.
+
+        Args:
+            category_name (str): Название категории.
+            promo_generator (Optional[AliAffiliatedProducts]): Общий генератор партнерских ссылок. По умолчанию создается новый.
+            session (Optional[aiohttp.ClientSession]): Общая сессия для загрузки изображений и видео.
+
+        Returns:
+            Optional[List[SimpleNamespace]]: Товары категории или `None`.
+        """
+
         def read_sources(category_name: str) -> Optional[List[str]]:
             """Reads product sources and extracts product IDs.
 
@@ -495,11 +618,8 @@ class AliPromoCampaign:
                 in the category's `sources` directory. If no product IDs are found, it returns `None`.
             """
             product_ids = []
-            html_files = get_filenames(
-                self.base_path / "category" / category_name / "sources",
-                extensions=".html",
-                exc_info=False,
-            )
+            sources_dir: Path = self.base_path / "category" / category_name / "sources"
+            html_files = get_filenames_from_directory(sources_dir, ext="html") if sources_dir.is_dir() else []
             if html_files:
                 product_ids.extend(extract_prod_ids(html_files))
             product_urls = read_text_file(
@@ -525,16 +645,17 @@ class AliPromoCampaign:
             ...
             return
 
-        promo_generator = AliAffiliatedProducts(
+        promo_generator = promo_generator or AliAffiliatedProducts(
             language = self.language, currency = self.currency
         )
 
-        return asyncio.run(promo_generator.process_affiliate_products(
+        return await promo_generator.process_affiliate_products(
             prod_ids = prod_ids,
             category_root = self.base_path
             / "category"
             / category_name,
-        ))
+            session = session,
+        )
 
 
     def dump_category_products_files(
@@ -16,7 +16,7 @@ from types import SimpleNamespace
 from typing import Optional, Any
 #from src.webdriver.driver import Driver, Chrome, Firefox, Edge
 from gspread.worksheet import Worksheet
-from src.goog.spreadsheet.spreadsheet import SpreadSheet
+from src.goog.spreadsheet.spreadsheet import SpreadSheet, WorksheetBatch
 from src.utils.jjson import j_dumps
 from src.utils.printer import pprint
 from src.logger.logger import logger
@@ -96,29 +96,21 @@ class AliCampaignGoogleSheet(SpreadSheet):
         @param currency `str`: Optional currency parameter.
         """
         try:
-            ws: Worksheet = self.get_worksheet('campaign')  # Clear the 'campaign' worksheet
+            ws: Worksheet = self.get_worksheet('campaign')
         
             # Prepare data for vertical writing
-            updates = []
             vertical_data = [
-                ('A1', 'Campaign Name', campaign.campaign_name),
-                ('A2', 'Campaign Title', campaign.title),
-                ('A3', 'Campaign Language', campaign.language),
-                ('A4', 'Campaign Currency', campaign.currency),
-                ('A5', 'Campaign Description', campaign.description),              
-                
+                ['Campaign Name', campaign.campaign_name],
+                ['Campaign Title', campaign.title],
+                ['Campaign Language', campaign.language],
+                ['Campaign Currency', campaign.currency],
+                ['Campaign Description', campaign.description],
             ]
         
-            # Add update operations to batch_update list
-            for cell, header, value in vertical_data:
-                updates.append({'range': cell, 'values': [[header]]})
-                updates.append({'range': f'B{cell[1]}', 'values': [[str(value)]]})
+            # Only cells that differ from the local snapshot are written
+            result = self.sync_values(ws, [[header, str(value)] for header, value in vertical_data])
         
-            # Perform batch update
-            if updates:
-                ws.batch_update(updates)
-        
-            logger.info("Campaign data written to 'campaign' worksheet vertically.")
+            logger.info(f"Campaign data written to 'campaign' worksheet vertically: {result.cells} cells changed.")
         
         except Exception as ex:
             logger.error("Error setting campaign worksheet.", ex, exc_info=True)
@@ -182,13 +174,12 @@ class AliCampaignGoogleSheet(SpreadSheet):
                     ', '.join(_.get('tags', []))
                 ])
             
-            for index, row in enumerate(row_data, start=2):
-                ws.update(f'A{index}:Y{index}', [row])
-                logger.info(f"Products {str(_.get('product_id'))} updated .")
-
-            self._format_category_products_worksheet(ws)
+            # Все строки и форматирование - одним пакетом (1-3 запроса к API вместо запроса на каждый товар)
+            with self.batch(ws) as batch:
+                batch.update('A2', row_data)
+                self._format_category_products_worksheet(ws, batch)
 
-            logger.info("Products updated in worksheet.")
+            logger.info(f"{len(row_data)} products updated in worksheet.")
 
 
         except Exception as ex:
@@ -200,7 +191,6 @@ class AliCampaignGoogleSheet(SpreadSheet):
         @param categories `SimpleNamespace`: Объект, где ключи — это категории с данными для записи.
         """
         ws: Worksheet = self.get_worksheet('categories')
-        ws.clear()  # Очистка рабочей таблицы перед записью данных
     
         try:
             # Получение всех ключей (категорий) и соответствующих значений
@@ -212,10 +202,9 @@ class AliCampaignGoogleSheet(SpreadSheet):
             if all(all(hasattr(category, attr) for attr in required_attrs) for category in category_data.values()):
                 # Заголовки для таблицы
                 headers = ['Name', 'Title', 'Description', 'Tags', 'Products Count']
-                ws.update('A1:E1', [headers])
             
                 # Подготовка данных для записи
-                rows = []
+                rows = [headers]
                 for category in category_data.values():
                     row_data = [
                         category.name,
@@ -226,13 +215,14 @@ class AliCampaignGoogleSheet(SpreadSheet):
                     ]
                     rows.append(row_data)
             
-                # Обновляем строки данных
-                ws.update(f'A2:E{1 + len(rows)}', rows)
-            
-                # Форматируем таблицу
-                self._format_categories_worksheet(ws)
+                # Лист не очищается: записываются только ячейки, отличные от локального снимка.
+                # Форматирование - только при первой записи в пустой лист
+                with self.batch(ws) as batch:
+                    if not self.get_values(ws):
+                        self._format_categories_worksheet(ws, batch)
+                    result = self.sync_values(ws, rows, batch)
             
-                logger.info("Category fields updated from SimpleNamespace object.")
+                logger.info(f"Category fields updated from SimpleNamespace object: {result.cells} cells changed.")
             else:
                 logger.warning("One or more category objects do not contain all required attributes.")
     
@@ -245,8 +235,7 @@ class AliCampaignGoogleSheet(SpreadSheet):
         """ Получение данных из таблицы Google Sheets.
         @return Данные из таблицы в виде списка словарей.
         """
-        ws = self.get_worksheet('categories') 
-        data = ws.get_all_records()
+        data = self.get_records('categories')  # <- из локального снимка, если таблица не менялась
         logger.info("Categories data retrieved from worksheet.")
         return data
 
@@ -273,9 +262,7 @@ class AliCampaignGoogleSheet(SpreadSheet):
                 'target_original_price_currency', 'original_price_currency', 'product_title',
                 'evaluate_rate', 'promotion_link', 'shop_url', 'shop_id', 'tags'
             ]
-            updates = [{'range': 'A1:Y1', 'values': [headers]}]  # Add headers to the worksheet
-
-            row_data = []
+            row_data = [headers]
             for product in products:
                 _ = product.__dict__
                 row_data.append([
@@ -306,89 +293,65 @@ class AliCampaignGoogleSheet(SpreadSheet):
                     ', '.join(_.get('tags', []))
                 ])
             
-            for index, row in enumerate(row_data, start=2):
-                ws.update(f'A{index}:Y{index}', [row])
-                logger.info(f"Products {str(_.get('product_id'))} updated .")
+            with self.batch(ws) as batch:
+                batch.update('A1', row_data)
+                self._format_category_products_worksheet(ws, batch)
 
-            self._format_category_products_worksheet(ws)
-
-            logger.info("Products updated in worksheet.")
+            logger.info(f"{len(row_data) - 1} products updated in worksheet.")
         except Exception as ex:
             logger.error("Error updating products in worksheet.", ex, exc_info=True)
             raise
 
-    def _format_categories_worksheet(self, ws: Worksheet):
+    # Формат заголовков таблиц (`CellFormat` Google Sheets API)
+    header_format: dict = {
+        'textFormat': {'bold': True, 'fontSize': 12},
+        'horizontalAlignment': 'CENTER',
+        'backgroundColor': {'red': 0.8, 'green': 0.8, 'blue': 0.8},
+    }
+
+    def _format_categories_worksheet(self, ws: Worksheet, batch: Optional[WorksheetBatch] = None):
         """ Форматирование листа 'categories'.
         @param ws Лист Google Sheets для форматирования.
+        @param batch Пакет записи. Если не передан - форматирование отправляется отдельным пакетом.
         """
         try:
+            fmt: WorksheetBatch = batch or self.batch(ws)
             # Установка ширины столбцов
-            set_column_width(ws, 'A:A', 150)  # Ширина столбца A
-            set_column_width(ws, 'B:B', 200)  # Ширина столбца B
-            set_column_width(ws, 'C:C', 300)  # Ширина столбца C
-            set_column_width(ws, 'D:D', 200)  # Ширина столбца D
-            set_column_width(ws, 'E:E', 150)  # Ширина столбца E
-            
+            for columns, width in (('A', 150), ('B', 200), ('C', 300), ('D', 200), ('E', 150)):
+                fmt.set_column_width(columns, width)
+
             # Установка высоты строк
-            set_row_height(ws, '1:1', 40)  # Высота заголовков
+            fmt.set_row_height('1', 40)  # Высота заголовков
 
             # Форматирование заголовков
-            header_format = cellFormat(
-                textFormat=textFormat(bold=True, fontSize=12),
-                horizontalAlignment='CENTER',
-                verticalAlignment='MIDDLE',  # Добавлено вертикальное выравнивание
-                backgroundColor=Color(0.8, 0.8, 0.8)  # Используем Color для задания цвета
-            )
-            format_cell_range(ws, 'A1:E1', header_format)
+            fmt.format('A1:E1', {**self.header_format, 'verticalAlignment': 'MIDDLE'})
+            if not batch:
+                fmt.flush()
 
             logger.info("Categories worksheet formatted.")
         except Exception as ex:
             logger.error("Error formatting categories worksheet.", ex, exc_info=True)
             raise
 
-    def _format_category_products_worksheet(self, ws: Worksheet):
+    def _format_category_products_worksheet(self, ws: Worksheet, batch: Optional[WorksheetBatch] = None):
         """ Форматирование листа с товарами категории.
         @param ws Лист Google Sheets для форматирования.
+        @param batch Пакет записи. Если не передан - форматирование отправляется отдельным пакетом.
         """
         try:
+            fmt: WorksheetBatch = batch or self.batch(ws)
             # Установка ширины столбцов
-            set_column_width(ws, 'A:A', 250)  # Ширина столбца A
-            set_column_width(ws, 'B:B', 220)  # Ширина столбца B
-            set_column_width(ws, 'C:C', 220)  # Ширина столбца C
-            set_column_width(ws, 'D:D', 220)  # Ширина столбца D
-            set_column_width(ws, 'E:E', 200)  # Ширина столбца E
-            set_column_width(ws, 'F:F', 200)  # Ширина столбца F
-            set_column_width(ws, 'G:G', 200)  # Ширина столбца G
-            set_column_width(ws, 'H:H', 200)  # Ширина столбца H
-            set_column_width(ws, 'I:I', 200)  # Ширина столбца I
-            set_column_width(ws, 'J:J', 200)  # Ширина столбца J
-            set_column_width(ws, 'K:K', 200)  # Ширина столбца K
-            set_column_width(ws, 'L:L', 200)  # Ширина столбца L
-            set_column_width(ws, 'M:M', 200)  # Ширина столбца M
-            set_column_width(ws, 'N:N', 200)  # Ширина столбца N
-            set_column_width(ws, 'O:O', 200)  # Ширина столбца O
-            set_column_width(ws, 'P:P', 200)  # Ширина столбца P
-            set_column_width(ws, 'Q:Q', 200)  # Ширина столбца Q
-            set_column_width(ws, 'R:R', 200)  # Ширина столбца R
-            set_column_width(ws, 'S:S', 200)  # Ширина столбца S
-            set_column_width(ws, 'T:T', 200)  # Ширина столбца T
-            set_column_width(ws, 'U:U', 200)  # Ширина столбца U
-            set_column_width(ws, 'V:V', 200)  # Ширина столбца V
-            set_column_width(ws, 'W:W', 200)  # Ширина столбца W
-            set_column_width(ws, 'X:X', 200)  # Ширина столбца X
-            set_column_width(ws, 'Y:Y', 200)  # Ширина столбца Y
+            fmt.set_column_width('A', 250)  # Ширина столбца A
+            fmt.set_column_width('B:D', 220)  # Ширина столбцов B-D
+            fmt.set_column_width('E:Y', 200)  # Ширина столбцов E-Y
 
             # Установка высоты строк
-            set_row_height(ws, '1:1', 40)  # Высота заголовков
+            fmt.set_row_height('1', 40)  # Высота заголовков
 
             # Форматирование заголовков
-            header_format = cellFormat(
-                textFormat=textFormat(bold=True, fontSize=12),
-                horizontalAlignment='CENTER',
-                verticalAlignment='TOP',  # Добавлено вертикальное выравнивание
-                backgroundColor=Color(0.8, 0.8, 0.8)  # Используем Color для задания цвета
-            )
-            format_cell_range(ws, 'A1:Y1', header_format)
+            fmt.format('A1:Y1', {**self.header_format, 'verticalAlignment': 'TOP'})
+            if not batch:
+                fmt.flush()
 
             logger.info("Category products worksheet formatted.")
         except Exception as ex:
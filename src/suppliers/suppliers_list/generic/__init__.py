@@ -0,0 +1,14 @@
+## \file /src/suppliers/suppliers_list/generic/__init__.py
+# -*- coding: utf-8 -*-
+
+#! .pyenv/bin/python3
+
+"""
+.. module:: src.suppliers.suppliers_list.generic
+	:platform: Windows, Unix
+	:synopsis: Универсальный грабер для сайтов, которых нет в реестре поставщиков.
+
+"""
+
+
+from .graber import Graber
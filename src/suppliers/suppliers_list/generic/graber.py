@@ -0,0 +1,31 @@
+## \file /src/suppliers/suppliers_list/generic/graber.py
+# -*- coding: utf-8 -*-
+
+#! .pyenv/bin/python3
+
+"""
+.. module:: src.suppliers.suppliers_list.generic
+	:platform: Windows, Unix
+	:synopsis: Универсальный грабер для страниц товара неизвестных поставщиков.
+    Используется `get_graber_by_supplier_url`, если хост URL не найден в реестре поставщиков.
+    Поля берутся из разметки OpenGraph/schema.org (`og:title`, `og:description`, `og:image`, `product:price:amount`),
+    которую большинство магазинов отдает в HTML, поэтому поля собираются по снимку DOM.
+"""
+
+from typing import Optional
+import header
+from src.suppliers.graber import Graber as Grbr, Config
+from src.logger.logger import logger
+
+
+class Graber(Grbr):
+    """Класс сбора полей товара по разметке OpenGraph/schema.org."""
+    supplier_prefix: str
+    snapshot_mode: bool = True  # <- все локаторы читают `<meta>`: достаточно одного `page_source`
+
+    def __init__(self, driver: Optional['Driver'] = None, lang_index:Optional[int] = None):
+        """Инициализация класса сбора полей товара."""
+        self.supplier_prefix = 'generic'
+        super().__init__(supplier_prefix=self.supplier_prefix, driver=driver, lang_index=lang_index)
+
+        Config.locator_for_decorator = None # <- если будет уастановлено значение - то оно выполнится в декораторе `@close_pop_up`
@@ -25,6 +25,7 @@ from src import gs
 from src.suppliers.graber import Graber as Grbr, Config, close_pop_up
 #from src.webdriver.driver import Driver
 from src.utils.jjson import j_loads_ns
+from src.webdriver.locator import compile_locators
 from src.logger.logger import logger
 
 #
@@ -60,12 +61,16 @@ class Graber(Grbr):
         """Инициализация класса сбора полей товара."""
         self.supplier_prefix = 'ksp'
         super().__init__(supplier_prefix=self.supplier_prefix, driver=driver, lang_index=lang_index)
-        time.sleep(3)
-        if '/mob/' in self.driver.current_url: # <- бывет, что подключается к мобильной версии сайта
-            self.locator = j_loads_ns(gs.path.src / 'suppliers' / 'ksp' / 'locators' / 'product_mobile_site.json')
-            logger.info("Установлены локаторы для мобильной версии сайта KSP")
-            ...
 
         Config.locator_for_decorator = None # <- если будет уастановлено значение - то оно выполнится в декораторе `@close_pop_up`
 
+    async def open_page(self, url: str, page: str = 'product', driver: Optional['Driver'] = None) -> bool:
+        """Открывает страницу. Если сайт перенаправил на мобильную версию - устанавливает ее локаторы товара."""
+        if not await super().open_page(url, page, driver):
+            return False
+        if page == 'product' and '/mob/' in (driver or self.driver).current_url: # <- бывет, что подключается к мобильной версии сайта
+            self.product_locator = compile_locators(j_loads_ns(gs.path.src / 'suppliers' / 'suppliers_list' / 'ksp' / 'locators' / 'product_mobile_site.json', shared=True))
+            logger.info("Установлены локаторы для мобильной версии сайта KSP")
+        return True
+
         
\ No newline at end of file
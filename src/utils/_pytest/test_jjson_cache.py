@@ -0,0 +1,138 @@
+## \file /src/utils/_pytest/test_jjson_cache.py
+# -*- coding: utf-8 -*-
+
+#! .pyenv/bin/python3
+
+"""
+.. module:: src.utils._pytest
+	:platform: Windows, Unix
+	:synopsis: Tests for `JsonCache` and the cached `j_loads`/`j_loads_ns`.
+
+#Fixtures:
+ - json_file: JSON file in a temporary directory, the cache is cleared before and after the test.
+
+#Tests:
+ - test_cache_hit_returns_copy: A hit does not re-read the file and the caller can't change the cached data.
+ - test_cache_invalidated_on_change: A changed `mtime`/size invalidates the entry.
+ - test_put_keeps_stat_taken_before_read: An entry stored with a stale stat is not served for the new content.
+ - test_frozen_view_is_shared_and_read_only: `frozen=True` returns one read-only view.
+ - test_shared_namespace_built_once: `j_loads_ns(shared=True)` returns the same namespace until the file changes.
+ - test_shared_namespace_is_read_only: The shared namespace can't be changed, so the next load gets the file data.
+ - test_lru_eviction: The least recently used file is evicted above `maxsize`.
+ - test_read_errors_not_cached: An invalid file is not stored in the cache.
+"""
+
+import os
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+from src.utils.jjson import FrozenNamespace, JsonCache, j_loads, j_loads_ns, json_cache, json_cache_clear, json_cache_stats
+
+
+def _rewrite(path: Path, text: str) -> None:
+    """Rewrites the file and moves `mtime` forward, so the change is visible on any filesystem."""
+    stat = path.stat()
+    path.write_text(text, encoding='utf-8')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    """JSON file with a nested list, empty cache."""
+    json_cache_clear()
+    path = tmp_path / 'data.json'
+    path.write_text('{"a": {"b": [1, 2]}}', encoding='utf-8')
+    yield path
+    json_cache_clear()
+
+
+def test_cache_hit_returns_copy(json_file):
+    """A hit does not re-read the file and the caller can't change the cached data."""
+    first = j_loads(json_file, use_cache=True)
+    first['a']['b'].append(3)
+    second = j_loads(json_file, use_cache=True)
+    assert second == {'a': {'b': [1, 2]}}
+    assert json_cache_stats()['hits'] == 1
+    assert json_cache_stats()['misses'] == 1
+
+
+def test_cache_invalidated_on_change(json_file):
+    """A changed `mtime`/size invalidates the entry."""
+    j_loads(json_file, use_cache=True)
+    _rewrite(json_file, '{"a": {"b": [9]}}')
+    assert j_loads(json_file, use_cache=True) == {'a': {'b': [9]}}
+    assert json_cache_stats()['misses'] == 2
+
+
+def test_put_keeps_stat_taken_before_read(json_file):
+    """The file changed between `stat` and the read: the entry is stale and the new content is read again."""
+    stat_before_read = json_file.stat()
+    _rewrite(json_file, '{"a": {"b": [42]}}')
+    json_cache.put(json_file, {'a': {'b': [1, 2]}}, stat_before_read)  # <- content read before the change
+    assert j_loads(json_file, use_cache=True) == {'a': {'b': [42]}}
+
+
+def test_frozen_view_is_shared_and_read_only(json_file):
+    """`frozen=True` returns one read-only view."""
+    view = j_loads(json_file, use_cache=True, frozen=True)
+    assert isinstance(view, MappingProxyType)
+    assert view['a']['b'] == (1, 2)
+    assert j_loads(json_file, use_cache=True, frozen=True) is view
+    with pytest.raises(TypeError):
+        view['a'] = 1
+
+
+def test_shared_namespace_built_once(json_file):
+    """`j_loads_ns(shared=True)` returns the same namespace until the file changes."""
+    ns = j_loads_ns(json_file, shared=True)
+    assert ns.a.b == (1, 2)
+    assert j_loads_ns(json_file, shared=True) is ns
+
+    private = j_loads_ns(json_file, use_cache=True)
+    assert private is not ns
+    private.a.b = []
+    assert ns.a.b == (1, 2)
+
+    _rewrite(json_file, '{"a": {"b": [7]}}')
+    assert j_loads_ns(json_file, shared=True).a.b == (7,)
+
+
+def test_shared_namespace_is_read_only(json_file):
+    """The shared namespace can't be changed, so the next load gets the file data."""
+    ns = j_loads_ns(json_file, shared=True)
+    assert isinstance(ns, FrozenNamespace)
+    with pytest.raises(AttributeError):
+        ns.a.b = []
+    with pytest.raises(AttributeError):
+        ns.extra = 1
+    with pytest.raises(AttributeError):
+        del ns.a
+    assert vars(j_loads_ns(json_file, shared=True)) == {'a': FrozenNamespace(b=(1, 2))}
+
+
+def test_lru_eviction(tmp_path):
+    """The least recently used file is evicted above `maxsize`."""
+    cache = JsonCache(maxsize=2)
+    paths = []
+    for n in range(3):
+        path = tmp_path / f'{n}.json'
+        path.write_text(f'{{"n": {n}}}', encoding='utf-8')
+        paths.append(path)
+    cache.put(paths[0], {'n': 0})
+    cache.put(paths[1], {'n': 1})
+    assert cache.get(paths[0])[0]  # <- 0 becomes the most recently used
+    cache.put(paths[2], {'n': 2})
+    assert cache.get(paths[0])[0]
+    assert not cache.get(paths[1])[0]
+    assert cache.stats()['size'] == 2
+
+
+def test_read_errors_not_cached(tmp_path):
+    """An invalid file is not stored in the cache."""
+    json_cache_clear()
+    path = tmp_path / 'broken.json'
+    path.write_text('{"a": ', encoding='utf-8')
+    j_loads(path, use_cache=True)
+    assert json_cache_stats()['size'] == 0
@@ -0,0 +1,74 @@
+## \file /src/utils/_pytest/test_jsonl.py
+# -*- coding: utf-8 -*-
+
+#! .pyenv/bin/python3
+
+"""
+.. module:: src.utils._pytest
+	:platform: Windows, Unix
+	:synopsis: Tests for the JSON Lines helpers of `src.utils.jjson`.
+
+#Tests:
+ - test_writer_appends_without_rewriting: `JsonlWriter` only appends; buffered records are written on close.
+ - test_writer_repairs_torn_last_line: A torn last line is skipped on read and does not corrupt the next record.
+ - test_j_dumps_append_lines: `j_dumps` with `MODE_APPEND_LINES` appends one line per record.
+ - test_jl_compact_list: `jl_compact` produces the same JSON as `json.dump(records, indent=4)`.
+ - test_jl_compact_as_dict: `jl_compact(as_dict=True)` merges records, later keys win.
+"""
+
+import json
+from types import SimpleNamespace
+
+from src.utils.jjson import Config, JsonlWriter, j_dumps, jl_compact, jl_iter
+
+
+def test_writer_appends_without_rewriting(tmp_path):
+    """`JsonlWriter` only appends; buffered records are written on close."""
+    path = tmp_path / 'records.jsonl'
+    path.write_text('{"id": 0}\n', encoding='utf-8')
+    with JsonlWriter(path, flush_every=2) as writer:
+        assert writer.write({'id': 1})
+        assert path.read_text(encoding='utf-8').count('\n') == 1  # <- still in the buffer
+        writer.write(SimpleNamespace(id=2))
+        writer.write({'id': 3})
+    assert [record['id'] for record in jl_iter(path)] == [0, 1, 2, 3]
+
+
+def test_writer_repairs_torn_last_line(tmp_path):
+    """A torn last line is skipped on read and does not corrupt the next record."""
+    path = tmp_path / 'records.jsonl'
+    path.write_text('{"id": 1}\n{"id": 2, "na', encoding='utf-8')
+    with JsonlWriter(path, flush_every=1) as writer:
+        writer.write({'id': 3})
+    assert [record['id'] for record in jl_iter(path)] == [1, 3]
+
+
+def test_j_dumps_append_lines(tmp_path):
+    """`j_dumps` with `MODE_APPEND_LINES` appends one line per record."""
+    path = tmp_path / 'records.jsonl'
+    assert j_dumps({'id': 1}, path, mode=Config.MODE_APPEND_LINES)
+    assert j_dumps([{'id': 2}, {'id': 3}], path, mode=Config.MODE_APPEND_LINES)
+    assert [record['id'] for record in jl_iter(path)] == [1, 2, 3]
+
+
+def test_jl_compact_list(tmp_path):
+    """`jl_compact` produces the same JSON as `json.dump(records, indent=4)`."""
+    records = [{'id': 1, 'name': 'שלום'}, {'id': 2, 'tags': ['a', 'b']}]
+    path = tmp_path / 'records.jsonl'
+    with JsonlWriter(path) as writer:
+        for record in records:
+            writer.write(record)
+    assert jl_compact(path)
+    compacted = path.with_suffix('.json').read_text(encoding='utf-8')
+    assert compacted == json.dumps(records, ensure_ascii=False, indent=4)
+
+
+def test_jl_compact_as_dict(tmp_path):
+    """`jl_compact(as_dict=True)` merges records, later keys win."""
+    path = tmp_path / 'records.jsonl'
+    with JsonlWriter(path) as writer:
+        writer.write({'a': 1, 'b': 1})
+        writer.write({'b': 2})
+    dest = tmp_path / 'merged.json'
+    assert jl_compact(path, dest, as_dict=True)
+    assert json.loads(dest.read_text(encoding='utf-8')) == {'a': 1, 'b': 2}
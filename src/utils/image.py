@@ -32,13 +32,15 @@ class ImageError(Exception):
     pass
 
 
-async def save_image_from_url_async(image_url: str, filename: Union[str, Path]) -> Optional[str]:
+async def save_image_from_url_async(image_url: str, filename: Union[str, Path], session: Optional[aiohttp.ClientSession] = None) -> Optional[str]:
     """
     Downloads an image from a URL and saves it locally asynchronously.
 
     Args:
         image_url (str): The URL to download the image from.
         filename (Union[str, Path]): The name of the file to save the image to.
+        session (Optional[aiohttp.ClientSession]): Shared session to reuse pooled connections.
+            A temporary session is created if not provided.
 
     Returns:
         Optional[str]: The path to the saved file, or None if the operation failed.
@@ -47,13 +49,19 @@ async def save_image_from_url_async(image_url: str, filename: Union[str, Path])
         ImageError: If the image download or save operation fails.
     """
     try:
-        async with aiohttp.ClientSession() as session:
+        if session:
             async with session.get(image_url) as response:
-                response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+                response.raise_for_status()
                 image_data = await response.read()
+        else:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(image_url) as response:
+                    response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+                    image_data = await response.read()
     except Exception as ex:
         logger.error(f"Error downloading image from {image_url}", ex, exc_info=True)
         # raise ImageError(f"Failed to download image from {image_url}") from ex
+        return None
 
     return await save_image_async(image_data, filename)
 
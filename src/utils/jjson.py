@@ -10,7 +10,8 @@
 Основные функции:
 - `j_dumps(data, file_path, ensure_ascii, mode, exc_info)`: Сохраняет Python объекты (словари, списки, SimpleNamespace, строки JSON) 
                                                              в JSON файл или возвращает их как Python объект (`dict`, `list`) после обработки.
-                                                             Поддерживает различные режимы записи (перезапись, добавление в начало/конец).
+                                                             Поддерживает различные режимы записи (перезапись, добавление в начало/конец,
+                                                             добавление строк JSON Lines `Config.MODE_APPEND_LINES`).
   Пример: `j_dumps({'key': 'value'}, Path('output.json'))` возвращает `True` в случае успеха.
           `processed_obj = j_dumps({'key': 'value'})` возвращает обработанный словарь `{'key': 'value'}`.
 - `j_loads(jjson, ordered)`: Загружает JSON данные из файла, строки, словаря, списка или SimpleNamespace.
@@ -23,6 +24,15 @@
 - `sanitize_json_files(path)`: Проверяет и "санитизирует" JSON файлы в указанной директории или отдельный JSON файл.
                                Невалидные файлы переименовываются (добавляется суффикс `.sanitized`). Возвращает `bool`.
   Пример: `sanitize_json_files(Path('./data_dir/'))`
+- `json_cache_stats()` / `json_cache_clear()`: Статистика и очистка кэша разобранных JSON файлов (см. `JsonCache`).
+  Кэш включается параметром `use_cache=True` в `j_loads`/`j_loads_ns` или глобально через `Config.USE_CACHE`.
+  `j_loads_ns(path, shared=True)` возвращает общее, построенное один раз пространство имен только для чтения
+  (`FrozenNamespace`, списки - `tuple`).
+- `JsonlWriter(file_path)`: Буферизованная запись JSON Lines (одна запись - одна строка) только в конец файла,
+                           с пакетным `fsync`. Скорость добавления не зависит от размера файла.
+  Пример: `with JsonlWriter(Path('products.jsonl')) as writer: writer.write({'id': 1})`
+- `jl_iter(file_path)`: Ленивый итератор по записям JSONL файла. Поврежденные строки пропускаются.
+- `jl_compact(file_path, dest_path)`: Собирает JSONL файл в обычный JSON (`indent=4`), как его записал бы `j_dumps`.
 - `find_keys(obj, keys_to_find, found)`: Рекурсивно ищет значения по заданным ключам во вложенной структуре данных 
                                         (словарь или список). Возвращает словарь, где ключи - это искомые ключи,
                                         а значения - списки найденных значений.
@@ -37,7 +47,9 @@
 - `_string_to_dict(json_string)`: Удаляет Markdown обёртки (```json ... ```) из строки и парсит её как JSON. Возвращает `dict` или `list`, либо `{}` при ошибке.
 
 Класс конфигурации:
-- `Config`: Содержит константы для режимов записи файлов (`MODE_WRITE`, `MODE_APPEND_START`, `MODE_APPEND_END`).
+- `Config`: Содержит константы для режимов записи файлов (`MODE_WRITE`, `MODE_APPEND_START`, `MODE_APPEND_END`, `MODE_APPEND_LINES`)
+            и настройки кэша (`USE_CACHE`, `CACHE_MAXSIZE`).
+- `JsonCache`: Общий для процесса LRU-кэш разобранных JSON файлов с ключом (путь, mtime, размер).
 
  ```rst
  .. module:: src.utils.jjson
@@ -45,10 +57,14 @@
 """
 import json
 import codecs
+import os
 import re # Используется в _string_to_dict
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from types import MappingProxyType
 from tkinter.filedialog import LoadFileDialog
-from typing import Any, List as TypingList, Dict as TypingDict # TypingList/Dict for find_keys as per original.
+from typing import Any, Iterator, List as TypingList, Dict as TypingDict # TypingList/Dict for find_keys as per original.
 from collections.abc import Mapping, Sequence
 from types import SimpleNamespace
 from dataclasses import dataclass
@@ -69,10 +85,211 @@ class Config:
         MODE_WRITE (str): Режим перезаписи файла.
         MODE_APPEND_START (str): Режим добавления данных в начало файла (логическое добавление).
         MODE_APPEND_END (str): Режим добавления данных в конец файла (логическое добавление).
+        MODE_APPEND_LINES (str): Режим добавления записей в конец JSON Lines файла без чтения существующих данных.
+        USE_CACHE (bool): Использовать `JsonCache` в `j_loads`/`j_loads_ns` по умолчанию.
+        CACHE_MAXSIZE (int): Максимальное количество файлов в `JsonCache`.
     """
     MODE_WRITE:str = 'w'
     MODE_APPEND_START:str = 'a+'
     MODE_APPEND_END:str = '+a'
+    MODE_APPEND_LINES:str = 'al'
+    USE_CACHE:bool = False
+    CACHE_MAXSIZE:int = 256
+
+
+def _json_copy(value: Any) -> Any:
+    """
+    Функция создает структурную копию JSON-данных (`dict`, `list`, `SimpleNamespace`).
+
+    Быстрее `copy.deepcopy`: неизменяемые значения (строки, числа, `None`) не копируются.
+    Используется, чтобы вызывающий код не мог изменить данные в `JsonCache`.
+
+    Args:
+        value (Any): Данные для копирования.
+
+    Returns:
+        Any: Копия данных.
+    """
+    if isinstance(value, dict):
+        return {key: _json_copy(val) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_json_copy(item) for item in value]
+    if isinstance(value, SimpleNamespace):
+        return SimpleNamespace(**{key: _json_copy(val) for key, val in vars(value).items()})
+    return value
+
+
+def _json_freeze(value: Any) -> Any:
+    """
+    Функция возвращает неизменяемое представление JSON-данных:
+    словари - `MappingProxyType`, списки - `tuple`.
+
+    Args:
+        value (Any): Данные.
+
+    Returns:
+        Any: Неизменяемое представление данных.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _json_freeze(val) for key, val in value.items()})
+    if isinstance(value, list):
+        return tuple(_json_freeze(item) for item in value)
+    return value
+
+
+class FrozenNamespace(SimpleNamespace):
+    """
+    `SimpleNamespace` только для чтения. Возвращается `j_loads_ns(..., shared=True)`.
+
+    Присваивание и удаление атрибутов вызывают `AttributeError`, списки хранятся как `tuple`.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{type(self).__name__} is read-only: cannot set {name!r}')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is read-only: cannot delete {name!r}')
+
+
+def _ns_freeze(value: Any) -> Any:
+    """
+    Функция строит неизменяемое пространство имен из JSON-данных:
+    словари - `FrozenNamespace`, списки - `tuple`.
+
+    Args:
+        value (Any): Данные.
+
+    Returns:
+        Any: Неизменяемое пространство имен.
+    """
+    if isinstance(value, dict):
+        return FrozenNamespace(**{key: _ns_freeze(val) for key, val in value.items()})
+    if isinstance(value, list):
+        return tuple(_ns_freeze(item) for item in value)
+    return value
+
+
+class JsonCache:
+    """
+    Общий для процесса LRU-кэш разобранных JSON файлов.
+
+    Запись действительна, пока у файла не изменились `mtime` и размер.
+    Вызывающий код получает копию данных (`_json_copy`), неизменяемое представление (`_json_freeze`)
+    или общее пространство имен только для чтения `j_loads_ns(..., shared=True)` (`FrozenNamespace`).
+
+    Attributes:
+        maxsize (int): Максимальное количество файлов в кэше.
+        hits (int): Количество попаданий.
+        misses (int): Количество промахов (включая устаревшие записи).
+    """
+
+    def __init__(self, maxsize: int = Config.CACHE_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict = OrderedDict()  # <- путь: [mtime_ns, size, data, frozen, namespace]
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, stat: os.stat_result | None = None) -> tuple[bool, Any]:
+        """
+        Возвращает (найдено, данные) для файла, если запись актуальна.
+
+        Args:
+            path (Path): Путь к JSON файлу.
+            stat (os.stat_result | None): Результат `path.stat()`, если уже получен.
+
+        Returns:
+            tuple[bool, Any]: `(True, data)` при попадании, `(False, None)` при промахе.
+        """
+        stat = stat or path.stat()
+        key: str = str(path.resolve())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry
+            self.misses += 1
+            return False, None
+
+    def put(self, path: Path, data: Any, stat: os.stat_result | None = None) -> list:
+        """
+        Сохраняет разобранные данные файла. Самые давно использованные записи вытесняются.
+
+        Args:
+            path (Path): Путь к JSON файлу.
+            data (Any): Разобранные данные.
+            stat (os.stat_result | None): Результат `path.stat()`, полученный **до** чтения файла.
+                Если файл изменился во время чтения, запись просто устареет при следующем `get`,
+                а не закрепит старое содержимое за новым `mtime`.
+
+        Returns:
+            list: Запись кэша `[mtime_ns, size, data, frozen, namespace]`.
+        """
+        stat = stat or path.stat()
+        key: str = str(path.resolve())
+        entry: list = [stat.st_mtime_ns, stat.st_size, data, None, None]
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Очищает кэш и статистику."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Статистика кэша: попадания, промахи, доля попаданий, размер."""
+        total: int = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
+
+
+json_cache: JsonCache = JsonCache()
+"""json_cache (JsonCache): Общий для процесса кэш `j_loads`/`j_loads_ns`."""
+
+
+def json_cache_stats() -> dict:
+    """
+    Возвращает статистику `json_cache`.
+
+    Example:
+        >>> json_cache_stats()['maxsize']
+        256
+    """
+    return json_cache.stats()
+
+
+def json_cache_clear() -> None:
+    """Очищает `json_cache`."""
+    json_cache.clear()
+
+
+def _cached_file(path_obj: Path) -> tuple[list | None, Any]:
+    """
+    Возвращает запись `json_cache` для файла, читая и кэшируя его при промахе.
+
+    Returns:
+        tuple[list | None, Any]: `(entry, None)` или `(None, data)`, если файл не прочитан (ошибки не кэшируются).
+    """
+    stat = path_obj.stat() # <- один `stat` до чтения: и для проверки, и для новой записи
+    hit, entry = json_cache.get(path_obj, stat)
+    if hit:
+        return entry, None
+    data: dict[Any, Any] | list[Any] = _read_json_file(path_obj)
+    if not data:
+        return None, data
+    return json_cache.put(path_obj, data, stat), None
 
 def _convert_to_dict(value: Any) -> Any:
     """
@@ -223,8 +440,10 @@ def j_dumps(
             Если `True`, они будут экранированы. По умолчанию `False`.
         mode (str, optional): Режим записи файла, если `file_path` указан.
             Поддерживаются `Config.MODE_WRITE` (перезапись), `Config.MODE_APPEND_START` (добавление "в начало"),
-            `Config.MODE_APPEND_END` (добавление "в конец"). По умолчанию `Config.MODE_WRITE`.
-            Режимы добавления логически объединяют данные перед записью.
+            `Config.MODE_APPEND_END` (добавление "в конец"), `Config.MODE_APPEND_LINES` (строки JSON Lines).
+            По умолчанию `Config.MODE_WRITE`.
+            Режимы `MODE_APPEND_START`/`MODE_APPEND_END` читают и переписывают весь файл - для больших файлов,
+            в которые данные добавляются по одной записи, используйте `MODE_APPEND_LINES` или `JsonlWriter`.
         exc_info (bool, optional): Логировать ли полную информацию об исключении. По умолчанию `True`.
 
     Returns:
@@ -278,10 +497,22 @@ def j_dumps(
     if file_path:
         path = Path(file_path)
 
-    if mode not in {Config.MODE_WRITE, Config.MODE_APPEND_START, Config.MODE_APPEND_END}:
+    if mode not in {Config.MODE_WRITE, Config.MODE_APPEND_START, Config.MODE_APPEND_END, Config.MODE_APPEND_LINES}:
         logger.warning(f"Unsupported mode '{mode}'. Defaulting to '{Config.MODE_WRITE}'.")
         mode = Config.MODE_WRITE
 
+    if path and mode == Config.MODE_APPEND_LINES:
+        # Список записывается построчно, словарь - одной строкой. Существующие данные не читаются.
+        records: list[Any] = processed_data if isinstance(processed_data, list) else [processed_data]
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with _open_jsonl(path) as f:
+                f.write(''.join(json.dumps(record, ensure_ascii=ensure_ascii) + '\n' for record in records))
+            return True
+        except Exception as ex:
+            logger.error(f'Failed to append lines to {path}:', ex, exc_info=exc_info)
+            return False
+
     if path:
         final_data_to_write: dict[Any, Any] | list[Any] = processed_data
         
@@ -311,6 +542,209 @@ def j_dumps(
         return processed_data
 
 
+def _open_jsonl(path: Path):
+    """
+    Функция открывает JSONL файл на добавление.
+
+    Если последняя строка файла не завершена (запись была прервана), добавляется перевод строки,
+    чтобы новая запись не склеилась с поврежденной.
+
+    Args:
+        path (Path): Путь к JSONL файлу.
+
+    Returns:
+        TextIO: Файл, открытый в режиме `'a'`.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    f = path.open('a', encoding='utf-8')
+    if f.tell():
+        with path.open('rb') as tail:
+            tail.seek(-1, os.SEEK_END)
+            if tail.read(1) != b'\n':
+                f.write('\n')
+    return f
+
+
+class JsonlWriter:
+    """
+    Буферизованная запись JSON Lines только в конец файла.
+
+    Записи накапливаются в памяти и дописываются в файл пачками по `flush_every`.
+    `os.fsync` выполняется после каждых `fsync_every` записей и при закрытии, а не на каждую запись.
+    Существующее содержимое файла не читается, поэтому стоимость добавления не растет с размером файла.
+    Методы потокобезопасны (запись из воркеров `asyncio.to_thread`).
+
+    Attributes:
+        path (Path): Путь к JSONL файлу.
+        flush_every (int): Количество записей в буфере, после которого буфер дописывается в файл.
+        fsync_every (int): Количество записей, после которого данные принудительно сбрасываются на диск.
+        ensure_ascii (bool): Экранировать ли не-ASCII символы.
+
+    Example:
+        >>> # with JsonlWriter(Path('products.jsonl'), flush_every=50) as writer:
+        >>> #     for product in products:
+        >>> #         writer.write(product)
+    """
+
+    def __init__(self, file_path: Path | str, flush_every: int = 100, fsync_every: int = 1000, ensure_ascii: bool = False):
+        self.path = Path(file_path)
+        self.flush_every = flush_every
+        self.fsync_every = fsync_every
+        self.ensure_ascii = ensure_ascii
+        self._buffer: list[str] = []
+        self._unsynced: int = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'JsonlWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(self, record: dict[Any, Any] | SimpleNamespace | list[Any]) -> bool:
+        """
+        Добавляет запись в буфер.
+
+        Args:
+            record (dict | SimpleNamespace | list): Запись. `SimpleNamespace` конвертируется в `dict`.
+
+        Returns:
+            bool: `True`, если запись принята, `False` при ошибке сериализации или записи.
+        """
+        try:
+            line: str = json.dumps(_convert_to_dict(record), ensure_ascii=self.ensure_ascii) + '\n'
+        except (TypeError, ValueError) as ex:
+            logger.error(f'Запись не сериализуется в JSON: {type(record)}', ex, False)
+            return False
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.flush_every:
+                return self._flush()
+        return True
+
+    def flush(self, fsync: bool = False) -> bool:
+        """
+        Дописывает буфер в файл.
+
+        Args:
+            fsync (bool, optional): Принудительно сбросить данные на диск. По умолчанию `False`.
+
+        Returns:
+            bool: `True` при успешной записи.
+        """
+        with self._lock:
+            return self._flush(fsync)
+
+    def _flush(self, fsync: bool = False) -> bool:
+        """Дописывает буфер в файл. Вызывается под `self._lock`."""
+        try:
+            if self._buffer:
+                if self._file is None:
+                    self._file = _open_jsonl(self.path)
+                self._file.write(''.join(self._buffer))
+                self._file.flush()
+                self._unsynced += len(self._buffer)
+                self._buffer.clear()
+            if self._file and self._unsynced and (fsync or self._unsynced >= self.fsync_every):
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+            return True
+        except Exception as ex:
+            logger.error(f'Failed to append lines to {self.path}:', ex, False)
+            return False
+
+    def close(self) -> None:
+        """Дописывает буфер, сбрасывает данные на диск и закрывает файл."""
+        with self._lock:
+            self._flush(fsync=True)
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+def jl_iter(file_path: Path | str) -> Iterator[Any]:
+    """
+    Ленивый итератор по записям JSON Lines файла.
+
+    Файл читается построчно, в памяти находится одна запись. Пустые и поврежденные строки
+    (например, недописанная последняя строка после аварийного завершения) пропускаются.
+
+    Args:
+        file_path (Path | str): Путь к JSONL файлу.
+
+    Yields:
+        Any: Разобранная запись.
+
+    Example:
+        >>> # for product in jl_iter(Path('products.jsonl')):
+        >>> #     print(product['id'])
+    """
+    path = Path(file_path)
+    if not path.is_file():
+        logger.error(f'File not found: {path}', None, False)
+        return
+    with path.open('r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as ex:
+                logger.warning(f'Поврежденная строка {line_number} в {path} пропущена: {ex}')
+
+
+def jl_compact(file_path: Path | str, dest_path: Path | str | None = None, as_dict: bool = False, ensure_ascii: bool = False) -> bool:
+    """
+    Собирает JSON Lines файл в обычный JSON файл с `indent=4`.
+
+    По умолчанию результат - список записей, идентичный `json.dump(records, indent=4)`.
+    Список пишется потоково, без загрузки всех записей в память.
+    С `as_dict=True` записи-словари объединяются в один словарь (как `MODE_APPEND_END`: поздние ключи побеждают).
+    Файл записывается во временный файл и атомарно заменяется.
+
+    Args:
+        file_path (Path | str): Путь к JSONL файлу.
+        dest_path (Path | str | None, optional): Путь к JSON файлу. По умолчанию - `file_path` с суффиксом `.json`.
+        as_dict (bool, optional): Объединить записи в словарь. По умолчанию `False`.
+        ensure_ascii (bool, optional): Экранировать ли не-ASCII символы. По умолчанию `False`.
+
+    Returns:
+        bool: `True` при успешной записи.
+
+    Example:
+        >>> # jl_compact(Path('products.jsonl'))  # -> products.json
+    """
+    path = Path(file_path)
+    dest = Path(dest_path) if dest_path else path.with_suffix('.json')
+    tmp = dest.with_name(dest.name + '.tmp')
+    try:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open('w', encoding='utf-8') as f:
+            if as_dict:
+                merged: dict[Any, Any] = {}
+                for record in jl_iter(path):
+                    if isinstance(record, dict):
+                        merged.update(record)
+                    else:
+                        logger.warning(f'Запись типа {type(record)} не объединяется в словарь и пропущена')
+                json.dump(merged, f, ensure_ascii=ensure_ascii, indent=4)
+            else:
+                first: bool = True
+                for record in jl_iter(path):
+                    item: str = json.dumps(record, ensure_ascii=ensure_ascii, indent=4).replace('\n', '\n    ')
+                    f.write(('[\n    ' if first else ',\n    ') + item)
+                    first = False
+                f.write('[]' if first else '\n]')
+        os.replace(tmp, dest)
+        return True
+    except Exception as ex:
+        logger.error(f'Failed to compact {path} into {dest}:', ex, False)
+        tmp.unlink(missing_ok=True)
+        return False
+
+
 def _decode_strings(data: Any) -> Any:
     """
     Функция рекурсивно декодирует строки в структуре данных из формата 'unicode_escape'.
@@ -401,8 +835,41 @@ def _string_to_dict(json_string: str, return_objects:bool = False) -> dict[Any,
     return result
 
 
+def _read_json_file(path_obj: Path) -> dict[Any, Any] | list[Any]:
+    """
+    Функция читает и парсит JSON файл. При ошибке парсинга пытается "отремонтировать" содержимое.
+
+    Args:
+        path_obj (Path): Путь к JSON файлу.
+
+    Returns:
+        dict[Any, Any] | list[Any]: Данные файла или `{}` при ошибке.
+    """
+    # json.loads корректно обрабатывает \uXXXX из файла. _decode_strings здесь не нужен.
+    try:
+        return json.loads(path_obj.read_text(encoding='utf-8'))
+    except Exception as ex:
+        logger.error(f'Ошибка чтения словаря')
+        try:
+            with path_obj.open('r', encoding='utf-8') as f:
+                file_content: str = f.read()
+                if not file_content:
+                    logger.error(f'В файле {path_obj} Нет данных!')
+                    return {}
+
+            repaired_json: dict| None = _string_to_dict(file_content, return_objects=True)
+            ...
+            return repaired_json 
+        except Exception as ex:
+            logger.error(f'Error reading file {path_obj}: {ex}', ex, False)
+            ...
+            return {}
+
+
 def j_loads(
-    jjson: dict[Any, Any] | SimpleNamespace | str | Path | list[Any], ordered: bool = True # ordered not used
+    jjson: dict[Any, Any] | SimpleNamespace | str | Path | list[Any], ordered: bool = True, # ordered not used
+    use_cache: bool | None = None,
+    frozen: bool = False,
 ) -> dict[Any, Any] | list[Any]:
     """
     Загружает JSON-совместимые данные из различных источников.
@@ -418,6 +885,10 @@ def j_loads(
     Args:
         jjson (dict | SimpleNamespace | str | Path | list): Источник данных.
         ordered (bool, optional): Параметр для будущего использования. В текущей версии не влияет. По умолчанию `True`.
+        use_cache (bool | None, optional): Брать разобранный файл из `json_cache`, если файл не изменился.
+            По умолчанию `Config.USE_CACHE`. Вызывающий код получает копию данных из кэша.
+        frozen (bool, optional): Вместе с кэшем: вернуть общее неизменяемое представление
+            (`MappingProxyType`/`tuple`) без копирования. По умолчанию `False`.
 
     Returns:
         dict[Any, Any] | list[Any]: Обработанные данные (словарь или список).
@@ -446,28 +917,19 @@ def j_loads(
             path_obj: Path = jjson_internal
             if path_obj.is_dir():
                 files: TypingList[Path] = list(path_obj.glob('*.json'))
-                return [j_loads(file, ordered=ordered) for file in files] # j_loads вернет {} для невалидных файлов
+                return [j_loads(file, ordered=ordered, use_cache=use_cache, frozen=frozen) for file in files] # j_loads вернет {} для невалидных файлов
             elif path_obj.is_file():
-                # json.loads корректно обрабатывает \uXXXX из файла. _decode_strings здесь не нужен.
-                try:
-                    return json.loads(path_obj.read_text(encoding='utf-8'))
-                except Exception as ex:
-                    logger.error(f'Ошибка чтения словаря')
-                    try:
-                        with path_obj.open('r', encoding='utf-8') as f:
-                            file_content: str = f.read()
-                            if not file_content:
-                                logger.error(f'В файле {path_obj} Нет данных!')
-                                return {}
-
-                        repaired_json: dict| None = _string_to_dict(file_content, return_objects=True)
-                        ...
-                        return repaired_json 
-                    except Exception as ex:
-                        logger.error(f'Error reading file {path_obj}: {ex}', ex, False)
-                        ...
-                        return {}
-                    ...
+                if not (Config.USE_CACHE if use_cache is None else use_cache):
+                    return _read_json_file(path_obj)
+
+                entry, data = _cached_file(path_obj)
+                if entry is None:
+                    return data
+                if frozen:
+                    if entry[3] is None:
+                        entry[3] = _json_freeze(entry[2])
+                    return entry[3]
+                return _json_copy(entry[2])
             else:
                 logger.error(f'Path does not exist or is not a file/directory: {path_obj}', None, False)
                 return {}
@@ -500,7 +962,9 @@ def j_loads(
 
 def j_loads_ns(
     jjson: Path | SimpleNamespace | dict[Any, Any] | str | list[Any], # Добавлен list[Any] для полноты
-    ordered: bool = True # ordered not used
+    ordered: bool = True, # ordered not used
+    use_cache: bool | None = None,
+    shared: bool = False,
 ) -> SimpleNamespace | TypingList[SimpleNamespace | Any] | dict[Any, Any]: # dict if j_loads returns empty {}
     """
     Загружает JSON-совместимые данные и конвертирует результат в `SimpleNamespace`.
@@ -512,12 +976,18 @@ def j_loads_ns(
     Args:
         jjson (Path | SimpleNamespace | dict | str | list): Источник данных, как в `j_loads`.
         ordered (bool, optional): Параметр для `j_loads`. В текущей версии не используется. По умолчанию `True`.
+        use_cache (bool | None, optional): Параметр для `j_loads`. `dict2ns` строит пространства имен из копии
+            данных кэша, поэтому изменение результата не затрагивает кэш.
+        shared (bool, optional): Для файла: вернуть пространство имен, построенное один раз и хранимое в `json_cache`
+            (включает кэш независимо от `use_cache`). Результат общий для всех вызовов, поэтому он только для чтения:
+            `FrozenNamespace`, списки - `tuple`. Подходит для конфигураций и локаторов. По умолчанию `False`.
 
     Returns:
         SimpleNamespace | list[SimpleNamespace | Any] | dict:
             - `SimpleNamespace`: если загруженные данные являются словарем.
             - `list[SimpleNamespace | Any]`: если загруженные данные являются списком (элементы-словари конвертируются).
             - `dict`: пустой словарь `{}`, если `j_loads` вернул пустой результат или произошла ошибка.
+            - `FrozenNamespace` или `tuple`: при `shared=True`.
     
     Example:
         >>> # Предположим, 'user.json' содержит {"name": "Alice", "age": 30}
@@ -531,8 +1001,24 @@ def j_loads_ns(
         >>> j_loads_ns("invalid json")
         {}
     """
-    data: dict[Any, Any] | list[Any] = j_loads(jjson, ordered=ordered)
-    
+    if shared and isinstance(jjson, Path) and jjson.is_file():
+        try:
+            entry, data = _cached_file(jjson)
+        except Exception as ex:
+            logger.error(f'Error loading data for input ({type(jjson)}): {jjson}...', ex, False)
+            return {}
+        if entry is None:
+            return _data_to_ns(data)
+        with json_cache._lock:
+            if entry[4] is None:
+                entry[4] = _ns_freeze(entry[2])
+            return entry[4]
+
+    return _data_to_ns(j_loads(jjson, ordered=ordered, use_cache=use_cache))
+
+
+def _data_to_ns(data: dict[Any, Any] | list[Any]) -> SimpleNamespace | TypingList[SimpleNamespace | Any] | dict[Any, Any]:
+    """Конвертирует результат `j_loads` в `SimpleNamespace` (см. `j_loads_ns`)."""
     if not data and isinstance(data, dict): # j_loads вернул {}, что означает ошибку или пустой JSON
         return {} 
     
@@ -41,13 +41,16 @@ from src.logger.logger import logger
 
 async def save_video_from_url(
     url: str,
-    save_path: str
+    save_path: str,
+    session: Optional[aiohttp.ClientSession] = None
 ) -> Optional[Path]:
     """Download a video from a URL and save it locally asynchronously.
 
     Args:
         url (str): The URL from which to download the video.
         save_path (str): The path to save the downloaded video.
+        session (Optional[aiohttp.ClientSession]): Shared session to reuse pooled connections.
+            A temporary session is created if not provided.
 
     Returns:
         Optional[Path]: The path to the saved file, or `None` if the operation failed.  Returns None on errors and if file is 0 bytes.
@@ -58,8 +61,8 @@ async def save_video_from_url(
     save_path = Path(save_path)
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
+        async def _download(_session: aiohttp.ClientSession) -> None:
+            async with _session.get(url) as response:
                 response.raise_for_status()  # Check for HTTP errors
 
                 # Create parent directories if they don't exist
@@ -72,6 +75,12 @@ async def save_video_from_url(
                             break
                         await file.write(chunk)
 
+        if session:
+            await _download(session)
+        else:
+            async with aiohttp.ClientSession() as session:
+                await _download(session)
+
 
         # Crucial checks after saving
         if not save_path.exists():
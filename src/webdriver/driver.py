@@ -16,16 +16,21 @@
 ```
 """
 
+import asyncio
 import copy
 import pickle
 import time
 import re
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional, Union, Any
 import urllib.parse # Добавлено для лучшей обработки file:// URI
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import (
     InvalidArgumentException,
+    TimeoutException,
     ElementClickInterceptedException,
     ElementNotInteractableException,
     ElementNotVisibleException,
@@ -39,6 +44,35 @@ from src.logger.logger import logger
 # Исключения ExecuteLocatorException, WebDriverException не используются в этом файле напрямую
 # Оставлены, если они используются в других частях проекта, импортирующих этот модуль
 from src.logger.exceptions import ExecuteLocatorException, WebDriverException 
+from src.webdriver.locator import CompiledLocator, compile_locator
+
+
+# Скрипт ожидания `document.readyState` одним вызовом `execute_async_script`: промис завершается по событию `readystatechange`
+READY_STATE_SCRIPT: str = """
+const done = arguments[arguments.length - 1];
+const states = arguments[0];
+if (states.includes(document.readyState)) { done(document.readyState); return; }
+document.addEventListener('readystatechange', function onChange() {
+    if (states.includes(document.readyState)) {
+        document.removeEventListener('readystatechange', onChange);
+        done(document.readyState);
+    }
+});
+"""
+
+# Эвристика "сеть простаивает": страница загружена и новые ресурсы не появлялись `idle_ms` миллисекунд
+NETWORK_IDLE_SCRIPT: str = """
+const done = arguments[arguments.length - 1];
+const idleMs = arguments[0];
+let count = performance.getEntriesByType('resource').length;
+let last = performance.now();
+(function check() {
+    const n = performance.getEntriesByType('resource').length;
+    if (n !== count) { count = n; last = performance.now(); }
+    if (document.readyState === 'complete' && performance.now() - last >= idleMs) { done(true); return; }
+    setTimeout(check, 100);
+})();
+"""
 
 
 
@@ -336,16 +370,7 @@ class Driver:
 
             # Обновление URL и сохранение куки только если загрузка прошла успешно
             if loaded:
-                # Получение фактического URL после возможного редиректа
-                actual_url_after_get: str = self.driver.current_url
-                logger.info(f"Фактический URL после перехода: {actual_url_after_get}")
-                self.current_url = actual_url_after_get # Обновление current_url
-
-                # Обновление previous_url, если URL изменился
-                if self.current_url != _previous_url_local:
-                    self.previous_url = _previous_url_local
-                    logger.debug(f"Предыдущий URL сохранен: {_previous_url_local}")
-
+                self._update_current_url(_previous_url_local)
                 # self._save_cookies_localy() # Раскомментировать для сохранения куки
                 return True # Успешный переход и загрузка
 
@@ -363,6 +388,104 @@ class Driver:
             return False
         return False # Добавлено для случаев, когда loaded остается False, но исключения не было
 
+    def _update_current_url(self, previous_url: str) -> None:
+        """
+        Обновляет `self.current_url` фактическим URL драйвера (после возможного редиректа)
+        и `self.previous_url`, если URL изменился.
+
+        Args:
+            previous_url (str): URL до перехода.
+        """
+        actual_url_after_get: str = self.driver.current_url
+        logger.info(f"Фактический URL после перехода: {actual_url_after_get}")
+        self.current_url = actual_url_after_get
+
+        if self.current_url != previous_url:
+            self.previous_url = previous_url
+            logger.debug(f"Предыдущий URL сохранен: {previous_url}")
+
+    async def get_url_async(
+        self,
+        url: str,
+        wait_for: str = 'ready_state',
+        timeout: Optional[float] = None,
+        locator: Optional[dict | SimpleNamespace | CompiledLocator] = None,
+        idle_ms: int = 500,
+        ready_states: tuple = ('complete', 'interactive'),
+    ) -> bool:
+        """
+        Асинхронно переходит по URL и ожидает готовности страницы, не блокируя event loop.
+
+        Вызовы WebDriver выполняются в потоке (`asyncio.to_thread`). Ожидание выполняется одним вызовом
+        без опроса с фиксированными паузами:
+            - `'ready_state'`: промис `execute_async_script`, завершающийся по `readystatechange`;
+            - `'locator'`: появление элемента `locator` (`WebDriverWait` + `presence_of_element_located`);
+            - `'network_idle'`: страница `complete` и нет новых запросов ресурсов `idle_ms` миллисекунд;
+            - `'none'`: без ожидания (только `driver.get`).
+
+        Параметры ожидания задаются для каждого поставщика в разделе `page_load` его JSON конфигурации
+        (см. `Graber.open_page`).
+
+        Args:
+            url (str): URL для навигации.
+            wait_for (str): Стратегия ожидания. По умолчанию `'ready_state'`.
+            timeout (Optional[float]): Таймаут ожидания в секундах. По умолчанию - `locator.timeout`, если задан, иначе 10.
+                На время ожидания меняется таймаут скриптов драйвера; прежнее значение восстанавливается.
+            locator (Optional[dict | SimpleNamespace | CompiledLocator]): Локатор для стратегии `'locator'`.
+            idle_ms (int): Длительность "тишины" сети для стратегии `'network_idle'`.
+            ready_states (tuple): Допустимые значения `document.readyState` для `'ready_state'`.
+
+        Returns:
+            bool: `True`, если переход выполнен и страница готова, иначе `False`.
+
+        Example:
+            >>> await driver.get_url_async('https://example.com', wait_for='network_idle', timeout=15)
+            True
+        """
+        _previous_url_local: str = copy.copy(self.current_url)
+        compiled: Optional[CompiledLocator] = compile_locator(locator) if locator else None
+        timeout = timeout or (compiled.timeout if compiled else None) or 10
+        previous_script_timeout: Optional[float] = None
+        try:
+            logger.info(f"Переход на URL: {url}")
+            await asyncio.to_thread(self.driver.get, url)
+
+            if wait_for == 'locator' and compiled:
+                await asyncio.to_thread(
+                    WebDriverWait(self.driver, timeout).until,
+                    EC.presence_of_element_located((compiled.by, compiled.selector)),
+                )
+            elif wait_for in ('ready_state', 'network_idle'):
+                previous_script_timeout = await asyncio.to_thread(lambda: self.driver.timeouts.script)
+                await asyncio.to_thread(self.driver.set_script_timeout, timeout)
+                if wait_for == 'ready_state':
+                    state: Optional[str] = await asyncio.to_thread(self.driver.execute_async_script, READY_STATE_SCRIPT, list(ready_states))
+                    logger.debug(f"readyState={state} для {url}")
+                else:
+                    await asyncio.to_thread(self.driver.execute_async_script, NETWORK_IDLE_SCRIPT, idle_ms)
+
+            self._update_current_url(_previous_url_local)
+            return True
+
+        except TimeoutException:
+            logger.error(f'Страница не готова за {timeout} сек. (стратегия "{wait_for}"): {url}')
+            return False
+        except InvalidArgumentException as ex_invalid_arg:
+            logger.error(f"Некорректный URL '{url}': {ex_invalid_arg}")
+            return False
+        except SeleniumWebDriverException as ex_webdriver:
+            logger.error(f'Ошибка WebDriver при переходе на {url}: {ex_webdriver}')
+            return False
+        except Exception as ex_other:
+            logger.error(f'Неожиданная ошибка при переходе по URL: {url}', None, exc_info=ex_other)
+            return False
+        finally:
+            if previous_script_timeout is not None:
+                try:
+                    await asyncio.to_thread(self.driver.set_script_timeout, previous_script_timeout)
+                except Exception as ex:
+                    logger.debug('Не удалось восстановить таймаут скриптов драйвера', ex, False)
+
     def window_open(self, url: Optional[str] = None) -> None:
         """
         Открывает новую вкладку в текущем окне браузера и переключается на нее.
@@ -33,6 +33,7 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 import header
+from src.webdriver.locator import CompiledLocator, compile_locator, locator_as_dict
 from src.logger.logger import logger
 from src.utils.printer import pprint as print
 
@@ -63,7 +64,8 @@ class ExecuteLocator:
         Executes actions on a web element based on the provided locator.
 
         Args:
-            locator: Locator data (dict or SimpleNamespace).
+            locator: Locator data (dict, SimpleNamespace or `CompiledLocator`).
+                Dicts and namespaces are compiled on the fly; locators from `Graber` are compiled once on load.
             timeout: Timeout for locating the element (seconds).
             timeout_for_event: Wait condition ('presence_of_element_located', 'visibility_of_all_elements_located').
             message: Optional message for actions like send_keys or type.
@@ -72,15 +74,14 @@ class ExecuteLocator:
         Returns:
             The result of the operation, which can be a string, list, dict, WebElement, bool, or None.
         """
-        if isinstance(locator, dict):
-            locator = SimpleNamespace(**locator)
+        locator = compile_locator(locator)
 
-        if not getattr(locator, "attribute", None) and not getattr(locator, "selector", None):
+        if not locator or (not locator.attribute and not locator.selector):
             logger.debug("Empty locator provided.", None, False)
             return None
 
         async def _parse_locator(
-            locator: SimpleNamespace,
+            locator: CompiledLocator,
             message: Optional[str] = None,
             timeout: Optional[float] = 0,
             timeout_for_event: Optional[str] = "presence_of_element_located",
@@ -89,21 +90,19 @@ class ExecuteLocator:
             """Parses and executes locator instructions."""
 
             if locator.event and locator.attribute and locator.mandatory is None:
-                logger.debug(f"Locator with event and attribute but missing mandatory flag. Skipping. {print(locator.__dict__, text_color='yellow')} ",None,False)
+                logger.debug(f"Locator with event and attribute but missing mandatory flag. Skipping. {print(locator_as_dict(locator), text_color='yellow')} ",None,False)
                 return None
 
             if isinstance(locator.by, str):
                 try:
-                    locator.by = locator.by.lower()
+                    # `by` и `attribute` уже разобраны при компиляции локатора
                     if locator.attribute:
-                        locator.attribute = self._evaluate_locator(locator.attribute)
-
                         if locator.by == "value":
                             return locator.attribute
 
                         if locator.by == 'url':
                             if not locator.attribute:
-                                logger.error(f"Attribute is missing for 'URL' locator: {print(locator.__dict__, text_color='yellow')}")
+                                logger.error(f"Attribute is missing for 'URL' locator: {print(locator_as_dict(locator), text_color='yellow')}")
                                 return False
 
                             url = self.driver.current_url
@@ -112,7 +111,7 @@ class ExecuteLocator:
                             return query_params.get(locator.attribute, None)[0]
 
                 except Exception as ex:
-                    logger.error(f"Error getting attribute by 'VALUE': {print(locator.__dict__, text_color='yellow')}, error:",ex)
+                    logger.error(f"Error getting attribute by 'VALUE': {print(locator_as_dict(locator), text_color='yellow')}, error:",ex)
                     return None
 
                 if locator.event:
@@ -123,26 +122,12 @@ class ExecuteLocator:
 
                 return await self.get_webelement_by_locator(locator, timeout, timeout_for_event)
 
-            elif isinstance(locator.selector, list) and isinstance(locator.by, list):
+            elif locator.children:
                 if locator.sorted == "pairs":
                     elements_pairs = []
 
-                    for n in len(locator.by):
-                    
-                        l = SimpleNamespace(
-                            **{
-                                "attribute": locator.attribute[n],
-                                "by": locator.by[n],
-                                "selector": locator.selector[n],
-                                "if_list": locator.if_list if isinstance(locator.if_list, str) else locator.if_list[n],
-                                "mandatory": locator.mandatory if isinstance(locator.mandatory, str) else locator.mandatory[n],
-                                "event": locator.event if isinstance(locator.event, str) else locator.event[n],
-                                "timeout": locator.timeout if isinstance(locator.timeout, str) else locator.timeout[n],
-                                "timeout_for_event": locator.timeout_for_event if isinstance(locator.timeout_for_event, str) else locator.timeout_for_event[n],
-                                "locator_description": locator.locator_description,
-                            }
-                        )
-                        elements_pairs.append(await _parse_locator(l, message, timeout, timeout_for_event, message, typing_speed))
+                    for l in locator.children:
+                        elements_pairs.append(await _parse_locator(l, message, timeout, timeout_for_event, typing_speed))
 
                     zipped_pairs = list(zip_longest(*elements_pairs, fillvalue=None))
                     return zipped_pairs
@@ -199,27 +184,14 @@ class ExecuteLocator:
         Returns:
             The attribute value(s) as a WebElement, list of WebElements, or None if not found.
         """
-        locator = (
-            locator if isinstance(locator, SimpleNamespace) else SimpleNamespace(**locator) if isinstance(locator, dict) else None
-        )
+        locator = compile_locator(locator)
 
         web_element: WebElement = await self.get_webelement_by_locator(locator, timeout, timeout_for_event)
         if not web_element:
             if locator.mandatory: 
-                logger.debug(f"Element not found: {print(locator, text_color='yellow')}")
+                logger.debug(f"Element not found: {print(locator_as_dict(locator), text_color='yellow')}")
             return None
 
-        def _parse_dict_string(attr_string: str) -> dict | None:
-            """Parses a string like '{attr1:attr2}' into a dictionary."""
-            try:
-                return {
-                    k.strip(): v.strip()
-                    for k, v in (pair.split(":") for pair in attr_string.strip("{}").split(","))
-                }
-            except ValueError as ex:
-                logger.debug(f"Invalid attribute string format: {attr_string!r}", ex)
-                return None
-
         def _get_attributes_from_dict(web_element: WebElement, attr_dict: dict) -> dict:
             """Retrieves attribute values from a WebElement based on a dictionary."""
             result = {}
@@ -234,8 +206,8 @@ class ExecuteLocator:
             return result
 
         if web_element:
-            if isinstance(locator.attribute, str) and locator.attribute.startswith("{"):
-                attr_dict = _parse_dict_string(locator.attribute)
+            if locator.attribute_map is not None:
+                attr_dict = locator.attribute_map
                 if isinstance(web_element, list):
                     return [_get_attributes_from_dict(el, attr_dict) for el in web_element]
                 return _get_attributes_from_dict(web_element, attr_dict)
@@ -273,10 +245,10 @@ class ExecuteLocator:
         Returns:
            WebElement, list of WebElements, or None if not found.
         """
-        timeout = timeout if timeout > 0 else getattr(locator, 'timeout', 0)
+        timeout = timeout if timeout and timeout > 0 else getattr(locator, 'timeout', 0) or 0
 
         async def _parse_elements_list(
-            web_elements: WebElement | List[WebElement], locator: SimpleNamespace
+            web_elements: WebElement | List[WebElement], locator: CompiledLocator
         ) ->  Optional[WebElement | List[WebElement]]:
             """Filters a list of web elements based on the if_list attribute."""
             if not isinstance(web_elements, list):
@@ -294,7 +266,7 @@ class ExecuteLocator:
                 return [web_elements[i] for i in range(0, len(web_elements), 2)]
             elif if_list == "odd":
                 return [web_elements[i] for i in range(1, len(web_elements), 2)]
-            elif isinstance(if_list, list):
+            elif isinstance(if_list, (list, tuple)):
                 return [web_elements[i] for i in if_list]
             elif isinstance(if_list, int):
                 return web_elements[if_list - 1]
@@ -302,7 +274,7 @@ class ExecuteLocator:
             return web_elements
 
         driver = self.driver
-        locator = SimpleNamespace(**locator) if isinstance(locator, dict) else locator
+        locator = compile_locator(locator)
 
         if not locator:
             logger.error("Invalid locator provided.")
@@ -328,11 +300,11 @@ class ExecuteLocator:
             return await _parse_elements_list(web_elements, locator) if web_elements else None
 
         except TimeoutException as ex:
-            logger.error(f"Timeout for locator: {print(locator.__dict__, text_color='yellow')}", ex, False)
+            logger.error(f"Timeout for locator: {print(locator_as_dict(locator), text_color='yellow')}", ex, False)
             return None
 
         except Exception as ex:
-            logger.error(f"Error locating element: {print(locator.__dict__, text_color='yellow')}", ex, False)
+            logger.error(f"Error locating element: {print(locator_as_dict(locator), text_color='yellow')}", ex, False)
             return None
 
     async def get_webelement_as_screenshot(
@@ -358,9 +330,7 @@ class ExecuteLocator:
         Returns:
            BinaryIO stream of the screenshot or None if failed.
         """
-        locator = (
-            locator if isinstance(locator, SimpleNamespace) else SimpleNamespace(**locator) if isinstance(locator, dict) else None
-        )
+        locator = compile_locator(locator)
 
         if not webelement:
             webelement = await self.get_webelement_by_locator(
@@ -397,10 +367,8 @@ class ExecuteLocator:
         Returns:
             The result of the event execution (str, list of str, bytes, list of bytes, or bool).
         """
-        locator = (
-            locator if isinstance(locator, SimpleNamespace) else SimpleNamespace(**locator) if isinstance(locator, dict) else None
-        )
-        events = str(locator.event).split(";")
+        locator = compile_locator(locator)
+        events = locator.events
         result: list = []
 
         webelement = await self.get_webelement_by_locator(locator, timeout, timeout_for_event)
@@ -512,11 +480,7 @@ class ExecuteLocator:
         Returns:
             True if the message was sent successfully, False otherwise.
         """
-        locator = (
-            locator
-            if isinstance(locator, SimpleNamespace)
-            else SimpleNamespace(**locator) if isinstance(locator, dict) else None
-        )
+        locator = compile_locator(locator)
 
         def type_message(
             el: WebElement,
@@ -0,0 +1,189 @@
+## \file /src/webdriver/locator.py
+# -*- coding: utf-8 -*-
+#! .pyenv/bin/python3
+
+"""
+Компиляция локаторов.
+=====================
+Локаторы из `product.json`/`category.json` компилируются один раз при загрузке (`Graber.__init__`)
+в неизменяемые объекты `CompiledLocator`: стратегия `by` приводится к константе `By`, клавиши `%KEY%` - к `Keys`,
+строка атрибутов `{a:b}` - к словарю, список событий `event` разбивается заранее.
+`ExecuteLocator` работает с `CompiledLocator` напрямую, без повторного разбора и без изменения общего локатора.
+
+Локаторы https://github.com/hypo69/hypotez/blob/master/docs/ru/src/webdriver/locator.md
+```rst
+.. module:: src.webdriver.locator
+```
+"""
+
+import re
+from dataclasses import dataclass, fields
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Mapping, Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+import header
+from src.logger.logger import logger
+
+
+# Стратегии, которые обрабатывает сам `ExecuteLocator`, а не Selenium
+SPECIAL_BY: tuple = ('value', 'url', 'event')
+
+_KEY_PATTERN = re.compile(r"^%(\w+)%")
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledLocator:
+    """
+    Immutable, pre-parsed locator.
+
+    Attributes:
+        by: Selenium `By` constant (`'xpath'`, `'css selector'`, ...) or one of `SPECIAL_BY`.
+        selector: Selector string.
+        attribute: Attribute with `%KEY%` already resolved to `Keys` values.
+        attribute_map: Parsed `{a:b}` attribute string, or `None`.
+        events: `event` split by `;`.
+        children: Compiled sub-locators when `by`/`selector` are lists.
+    """
+
+    by: Optional[str] = None
+    selector: Any = None
+    attribute: Any = None
+    attribute_map: Optional[Mapping[str, str]] = None
+    if_list: Any = None
+    mandatory: Any = None
+    event: Optional[str] = None
+    events: tuple = ()
+    timeout: Any = 0
+    timeout_for_event: Optional[str] = 'presence_of_element_located'
+    use_mouse: Any = None
+    sorted: Any = None
+    locator_description: Optional[str] = None
+    children: tuple = ()
+
+    def as_dict(self) -> dict:
+        """Returns the locator fields as a dictionary (for logging)."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+def _resolve_by(by: Any) -> Any:
+    """Maps `'XPATH'`, `'CSS_SELECTOR'`, ... to the matching `By` constant."""
+    if not isinstance(by, str):
+        return by
+    lowered: str = by.lower()
+    if lowered in SPECIAL_BY:
+        return lowered
+    return getattr(By, by.upper().replace(' ', '_'), lowered)
+
+
+def _resolve_attribute(attribute: Any) -> Any:
+    """Resolves `%KEY%` attributes to `Keys` values, same as `ExecuteLocator._evaluate_locator`."""
+    def _evaluate(attr: str) -> Optional[str]:
+        match = _KEY_PATTERN.match(attr)
+        return getattr(Keys, match.group(1), None) if match else attr
+
+    if not attribute:
+        return attribute
+    if isinstance(attribute, (list, tuple)):
+        return tuple(_evaluate(str(attr)) for attr in attribute)
+    return _evaluate(str(attribute))
+
+
+def _parse_attribute_map(attribute: Any) -> Optional[Mapping[str, str]]:
+    """Parses a string like `'{attr1:attr2}'` into a read-only mapping."""
+    if not isinstance(attribute, str) or not attribute.startswith('{'):
+        return None
+    try:
+        return MappingProxyType({
+            k.strip(): v.strip()
+            for k, v in (pair.split(':') for pair in attribute.strip('{}').split(','))
+        })
+    except ValueError as ex:
+        logger.debug(f"Invalid attribute string format: {attribute!r}", ex)
+        return None
+
+
+def _freeze(value: Any) -> Any:
+    """Lists -> tuples, so the compiled locator can't be changed through its fields."""
+    return tuple(value) if isinstance(value, list) else value
+
+
+def compile_locator(locator: dict | SimpleNamespace | CompiledLocator) -> Optional[CompiledLocator]:
+    """
+    Compiles a locator dict/namespace into a `CompiledLocator`.
+
+    Args:
+        locator: Locator data. An already compiled `CompiledLocator` is returned as is.
+
+    Returns:
+        Compiled `CompiledLocator`, or `None` for an empty input.
+    """
+    if isinstance(locator, CompiledLocator) or not locator:
+        return locator or None
+    data: dict = dict(locator) if isinstance(locator, dict) else dict(vars(locator))
+
+    by = data.get('by')
+    selector = data.get('selector')
+    children: tuple = ()
+    if isinstance(by, (list, tuple)) and isinstance(selector, (list, tuple)):
+        def _nth(key: str, n: int) -> Any:
+            value = data.get(key)
+            return value[n] if isinstance(value, (list, tuple)) else value
+
+        children = tuple(
+            compile_locator({key: _nth(key, n) for key in data if key != 'locator_description'})
+            for n in range(len(by))
+        )
+
+    event = data.get('event')
+    attribute = data.get('attribute')
+    return CompiledLocator(
+        by=_freeze(_resolve_by(by)) if not children else tuple(c.by for c in children),
+        selector=_freeze(selector),
+        attribute=_resolve_attribute(attribute) if not children else _freeze(attribute),
+        attribute_map=_parse_attribute_map(attribute),
+        if_list=_freeze(data.get('if_list')),
+        mandatory=data.get('mandatory'),
+        event=event,
+        events=tuple(str(event).split(';')) if event else (),
+        timeout=data.get('timeout') or 0,
+        timeout_for_event=data.get('timeout_for_event') or 'presence_of_element_located',
+        use_mouse=data.get('use_mouse'),
+        sorted=data.get('sorted'),
+        locator_description=data.get('locator_description'),
+        children=children,
+    )
+
+
+def compile_locators(locators: SimpleNamespace | dict) -> SimpleNamespace:
+    """
+    Compiles every locator of a locators file (`product.json`, `category.json`).
+
+    Entries that are not locators (no `by`/`selector` keys) are kept unchanged.
+
+    Args:
+        locators: Loaded locators file, e.g. the result of `j_loads_ns`.
+
+    Returns:
+        SimpleNamespace: Same keys, values compiled to `CompiledLocator`.
+
+    Example:
+        >>> product_locator = compile_locators(j_loads_ns(path / 'locators' / 'product.json'))
+        >>> product_locator.name.by
+        'xpath'
+    """
+    items: dict = locators if isinstance(locators, dict) else vars(locators)
+    compiled: dict = {}
+    for name, value in items.items():
+        keys = value.keys() if isinstance(value, dict) else vars(value).keys() if isinstance(value, SimpleNamespace) else ()
+        compiled[name] = compile_locator(value) if ('by' in keys or 'selector' in keys) else value
+    return SimpleNamespace(**compiled)
+
+
+def locator_as_dict(locator: Any) -> Any:
+    """Returns locator fields for logging, for both `CompiledLocator` and `SimpleNamespace`."""
+    if isinstance(locator, CompiledLocator):
+        return locator.as_dict()
+    return getattr(locator, '__dict__', locator)
@@ -18,6 +18,7 @@ from types import SimpleNamespace
 from src import gs
 from src.logger.logger import logger
 from src.utils.jjson import j_loads_ns
+from src.webdriver.locator import CompiledLocator
 
 
 class PlaywrightExecutor:
@@ -87,6 +88,8 @@ class PlaywrightExecutor:
         """
         if isinstance(locator, dict):
             locator = SimpleNamespace(**locator)
+        elif isinstance(locator, CompiledLocator):
+            locator = SimpleNamespace(**locator.as_dict())  # <- локатор изменяется ниже, скомпилированный неизменяем
 
         if not getattr(locator, "attribute", None) and not getattr(locator, "selector", None):
             logger.debug("Empty locator provided.")
@@ -104,7 +107,7 @@ class PlaywrightExecutor:
                 try:
                     if locator.attribute:
                         locator.attribute = await self.evaluate_locator(locator.attribute)
-                        if locator.by == "VALUE":
+                        if locator.by.upper() == "VALUE":
                             return locator.attribute
                 except Exception as ex:
                     logger.debug(f"Error getting attribute by 'VALUE': {locator}, error: {ex}")
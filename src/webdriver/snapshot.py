@@ -0,0 +1,222 @@
+## \file /src/webdriver/snapshot.py
+# -*- coding: utf-8 -*-
+#! .pyenv/bin/python3
+
+"""
+Снимок DOM страницы для извлечения полей без обращений к вебдрайверу.
+======================================================================
+`PageSnapshot` один раз получает `page_source` у драйвера, строит дерево `lxml`
+и разрешает на нем локаторы, которым не нужны события (`event`) и живые `WebElement`.
+Локаторы `VALUE`/`URL` разрешаются без страницы. Локаторы с событиями, скриншотами и без `attribute`
+передаются в живой драйвер.
+
+Объект подменяет драйвер в `Graber.grab_page_async(snapshot=True)`: интерфейс `execute_locator` тот же,
+остальные атрибуты делегируются вложенному драйверу.
+Снимок может быть построен и из HTML, полученного по HTTP (`StaticFetcher`). Тогда живой драйвер
+переходит на страницу (`url`) только при первом локаторе, которому он действительно нужен.
+
+```rst
+.. module:: src.webdriver.snapshot
+```
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, List, Optional
+from urllib.parse import urljoin, urlparse, parse_qs
+
+from lxml import etree, html as lxml_html
+
+import header
+from src.logger.logger import logger
+
+
+class PageSnapshot:
+    """
+    Разрешает локаторы по снимку `page_source` текущей страницы.
+
+    Attributes:
+        driver (Driver): Живой драйвер. Используется для снимка и для локаторов, которые нельзя разрешить по снимку.
+        tree (Optional[lxml.html.HtmlElement]): Дерево DOM снимка.
+        base_url (str): URL страницы на момент снимка. Относительные `href`/`src` приводятся к абсолютным, как это делает Selenium.
+        hits (int): Количество локаторов, разрешенных по снимку.
+        misses (int): Количество локаторов, переданных в живой драйвер.
+    """
+
+    # Атрибуты, которые Selenium возвращает как абсолютные URL
+    URL_ATTRIBUTES: tuple = ('href', 'src')
+    # Перевод простых стратегий поиска Selenium в XPath
+    BY_TO_XPATH: dict = {
+        'id': '//*[@id="{0}"]',
+        'name': '//*[@name="{0}"]',
+        'class name': '//*[contains(concat(" ", normalize-space(@class), " "), " {0} ")]',
+        'tag name': '//{0}',
+    }
+
+    def __init__(self, driver: Any, page_source: Optional[str] = None, url: Optional[str] = None,
+                 navigate: Optional[Callable[[str], Awaitable[bool]]] = None):
+        """
+        Args:
+            driver (Driver): Живой драйвер.
+            page_source (Optional[str]): HTML страницы. Если не передан - берется `driver.page_source`.
+            url (Optional[str]): URL страницы, если HTML получен не из драйвера. Драйвер перейдет
+                на него перед первым локатором, который нельзя разрешить по снимку.
+            navigate (Optional[Callable[[str], Awaitable[bool]]]): Корутина перехода драйвера на `url`
+                (например, `Graber.open_page` с настройками ожидания поставщика). По умолчанию - `driver.get_url` в потоке.
+        """
+        self.driver = driver
+        self.url: Optional[str] = url
+        self.navigate = navigate
+        self.base_url: str = url or getattr(driver, 'current_url', '') or ''
+        self.hits: int = 0
+        self.misses: int = 0
+        self.tree = None
+        try:
+            source: str = page_source if page_source is not None else driver.page_source
+            self.tree = lxml_html.fromstring(source) if source else None
+        except Exception as ex:
+            logger.error('Не удалось построить снимок DOM страницы', ex, False)
+
+    def __getattr__(self, item: str) -> Any:
+        """Делегирует остальные атрибуты живому драйверу.
+
+        Пока драйвер не перешел на `url` (HTML получен не из драйвера), `current_url` - это `base_url`,
+        а не страница, открытая в драйвере.
+        """
+        if 'driver' not in self.__dict__:
+            raise AttributeError(item)
+        if item == 'current_url' and self.__dict__.get('url'):
+            return self.__dict__['base_url']
+        return getattr(self.__dict__['driver'], item)
+
+    def _resolve_without_page(self, locator: SimpleNamespace) -> tuple:
+        """Разрешает локаторы `VALUE` и `URL`. Возвращает (разрешен, значение)."""
+        by = getattr(locator, 'by', None)
+        attribute = getattr(locator, 'attribute', None)
+        if not isinstance(by, str) or not attribute or getattr(locator, 'event', None):
+            return False, None
+        if by.lower() == 'value':
+            return True, str(attribute)
+        if by.lower() == 'url':
+            return True, (parse_qs(urlparse(self.base_url).query).get(str(attribute)) or [None])[0]
+        return False, None
+
+    def _is_snapshot_locator(self, locator: SimpleNamespace) -> bool:
+        """Проверяет, можно ли разрешить локатор по снимку."""
+        if self.tree is None or getattr(locator, 'event', None):
+            return False
+        by = getattr(locator, 'by', None)
+        attribute = getattr(locator, 'attribute', None)
+        if not isinstance(by, str) or not isinstance(attribute, str) or not attribute:
+            return False
+        # клавиши `Keys` нужны только живому драйверу: `%KEY%` в сыром локаторе,
+        # символы `Keys` (U+E000-U+E0FF) в скомпилированном `compile_locators`
+        if attribute.startswith('%') or any('\ue000' <= ch <= '\ue0ff' for ch in attribute):
+            return False
+        return by.lower() in ('xpath', 'css selector', *self.BY_TO_XPATH.keys())
+
+    def _find(self, locator: SimpleNamespace) -> List[etree._Element]:
+        """Находит элементы снимка по локатору."""
+        by: str = locator.by.lower()
+        selector: str = locator.selector
+        if by == 'xpath':
+            found = self.tree.xpath(selector)
+        elif by == 'css selector':
+            found = self.tree.cssselect(selector)
+        else:
+            found = self.tree.xpath(self.BY_TO_XPATH[by].format(selector))
+        # XPath может вернуть строки/числа (например, `//a/@href`) - возвращаются как есть
+        return found if isinstance(found, list) else [found]
+
+    def _filter(self, elements: List[Any], if_list: Any) -> Any:
+        """Фильтрует список элементов по `if_list` так же, как `ExecuteLocator`."""
+        if if_list == 'first':
+            return elements[0]
+        elif if_list == 'last':
+            return elements[-1]
+        elif if_list == 'even':
+            return [elements[i] for i in range(0, len(elements), 2)]
+        elif if_list == 'odd':
+            return [elements[i] for i in range(1, len(elements), 2)]
+        elif isinstance(if_list, (list, tuple)):  # <- скомпилированные локаторы хранят `if_list` кортежем
+            return [elements[i] for i in if_list]
+        elif isinstance(if_list, int):
+            return elements[if_list - 1]
+        return elements
+
+    def _get_attribute(self, element: Any, attribute: str) -> Optional[str]:
+        """Аналог `WebElement.get_attribute` для элемента `lxml`."""
+        if not isinstance(element, etree._Element):
+            return str(element)
+        if attribute in ('innerText', 'textContent', 'text'):
+            return element.text_content().strip()
+        if attribute == 'innerHTML':
+            return (element.text or '') + ''.join(etree.tostring(child, encoding='unicode', method='html') for child in element)
+        if attribute == 'outerHTML':
+            return etree.tostring(element, encoding='unicode', method='html')
+        value: Optional[str] = element.get(attribute)
+        if value is not None and attribute in self.URL_ATTRIBUTES:
+            return urljoin(self.base_url, value)
+        return value
+
+    def _resolve(self, locator: SimpleNamespace) -> Any:
+        """Разрешает локатор по снимку. Возвращает `None`, если элементы не найдены."""
+        elements: List[Any] = self._find(locator)
+        if not elements:
+            return None
+        elements = self._filter(elements, getattr(locator, 'if_list', None))
+        attribute: str = locator.attribute
+
+        attr_dict = getattr(locator, 'attribute_map', None)  # <- уже разобран в `CompiledLocator`
+        if attr_dict is None and attribute.startswith('{'):
+            pairs = [pair.split(':') for pair in attribute.strip('{}').split(',')]
+            attr_dict = {k.strip(): v.strip() for k, v in pairs}
+        if attr_dict:
+            from_dict = lambda el: {self._get_attribute(el, k): self._get_attribute(el, v) for k, v in attr_dict.items()}
+            return [from_dict(el) for el in elements] if isinstance(elements, list) else from_dict(elements)
+
+        if isinstance(elements, list):
+            ret: list = [f'{self._get_attribute(el, attribute)}' for el in elements]
+            return ret if len(ret) > 1 else ret[0] if ret else None
+        return self._get_attribute(elements, attribute)
+
+    async def execute_locator(self, locator: dict | SimpleNamespace, *args, **kwargs) -> Any:
+        """
+        Выполняет локатор по снимку или, если это невозможно, через живой драйвер.
+
+        Если по снимку ничего не найдено, а локатор обязательный (`mandatory`),
+        запрос повторяется в живом драйвере: элемент мог появиться после снимка.
+
+        Args:
+            locator (dict | SimpleNamespace): Локатор.
+            *args, **kwargs: Передаются в `driver.execute_locator` без изменений.
+
+        Returns:
+            Any: Результат в формате `ExecuteLocator.execute_locator`.
+        """
+        if isinstance(locator, dict):
+            locator = SimpleNamespace(**locator)
+
+        resolved, value = self._resolve_without_page(locator) if locator else (False, None)
+        if resolved:
+            self.hits += 1
+            return value
+
+        if locator and self._is_snapshot_locator(locator):
+            try:
+                result = self._resolve(locator)
+                if result is not None or not getattr(locator, 'mandatory', False):
+                    self.hits += 1
+                    return result
+            except Exception as ex:
+                logger.debug(f'Локатор не разрешен по снимку, запрос к драйверу: {locator.selector}', ex, False)
+
+        self.misses += 1
+        if self.url:
+            # HTML получен по HTTP: живой драйвер переходит на страницу один раз, при первой необходимости
+            url, self.url = self.url, None
+            opened: bool = await self.navigate(url) if self.navigate else await asyncio.to_thread(self.driver.get_url, url)
+            if not opened:
+                logger.error(f'Не удалось открыть страницу в драйвере: {url}', None, False)
+                return None
+        return await self.driver.execute_locator(locator, *args, **kwargs)
@@ -0,0 +1,120 @@
+## \file /src/webdriver/static_fetcher.py
+# -*- coding: utf-8 -*-
+#! .pyenv/bin/python3
+
+"""
+Загрузка статических страниц по HTTP без Selenium.
+==================================================
+Для поставщиков, чьи страницы товара рендерятся на сервере, HTML запрашивается напрямую
+через общий пул соединений `aiohttp` (keep-alive, gzip/brotli, лимит соединений на хост).
+Локаторы затем разрешаются по `lxml`-дереву (`PageSnapshot`), как в `src.webdriver.bs`,
+а живой вебдрайвер используется только для локаторов с событиями.
+
+Пример:
+
+.. code-block:: python
+
+    async with StaticFetcher(limit_per_host=8) as fetcher:
+        html = await fetcher.fetch('https://www.ksp.co.il/web/item/12345')
+
+```rst
+.. module:: src.webdriver.static_fetcher
+```
+"""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+from fake_useragent import UserAgent
+
+import header
+from src.logger.logger import logger
+
+
+class StaticFetcher:
+    """
+    Пул HTTP-соединений для загрузки HTML страниц.
+
+    Одна `aiohttp.ClientSession` на экземпляр: соединения переиспользуются между запросами,
+    количество одновременных соединений ограничено в целом (`limit`) и на хост (`limit_per_host`).
+    Сессия создается лениво в работающем event loop.
+
+    Attributes:
+        limit (int): Максимум одновременных соединений.
+        limit_per_host (int): Максимум одновременных соединений к одному хосту.
+        timeout (float): Общий таймаут запроса в секундах.
+        retries (int): Количество повторов при сетевой ошибке или ответе 5xx/429.
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 8, timeout: float = 20, retries: int = 2, user_agent: Optional[str] = None):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.headers: dict = {
+            'User-Agent': user_agent or UserAgent().random,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate, br',  # <- `br` распаковывается aiohttp при установленном пакете Brotli
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> 'StaticFetcher':
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Общая сессия. Создается при первом обращении."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                auto_decompress=True,
+            )
+        return self._session
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """
+        Загружает HTML страницы.
+
+        Args:
+            url (str): URL страницы.
+
+        Returns:
+            Optional[str]: HTML страницы или `None`, если страницу получить не удалось.
+        """
+        for attempt in range(self.retries + 1):
+            delay: float = 2 ** attempt
+            try:
+                async with self.session.get(url, allow_redirects=True) as response:
+                    if response.status == 429 or response.status >= 500:
+                        retry_after = response.headers.get('Retry-After', '')
+                        delay = float(retry_after) if retry_after.isdigit() else delay
+                        logger.debug(f"HTTP {response.status} для {url}. Попытка {attempt + 1}/{self.retries + 1}")
+                    elif response.status != 200:
+                        logger.warning(f"HTTP {response.status} для {url}")
+                        return None
+                    else:
+                        return await response.text(errors='ignore')
+            except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                logger.debug(f"Ошибка загрузки {url}. Попытка {attempt + 1}/{self.retries + 1}", ex, False)
+            if attempt < self.retries:  # <- после последней попытки ждать нечего
+                await asyncio.sleep(delay)
+        logger.error(f"Не удалось загрузить страницу: {url}", None, False)
+        return None
+
+    async def close(self) -> None:
+        """Закрывает сессию и все соединения пула."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,111 @@
+## \file /toolbox/import_time.py
+# -*- coding: utf-8 -*-
+
+#! .pyenv/bin/python3
+
+"""
+module: toolbox.import_time
+    :platform: Windows, Unix
+    :synopsis: Замер времени импорта модуля (`python -X importtime`) и проверка бюджета.
+
+Импорт выполняется в отдельном процессе, поэтому замер не зависит от уже загруженных модулей.
+Скрипт завершается с кодом 1, если суммарное время импорта превышает `--budget`
+или если при импорте были загружены тяжелые модули из `--forbid`
+(по умолчанию `pykeepass`, `selenium`, `google.generativeai` - они должны загружаться лениво).
+
+Пример:
+
+.. code-block:: bash
+
+    python toolbox/import_time.py src --budget 500 --top 15
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_FORBIDDEN: tuple = ('pykeepass', 'selenium', 'google.generativeai')
+
+
+def measure_import(module: str) -> list[SimpleNamespace]:
+    """
+    Импортирует модуль в отдельном процессе с `-X importtime`.
+
+    Args:
+        module (str): Имя модуля, например `src`.
+
+    Returns:
+        list[SimpleNamespace]: Записи `name`, `self_us`, `cumulative_us` в порядке вывода интерпретатора.
+    """
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f'Не удалось импортировать {module}:\n{process.stderr[-2000:]}')
+
+    records: list[SimpleNamespace] = []
+    for line in process.stderr.splitlines():
+        # `import time:       123 |        456 |   package.module`
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # <- строка заголовка
+        records.append(SimpleNamespace(
+            name=fields[2].strip(),
+            self_us=int(fields[0]),
+            cumulative_us=int(fields[1]),
+        ))
+    return records
+
+
+def check_import_time(module: str, budget_ms: float | None = None, forbidden: tuple = DEFAULT_FORBIDDEN, top: int = 10) -> bool:
+    """
+    Печатает самые медленные импорты и проверяет бюджет.
+
+    Args:
+        module (str): Имя модуля.
+        budget_ms (float | None): Допустимое суммарное время импорта в миллисекундах.
+        forbidden (tuple): Модули, которые не должны загружаться при импорте `module`.
+        top (int): Количество самых медленных импортов в отчете.
+
+    Returns:
+        bool: `True`, если бюджет соблюден и запрещенные модули не загружены.
+    """
+    records = measure_import(module)
+    target = next((r for r in reversed(records) if r.name == module), None)
+    total_ms: float = (target.cumulative_us if target else sum(r.self_us for r in records)) / 1000
+
+    print(f'{module}: {total_ms:.1f} ms, модулей загружено: {len(records)}')
+    for record in sorted(records, key=lambda r: r.self_us, reverse=True)[:top]:
+        print(f'{record.self_us / 1000:10.1f} ms {record.cumulative_us / 1000:10.1f} ms   {record.name}')
+
+    ok: bool = True
+    if budget_ms is not None and total_ms > budget_ms:
+        print(f'Превышен бюджет: {total_ms:.1f} ms > {budget_ms:.1f} ms')
+        ok = False
+
+    loaded = {r.name for r in records}
+    leaked = [name for name in forbidden if name in loaded]
+    if leaked:
+        print(f'При импорте {module} загружены тяжелые модули: {", ".join(leaked)}')
+        ok = False
+    return ok
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Замер времени импорта модуля и проверка бюджета.')
+    parser.add_argument('module', nargs='?', default='src', help="Модуль для импорта. По умолчанию 'src'.")
+    parser.add_argument('--budget', type=float, default=None, help='Допустимое время импорта в миллисекундах.')
+    parser.add_argument('--top', type=int, default=10, help='Количество самых медленных импортов в отчете.')
+    parser.add_argument('--forbid', nargs='*', default=list(DEFAULT_FORBIDDEN), help='Модули, которые не должны загружаться при импорте.')
+    args = parser.parse_args()
+
+    sys.exit(0 if check_import_time(args.module, args.budget, tuple(args.forbid), args.top) else 1)